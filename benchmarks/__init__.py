@@ -0,0 +1,19 @@
+"""Benchmarks for planetarypy, run with airspeed velocity: `asv run` or `asv continuous master HEAD`.
+
+All data is synthetic and served from localhost, so the suite runs without network access.
+The package is pointed to a throw-away config and storage root before it gets imported.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+BENCH_ROOT = Path(tempfile.gettempdir()) / "planetarypy_bench"
+BENCH_ROOT.mkdir(exist_ok=True)
+CONFIG_PATH = BENCH_ROOT / "planetarypy_config.toml"
+if not CONFIG_PATH.exists():
+    CONFIG_PATH.write_text(
+        f'storage_root = "{BENCH_ROOT / "data"}"\n\n'
+        "[missions.bench.ctx.indexes.edr]\n"
+        'url = "http://localhost/bench/CUMINDEX.LBL"\n'
+    )
+os.environ["PLANETARYPY_CONFIG"] = str(CONFIG_PATH)
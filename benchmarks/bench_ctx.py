@@ -0,0 +1,40 @@
+"""Metadata lookups for CTX products."""
+import warnings
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")  # ISIS is not needed for metadata
+    from planetarypy import ctx
+
+from planetarypy.pds.utils import index_to_df, IndexLabel
+
+from .common import product_ids, synthetic_index
+
+
+class CTXMeta:
+    timeout = 300
+
+    def setup_cache(self):
+        lblpath, tabpath = synthetic_index(100_000)
+        edrindex = index_to_df(tabpath, IndexLabel(lblpath)).convert_dtypes()
+        edrindex.to_parquet(tabpath.with_suffix(".parq"))
+
+    def setup(self):
+        import pandas as pd
+
+        _, tabpath = synthetic_index(100_000)
+        edrindex = pd.read_parquet(tabpath.with_suffix(".parq"))
+        edrindex["short_pid"] = edrindex.PRODUCT_ID.str[:15]
+        ctx.cache["edrindex"] = edrindex
+        self.pids = product_ids(range(0, 100_000, 10_000))
+
+    def time_meta(self):
+        for pid in self.pids:
+            ctx.CTXEDR(pid).meta
+
+    def time_short_pid(self):
+        for pid in self.pids:
+            ctx.CTXEDR(pid[:15])
+
+    def time_collection_by_time(self):
+        ctx.cache.pop("edr_time_index", None)
+        ctx.CTXCollection.by_time("2006-06-01", "2006-07-01")
@@ -0,0 +1,29 @@
+"""Coordinate transformations of `geotools.Point`."""
+import numpy as np
+
+# Mars equirectangular, 100 m pixels
+geotrans = (-1_000_000.0, 100.0, 0.0, 500_000.0, 0.0, -100.0)
+
+
+def get_geotools():
+    try:
+        from planetarypy import geotools
+    except Exception:  # the module needs GDAL at import time
+        raise NotImplementedError("GDAL not available.")
+    return geotools
+
+
+class PointTransforms:
+    def setup(self):
+        self.geotools = get_geotools()
+        rng = np.random.default_rng(0)
+        self.pixels = rng.uniform(0, 20_000, (1000, 2))
+        self.coords = rng.uniform(-1e6, 1e6, (1000, 2))
+
+    def time_pixel_to_meter(self):
+        for sample, line in self.pixels:
+            self.geotools.Point(sample, line, geotrans=geotrans)
+
+    def time_meter_to_pixel(self):
+        for x, y in self.coords:
+            self.geotools.Point(x=x, y=y, geotrans=geotrans)
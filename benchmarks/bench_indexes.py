@@ -0,0 +1,107 @@
+"""Reading and converting PDS index tables."""
+import shutil
+
+from planetarypy.pds.apps import get_index
+from planetarypy.pds.indexes import Index
+from planetarypy.pds.synthetic import layouts
+from planetarypy.pds.utils import IndexLabel, TabReader, index_to_df, tab_to_parquet
+
+from .common import product_ids, synthetic_index
+
+
+class IndexParsing:
+    "Parsing a TAB file into a DataFrame or parquet."
+
+    params = [100_000, 1_000_000]
+    param_names = ["rows"]
+    timeout = 600
+
+    def setup(self, rows):
+        self.lblpath, self.tabpath = synthetic_index(rows)
+        self.label = IndexLabel(self.lblpath)
+        self.parqpath = self.tabpath.with_suffix(".parq")
+
+    def teardown(self, rows):
+        self.parqpath.unlink(missing_ok=True)
+
+    def time_index_to_df(self, rows):
+        index_to_df(self.tabpath, self.label)
+
+    def time_tab_to_parquet(self, rows):
+        tab_to_parquet(self.tabpath, self.label, self.parqpath)
+
+    def time_tab_to_parquet_serial(self, rows):
+        tab_to_parquet(self.tabpath, self.label, self.parqpath, max_workers=1)
+
+    def peakmem_index_to_df(self, rows):
+        index_to_df(self.tabpath, self.label)
+
+
+class LayoutParsing:
+    "Parsing the index layouts of the different instruments."
+
+    params = list(layouts)
+    param_names = ["index"]
+    timeout = 300
+
+    def setup(self, key):
+        self.lblpath, self.tabpath = synthetic_index(100_000, key)
+        self.label = IndexLabel(self.lblpath)
+
+    def time_index_to_df(self, key):
+        index_to_df(self.tabpath, self.label)
+
+
+class LabelParsing:
+    def setup(self):
+        self.lblpath, _ = synthetic_index(100_000)
+        IndexLabel(self.lblpath)  # make sure the schema sidecar exists
+
+    def time_label_cached(self):
+        IndexLabel(self.lblpath)
+
+    def time_label_compile(self):
+        IndexLabel(self.lblpath).compile_schema()
+
+
+class IndexLoading:
+    "Loading an already converted index, as done by every `get_index` call."
+
+    timeout = 600
+
+    def setup_cache(self):
+        index = Index("bench.ctx.edr", check_update=False)
+        lblpath, tabpath = synthetic_index(1_000_000)
+        shutil.copy(lblpath, index.local_label_path)
+        shutil.copy(tabpath, index.local_table_path)
+        index.convert_to_parquet()
+        index.arrow_cache()
+        index.key_index()
+
+    def setup(self):
+        self.index = Index("bench.ctx.edr", check_update=False)
+        self.pid = product_ids([654_321])[0]
+
+    def time_get_index(self):
+        get_index("bench.ctx.edr", refresh=False)
+
+    def time_get_index_columns(self):
+        get_index("bench.ctx.edr", refresh=False, columns=["PRODUCT_ID", "IMAGE_TIME"])
+
+    def time_get_index_mmap(self):
+        get_index("bench.ctx.edr", refresh=False, mmap=True)
+
+    def time_query_time(self):
+        self.index.query_time("2010-03-01", "2010-03-02")
+
+    def time_lookup(self):
+        self.index.lookup(self.pid)
+
+    def time_tab_row(self):
+        TabReader(self.index.label, self.index.local_table_path).row(654_321)
+
+    def peakmem_get_index(self):
+        get_index("bench.ctx.edr", refresh=False)
+
+    def peakmem_get_index_mmap(self):
+        get_index("bench.ctx.edr", refresh=False, mmap=True)
@@ -0,0 +1,29 @@
+"""Illumination calculations with SPICE. Skipped if the generic kernels can't be loaded."""
+import matplotlib
+
+matplotlib.use("Agg")
+
+
+def get_spicer():
+    try:
+        from planetarypy.spice.spicer import MarsSpicer
+    except Exception:
+        raise NotImplementedError("SPICE generic kernels not available.")
+    return MarsSpicer(time="2007-02-16T17:45:48.642")
+
+
+class SpicerFluxes:
+    timeout = 300
+
+    def setup(self):
+        self.spicer = get_spicer()
+        self.spicer.goto("inca")
+
+    def time_time_series(self):
+        self.spicer.time_series("F_flat", 600, no_of_steps=144)
+
+    def time_fluxes_around_equator(self):
+        self.spicer.fluxes_around_equator(deltalon=10)
+
+    def time_illum_angles(self):
+        self.spicer.illum_angles
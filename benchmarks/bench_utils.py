@@ -0,0 +1,70 @@
+"""Time parsing and downloads."""
+import time
+
+import numpy as np
+import pandas as pd
+
+from planetarypy import utils
+from planetarypy.pds.synthetic import PDSServer
+
+from .common import BENCH_ROOT, synthetic_file
+
+
+def nasa_times(n):
+    days = 1 + np.arange(n) % 365
+    return [f"2010-{d:03d}T12:34:56.789" for d in days]
+
+
+class NasaTimes:
+    params = [10_000, 1_000_000]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.series = pd.Series(nasa_times(n))
+
+    def time_parse_nasa_times(self, n):
+        utils.parse_nasa_times(self.series)
+
+
+class ScalarNasaTimes:
+    "Parsing one string at a time, for comparison with `NasaTimes`."
+
+    params = NasaTimes.params
+    param_names = ["n"]
+
+    def setup(self, n):
+        if n > 10_000:
+            # asv marks the combination as skipped, without timing anything
+            raise NotImplementedError("Scalar parsing is only timed for the small case.")
+        self.times = nasa_times(n)
+
+    def time_nasa_time_to_datetime(self, n):
+        for t in self.times:
+            utils.nasa_time_to_datetime(t)
+
+
+class Download:
+    "Throughput of `url_retrieve` from a local server."
+
+    nbytes = 100 * 2**20
+    timeout = 300
+
+    def setup(self):
+        synthetic_file(self.nbytes)
+        self.server = PDSServer(BENCH_ROOT / "www")
+        self.url = f"{self.server.url}/file_{self.nbytes}.bin"
+        self.outfile = BENCH_ROOT / "download.bin"
+
+    def teardown(self):
+        self.server.stop()
+        self.outfile.unlink(missing_ok=True)
+
+    def time_url_retrieve(self):
+        utils.url_retrieve(self.url, self.outfile)
+
+    def track_url_retrieve_throughput(self):
+        t0 = time.perf_counter()
+        utils.url_retrieve(self.url, self.outfile)
+        return self.nbytes / 2**20 / (time.perf_counter() - t0)
+
+    track_url_retrieve_throughput.unit = "MiB/s"
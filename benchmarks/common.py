@@ -0,0 +1,32 @@
+"""Synthetic data for the benchmarks, cached in the benchmark root."""
+import numpy as np
+
+from planetarypy.pds.synthetic import layout_values, write_index
+
+from . import BENCH_ROOT
+
+
+def product_ids(rows):
+    "Product ids of the synthetic CTX index at `rows`."
+    return layout_values("mro.ctx.edr", rows)["PRODUCT_ID"]
+
+
+def synthetic_index(rows, key="mro.ctx.edr"):
+    """Write the synthetic index `key` with `rows` records, if not done before.
+
+    Returns the paths of label and table.
+    """
+    folder = BENCH_ROOT / key / str(rows)
+    lblpaths = list(folder.glob("*.LBL"))
+    if lblpaths and lblpaths[0].with_suffix(".TAB").exists():
+        return lblpaths[0], lblpaths[0].with_suffix(".TAB")
+    return write_index(key, folder, rows)
+
+
+def synthetic_file(nbytes, path=None):
+    "Random bytes of size `nbytes`, written once."
+    path = path or BENCH_ROOT / "www" / f"file_{nbytes}.bin"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        path.write_bytes(np.random.default_rng(0).bytes(nbytes))
+    return path
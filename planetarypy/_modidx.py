@@ -5,156 +5,230 @@ d = { 'settings': { 'branch': 'master',
                 'doc_host': 'https://michaelaye.github.io',
                 'git_url': 'https://github.com/michaelaye/nbplanetary',
                 'lib_path': 'planetarypy'},
-  'syms': { 'planetarypy.ard': {},
-            'planetarypy.ciss': { 'planetarypy.ciss.DataRetriever': ('api/cassini_iss.html#dataretriever', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.DataRetriever.__init__': ('api/cassini_iss.html#__init__', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.DataRetriever.calib_data_url': ( 'api/cassini_iss.html#calib_data_url',
+  'syms': { 'planetarypy.ciss': { 'planetarypy.ciss.DataRetriever': ('api/cassini_iss.html#dataretriever', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.DataRetriever.__init__': ( 'api/cassini_iss.html#dataretriever.__init__',
+                                                                               'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.DataRetriever.calib_data_url': ( 'api/cassini_iss.html#dataretriever.calib_data_url',
                                                                                      'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.DataRetriever.calib_fname': ('api/cassini_iss.html#calib_fname', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.DataRetriever.raw_data_url': ( 'api/cassini_iss.html#raw_data_url',
+                                  'planetarypy.ciss.DataRetriever.calib_fname': ( 'api/cassini_iss.html#dataretriever.calib_fname',
+                                                                                  'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.DataRetriever.calib_label_url': ( 'api/cassini_iss.html#dataretriever.calib_label_url',
+                                                                                      'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.DataRetriever.raw_data_url': ( 'api/cassini_iss.html#dataretriever.raw_data_url',
                                                                                    'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.DataRetriever.raw_fname': ('api/cassini_iss.html#raw_fname', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.DataRetriever.raw_label_url': ( 'api/cassini_iss.html#raw_label_url',
+                                  'planetarypy.ciss.DataRetriever.raw_fname': ( 'api/cassini_iss.html#dataretriever.raw_fname',
+                                                                                'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.DataRetriever.raw_label_url': ( 'api/cassini_iss.html#dataretriever.raw_label_url',
                                                                                     'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.DataRetriever.raw_prefix_fmt_url': ( 'api/cassini_iss.html#raw_prefix_fmt_url',
+                                  'planetarypy.ciss.DataRetriever.raw_prefix_fmt_url': ( 'api/cassini_iss.html#dataretriever.raw_prefix_fmt_url',
                                                                                          'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.DataRetriever.raw_tlmtab_url': ( 'api/cassini_iss.html#raw_tlmtab_url',
+                                  'planetarypy.ciss.DataRetriever.raw_tlmtab_url': ( 'api/cassini_iss.html#dataretriever.raw_tlmtab_url',
                                                                                      'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.DataRetriever.vol_path': ('api/cassini_iss.html#vol_path', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.DataRetriever.urls': ('api/cassini_iss.html#dataretriever.urls', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.DataRetriever.vol_path': ( 'api/cassini_iss.html#dataretriever.vol_path',
+                                                                               'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.DataRetriever.volume': ( 'api/cassini_iss.html#dataretriever.volume',
+                                                                             'planetarypy/ciss.py'),
                                   'planetarypy.ciss.ISS': ('api/cassini_iss.html#iss', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.__init__': ('api/cassini_iss.html#__init__', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.__repr__': ('api/cassini_iss.html#__repr__', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.calib_data_url': ('api/cassini_iss.html#calib_data_url', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.calib_label_url': ('api/cassini_iss.html#calib_label_url', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.download_calib': ('api/cassini_iss.html#download_calib', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.download_raw': ('api/cassini_iss.html#download_raw', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.local_calib_label_path': ( 'api/cassini_iss.html#local_calib_label_path',
+                                  'planetarypy.ciss.ISS.__init__': ('api/cassini_iss.html#iss.__init__', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.__repr__': ('api/cassini_iss.html#iss.__repr__', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS._set_attributes': ( 'api/cassini_iss.html#iss._set_attributes',
+                                                                            'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.calib_data_url': ('api/cassini_iss.html#iss.calib_data_url', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.calib_label_url': ( 'api/cassini_iss.html#iss.calib_label_url',
+                                                                            'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.download_calib': ('api/cassini_iss.html#iss.download_calib', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.download_raw': ('api/cassini_iss.html#iss.download_raw', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.from_index': ('api/cassini_iss.html#iss.from_index', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.local_calib_label_path': ( 'api/cassini_iss.html#iss.local_calib_label_path',
                                                                                    'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.local_calib_path': ('api/cassini_iss.html#local_calib_path', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.local_data_path': ('api/cassini_iss.html#local_data_path', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.local_folder': ('api/cassini_iss.html#local_folder', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.local_label_path': ('api/cassini_iss.html#local_label_path', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.query_pid': ('api/cassini_iss.html#query_pid', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.raw_data_url': ('api/cassini_iss.html#raw_data_url', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.raw_label_url': ('api/cassini_iss.html#raw_label_url', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.raw_prefix_fmt_url': ( 'api/cassini_iss.html#raw_prefix_fmt_url',
+                                  'planetarypy.ciss.ISS.local_calib_path': ( 'api/cassini_iss.html#iss.local_calib_path',
+                                                                             'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.local_data_path': ( 'api/cassini_iss.html#iss.local_data_path',
+                                                                            'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.local_folder': ('api/cassini_iss.html#iss.local_folder', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.local_label_path': ( 'api/cassini_iss.html#iss.local_label_path',
+                                                                             'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.query_pid': ('api/cassini_iss.html#iss.query_pid', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.raw_data_url': ('api/cassini_iss.html#iss.raw_data_url', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.raw_label_url': ('api/cassini_iss.html#iss.raw_label_url', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.raw_prefix_fmt_url': ( 'api/cassini_iss.html#iss.raw_prefix_fmt_url',
                                                                                'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.raw_tlmtab_url': ('api/cassini_iss.html#raw_tlmtab_url', 'planetarypy/ciss.py'),
-                                  'planetarypy.ciss.ISS.volume': ('api/cassini_iss.html#volume', 'planetarypy/ciss.py')},
+                                  'planetarypy.ciss.ISS.raw_tlmtab_url': ('api/cassini_iss.html#iss.raw_tlmtab_url', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.ISS.volume': ('api/cassini_iss.html#iss.volume', 'planetarypy/ciss.py'),
+                                  'planetarypy.ciss.index_lookup': ('api/cassini_iss.html#index_lookup', 'planetarypy/ciss.py')},
             'planetarypy.config': { 'planetarypy.config.Config': ('api/config.html#config', 'planetarypy/config.py'),
-                                    'planetarypy.config.Config.__init__': ('api/config.html#__init__', 'planetarypy/config.py'),
-                                    'planetarypy.config.Config.__repr__': ('api/config.html#__repr__', 'planetarypy/config.py'),
-                                    'planetarypy.config.Config._copy_clean_to_resource': ( 'api/config.html#_copy_clean_to_resource',
+                                    'planetarypy.config.Config.__init__': ('api/config.html#config.__init__', 'planetarypy/config.py'),
+                                    'planetarypy.config.Config.__repr__': ('api/config.html#config.__repr__', 'planetarypy/config.py'),
+                                    'planetarypy.config.Config._copy_clean_to_resource': ( 'api/config.html#config._copy_clean_to_resource',
                                                                                            'planetarypy/config.py'),
-                                    'planetarypy.config.Config._read_config': ('api/config.html#_read_config', 'planetarypy/config.py'),
-                                    'planetarypy.config.Config._update_configfile': ( 'api/config.html#_update_configfile',
+                                    'planetarypy.config.Config._read_config': ( 'api/config.html#config._read_config',
+                                                                                'planetarypy/config.py'),
+                                    'planetarypy.config.Config._update_configfile': ( 'api/config.html#config._update_configfile',
                                                                                       'planetarypy/config.py'),
-                                    'planetarypy.config.Config.ask_storage_root': ( 'api/config.html#ask_storage_root',
+                                    'planetarypy.config.Config.ask_storage_root': ( 'api/config.html#config.ask_storage_root',
                                                                                     'planetarypy/config.py'),
-                                    'planetarypy.config.Config.current_backup_name': ( 'api/config.html#current_backup_name',
+                                    'planetarypy.config.Config.current_backup_name': ( 'api/config.html#config.current_backup_name',
                                                                                        'planetarypy/config.py'),
-                                    'planetarypy.config.Config.d': ('api/config.html#d', 'planetarypy/config.py'),
-                                    'planetarypy.config.Config.get_datalevels': ('api/config.html#get_datalevels', 'planetarypy/config.py'),
-                                    'planetarypy.config.Config.get_value': ('api/config.html#get_value', 'planetarypy/config.py'),
-                                    'planetarypy.config.Config.list_indexes': ('api/config.html#list_indexes', 'planetarypy/config.py'),
-                                    'planetarypy.config.Config.list_instruments': ( 'api/config.html#list_instruments',
+                                    'planetarypy.config.Config.d': ('api/config.html#config.d', 'planetarypy/config.py'),
+                                    'planetarypy.config.Config.get_datalevels': ( 'api/config.html#config.get_datalevels',
+                                                                                  'planetarypy/config.py'),
+                                    'planetarypy.config.Config.get_value': ('api/config.html#config.get_value', 'planetarypy/config.py'),
+                                    'planetarypy.config.Config.list_indexes': ( 'api/config.html#config.list_indexes',
+                                                                                'planetarypy/config.py'),
+                                    'planetarypy.config.Config.list_instruments': ( 'api/config.html#config.list_instruments',
                                                                                     'planetarypy/config.py'),
-                                    'planetarypy.config.Config.make_backup_copy': ( 'api/config.html#make_backup_copy',
+                                    'planetarypy.config.Config.make_backup_copy': ( 'api/config.html#config.make_backup_copy',
                                                                                     'planetarypy/config.py'),
-                                    'planetarypy.config.Config.missions': ('api/config.html#missions', 'planetarypy/config.py'),
-                                    'planetarypy.config.Config.populate_timestamps': ( 'api/config.html#populate_timestamps',
+                                    'planetarypy.config.Config.missions': ('api/config.html#config.missions', 'planetarypy/config.py'),
+                                    'planetarypy.config.Config.populate_timestamps': ( 'api/config.html#config.populate_timestamps',
                                                                                        'planetarypy/config.py'),
-                                    'planetarypy.config.Config.save': ('api/config.html#save', 'planetarypy/config.py'),
-                                    'planetarypy.config.Config.set_value': ('api/config.html#set_value', 'planetarypy/config.py'),
+                                    'planetarypy.config.Config.save': ('api/config.html#config.save', 'planetarypy/config.py'),
+                                    'planetarypy.config.Config.set_value': ('api/config.html#config.set_value', 'planetarypy/config.py'),
                                     'planetarypy.config.reset_non_urls': ('api/config.html#reset_non_urls', 'planetarypy/config.py')},
             'planetarypy.ctx': { 'planetarypy.ctx.CTX': ('api/ctx.html#ctx', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.__getattr__': ('api/ctx.html#__getattr__', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.__init__': ('api/ctx.html#__init__', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.__repr__': ('api/ctx.html#__repr__', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.__str__': ('api/ctx.html#__str__', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.cal_da': ('api/ctx.html#cal_da', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.cal_path': ('api/ctx.html#cal_path', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.cal_shape': ('api/ctx.html#cal_shape', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.calib_pipeline': ('api/ctx.html#calib_pipeline', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.calibrate': ('api/ctx.html#calibrate', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.cub_path': ('api/ctx.html#cub_path', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.data_quality': ('api/ctx.html#data_quality', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.destripe': ('api/ctx.html#destripe', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.destripe_path': ('api/ctx.html#destripe_path', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.edr_da': ('api/ctx.html#edr_da', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.edr_shape': ('api/ctx.html#edr_shape', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.isis_import': ('api/ctx.html#isis_import', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.map_path': ('api/ctx.html#map_path', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.map_project': ('api/ctx.html#map_project', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.plot_calibrated': ('api/ctx.html#plot_calibrated', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.plot_da': ('api/ctx.html#plot_da', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.plot_edr': ('api/ctx.html#plot_edr', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.preproc_cal_path': ('api/ctx.html#preproc_cal_path', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.preproc_folder': ('api/ctx.html#preproc_folder', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.proc_folder': ('api/ctx.html#proc_folder', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.save_as_tif': ('api/ctx.html#save_as_tif', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.spatial_summing': ('api/ctx.html#spatial_summing', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.spice_init': ('api/ctx.html#spice_init', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTX.tif_path': ('api/ctx.html#tif_path', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.__getattr__': ('api/ctx.html#ctx.__getattr__', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.__init__': ('api/ctx.html#ctx.__init__', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.__repr__': ('api/ctx.html#ctx.__repr__', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.__str__': ('api/ctx.html#ctx.__str__', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.cal_da': ('api/ctx.html#ctx.cal_da', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.cal_path': ('api/ctx.html#ctx.cal_path', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.cal_shape': ('api/ctx.html#ctx.cal_shape', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.calib_pipeline': ('api/ctx.html#ctx.calib_pipeline', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.calibrate': ('api/ctx.html#ctx.calibrate', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.cub_path': ('api/ctx.html#ctx.cub_path', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.data_quality': ('api/ctx.html#ctx.data_quality', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.destripe': ('api/ctx.html#ctx.destripe', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.destripe_path': ('api/ctx.html#ctx.destripe_path', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.edr_da': ('api/ctx.html#ctx.edr_da', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.edr_shape': ('api/ctx.html#ctx.edr_shape', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.isis_import': ('api/ctx.html#ctx.isis_import', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.map_path': ('api/ctx.html#ctx.map_path', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.map_project': ('api/ctx.html#ctx.map_project', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.plot_calibrated': ('api/ctx.html#ctx.plot_calibrated', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.plot_da': ('api/ctx.html#ctx.plot_da', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.plot_edr': ('api/ctx.html#ctx.plot_edr', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.preproc_cal_path': ('api/ctx.html#ctx.preproc_cal_path', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.preproc_folder': ('api/ctx.html#ctx.preproc_folder', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.proc_folder': ('api/ctx.html#ctx.proc_folder', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.run_stage': ('api/ctx.html#ctx.run_stage', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.save_as_tif': ('api/ctx.html#ctx.save_as_tif', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.spatial_summing': ('api/ctx.html#ctx.spatial_summing', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.spice_init': ('api/ctx.html#ctx.spice_init', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTX.tif_path': ('api/ctx.html#ctx.tif_path', 'planetarypy/ctx.py'),
                                  'planetarypy.ctx.CTXCollection': ('api/ctx.html#ctxcollection', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.__init__': ('api/ctx.html#__init__', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.__repr__': ('api/ctx.html#__repr__', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.__str__': ('api/ctx.html#__str__', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection._do_calib': ('api/ctx.html#_do_calib', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection._do_download': ('api/ctx.html#_do_download', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.by_month': ('api/ctx.html#by_month', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.by_volume': ('api/ctx.html#by_volume', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.calib_exist_check': ( 'api/ctx.html#calib_exist_check',
+                                 'planetarypy.ctx.CTXCollection.__init__': ('api/ctx.html#ctxcollection.__init__', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.__repr__': ('api/ctx.html#ctxcollection.__repr__', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.__str__': ('api/ctx.html#ctxcollection.__str__', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection._do_calib': ('api/ctx.html#ctxcollection._do_calib', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection._do_download': ( 'api/ctx.html#ctxcollection._do_download',
+                                                                                 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.by_month': ('api/ctx.html#ctxcollection.by_month', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.by_time': ('api/ctx.html#ctxcollection.by_time', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.by_volume': ('api/ctx.html#ctxcollection.by_volume', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.calib_exist_check': ( 'api/ctx.html#ctxcollection.calib_exist_check',
                                                                                       'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.calibrate_collection': ( 'api/ctx.html#calibrate_collection',
+                                 'planetarypy.ctx.CTXCollection.calibrate_collection': ( 'api/ctx.html#ctxcollection.calibrate_collection',
                                                                                          'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.count_per_volume': ('api/ctx.html#count_per_volume', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.download_collection': ( 'api/ctx.html#download_collection',
+                                 'planetarypy.ctx.CTXCollection.count_per_volume': ( 'api/ctx.html#ctxcollection.count_per_volume',
+                                                                                     'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.download_collection': ( 'api/ctx.html#ctxcollection.download_collection',
                                                                                         'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.edr_exist_check': ('api/ctx.html#edr_exist_check', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.filter_error': ('api/ctx.html#filter_error', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.get_corrupted': ('api/ctx.html#get_corrupted', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.get_ctx_n': ('api/ctx.html#get_ctx_n', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.get_pid_n': ('api/ctx.html#get_pid_n', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.get_urls': ('api/ctx.html#get_urls', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.image_times': ('api/ctx.html#image_times', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.meta': ('api/ctx.html#meta', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.n_items': ('api/ctx.html#n_items', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.only_full_width': ('api/ctx.html#only_full_width', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.pids': ('api/ctx.html#pids', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.product_ids': ('api/ctx.html#product_ids', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.sample': ('api/ctx.html#sample', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.volume_from_pid': ('api/ctx.html#volume_from_pid', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection.volumes_in_pids': ('api/ctx.html#volumes_in_pids', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.edr_exist_check': ( 'api/ctx.html#ctxcollection.edr_exist_check',
+                                                                                    'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.filter_error': ( 'api/ctx.html#ctxcollection.filter_error',
+                                                                                 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.get_corrupted': ( 'api/ctx.html#ctxcollection.get_corrupted',
+                                                                                  'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.get_ctx_n': ('api/ctx.html#ctxcollection.get_ctx_n', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.get_pid_n': ('api/ctx.html#ctxcollection.get_pid_n', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.get_urls': ('api/ctx.html#ctxcollection.get_urls', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.image_times': ( 'api/ctx.html#ctxcollection.image_times',
+                                                                                'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.meta': ('api/ctx.html#ctxcollection.meta', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.n_items': ('api/ctx.html#ctxcollection.n_items', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.only_full_width': ( 'api/ctx.html#ctxcollection.only_full_width',
+                                                                                    'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.pids': ('api/ctx.html#ctxcollection.pids', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.product_ids': ( 'api/ctx.html#ctxcollection.product_ids',
+                                                                                'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.query_time': ( 'api/ctx.html#ctxcollection.query_time',
+                                                                               'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.sample': ('api/ctx.html#ctxcollection.sample', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.volume_from_pid': ( 'api/ctx.html#ctxcollection.volume_from_pid',
+                                                                                    'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.volumes_in_pids': ( 'api/ctx.html#ctxcollection.volumes_in_pids',
+                                                                                    'planetarypy/ctx.py'),
                                  'planetarypy.ctx.CTXEDR': ('api/ctx.html#ctxedr', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXEDR.__init__': ('api/ctx.html#__init__', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXEDR.__repr__': ('api/ctx.html#__repr__', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXEDR.__str__': ('api/ctx.html#__str__', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXEDR.download': ('api/ctx.html#download', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXEDR.meta': ('api/ctx.html#meta', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXEDR.pid': ('api/ctx.html#pid', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXEDR.short_pid': ('api/ctx.html#short_pid', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXEDR.source_folder': ('api/ctx.html#source_folder', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXEDR.source_path': ('api/ctx.html#source_path', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXEDR.url': ('api/ctx.html#url', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXEDR.volume': ('api/ctx.html#volume', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXEDR.__init__': ('api/ctx.html#ctxedr.__init__', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXEDR.__repr__': ('api/ctx.html#ctxedr.__repr__', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXEDR.__str__': ('api/ctx.html#ctxedr.__str__', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXEDR.download': ('api/ctx.html#ctxedr.download', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXEDR.meta': ('api/ctx.html#ctxedr.meta', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXEDR.pid': ('api/ctx.html#ctxedr.pid', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXEDR.short_pid': ('api/ctx.html#ctxedr.short_pid', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXEDR.source_folder': ('api/ctx.html#ctxedr.source_folder', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXEDR.source_path': ('api/ctx.html#ctxedr.source_path', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXEDR.url': ('api/ctx.html#ctxedr.url', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXEDR.volume': ('api/ctx.html#ctxedr.volume', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx._add_edr_columns': ('api/ctx.html#_add_edr_columns', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx._usage': ('api/ctx.html#_usage', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.attach_edr_index': ('api/ctx.html#attach_edr_index', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.block_chunks': ('api/ctx.html#block_chunks', 'planetarypy/ctx.py'),
                                  'planetarypy.ctx.ctx_calib': ('api/ctx.html#ctx_calib', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.get_edr_index': ('api/ctx.html#get_edr_index', 'planetarypy/ctx.py')},
-            'planetarypy.db': {},
+                                 'planetarypy.ctx.get_edr_index': ('api/ctx.html#get_edr_index', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.get_edr_time_index': ('api/ctx.html#get_edr_time_index', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.open_raster': ('api/ctx.html#open_raster', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.read_telemetry': ('api/ctx.html#read_telemetry', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.share_edr_index': ('api/ctx.html#share_edr_index', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.telemetry_report': ('api/ctx.html#telemetry_report', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.write_telemetry': ('api/ctx.html#write_telemetry', 'planetarypy/ctx.py')},
+            'planetarypy.db': { 'planetarypy.db.IndexDB': ('api/db.html#indexdb', 'planetarypy/db.py'),
+                                'planetarypy.db.IndexDB.__init__': ('api/db.html#indexdb.__init__', 'planetarypy/db.py'),
+                                'planetarypy.db.IndexDB.__repr__': ('api/db.html#indexdb.__repr__', 'planetarypy/db.py'),
+                                'planetarypy.db.IndexDB.query': ('api/db.html#indexdb.query', 'planetarypy/db.py'),
+                                'planetarypy.db.IndexDB.query_df': ('api/db.html#indexdb.query_df', 'planetarypy/db.py'),
+                                'planetarypy.db.IndexDB.register': ('api/db.html#indexdb.register', 'planetarypy/db.py'),
+                                'planetarypy.db.IndexDB.register_all': ('api/db.html#indexdb.register_all', 'planetarypy/db.py'),
+                                'planetarypy.db._sql_string': ('api/db.html#_sql_string', 'planetarypy/db.py'),
+                                'planetarypy.db.get_db': ('api/db.html#get_db', 'planetarypy/db.py'),
+                                'planetarypy.db.query': ('api/db.html#query', 'planetarypy/db.py'),
+                                'planetarypy.db.table_name': ('api/db.html#table_name', 'planetarypy/db.py')},
             'planetarypy.diviner': { 'planetarypy.diviner.DataManager': ('api/diviner.html#datamanager', 'planetarypy/diviner.py'),
-                                     'planetarypy.diviner.DataManager.__init__': ('api/diviner.html#__init__', 'planetarypy/diviner.py'),
-                                     'planetarypy.diviner.DataManager.base_url': ('api/diviner.html#base_url', 'planetarypy/diviner.py'),
-                                     'planetarypy.diviner.DataManager.download': ('api/diviner.html#download', 'planetarypy/diviner.py'),
-                                     'planetarypy.diviner.DataManager.local_path': ( 'api/diviner.html#local_path',
+                                     'planetarypy.diviner.DataManager.__init__': ( 'api/diviner.html#datamanager.__init__',
+                                                                                   'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.DataManager.base_url': ( 'api/diviner.html#datamanager.base_url',
+                                                                                   'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.DataManager.download': ( 'api/diviner.html#datamanager.download',
+                                                                                   'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.DataManager.local_path': ( 'api/diviner.html#datamanager.local_path',
                                                                                      'planetarypy/diviner.py'),
-                                     'planetarypy.diviner.DataManager.url': ('api/diviner.html#url', 'planetarypy/diviner.py'),
-                                     'planetarypy.diviner.DataManager.volume': ('api/diviner.html#volume', 'planetarypy/diviner.py'),
-                                     'planetarypy.diviner.DataManager.year': ('api/diviner.html#year', 'planetarypy/diviner.py'),
-                                     'planetarypy.diviner.DataManager.yearmonth': ('api/diviner.html#yearmonth', 'planetarypy/diviner.py'),
-                                     'planetarypy.diviner.DataManager.yearmonthday': ( 'api/diviner.html#yearmonthday',
+                                     'planetarypy.diviner.DataManager.parquet_is_current': ( 'api/diviner.html#datamanager.parquet_is_current',
+                                                                                             'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.DataManager.parquet_path': ( 'api/diviner.html#datamanager.parquet_path',
+                                                                                       'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.DataManager.to_parquet': ( 'api/diviner.html#datamanager.to_parquet',
+                                                                                     'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.DataManager.url': ('api/diviner.html#datamanager.url', 'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.DataManager.volume': ( 'api/diviner.html#datamanager.volume',
+                                                                                 'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.DataManager.year': ( 'api/diviner.html#datamanager.year',
+                                                                               'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.DataManager.yearmonth': ( 'api/diviner.html#datamanager.yearmonth',
+                                                                                    'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.DataManager.yearmonthday': ( 'api/diviner.html#datamanager.yearmonthday',
                                                                                        'planetarypy/diviner.py'),
                                      'planetarypy.diviner.L1AHeader': ('api/diviner.html#l1aheader', 'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.L1AHeader.select': ( 'api/diviner.html#l1aheader.select',
+                                                                               'planetarypy/diviner.py'),
+                                     'planetarypy.diviner._cache_l1a': ('api/diviner.html#_cache_l1a', 'planetarypy/diviner.py'),
+                                     'planetarypy.diviner._clean_fields': ('api/diviner.html#_clean_fields', 'planetarypy/diviner.py'),
+                                     'planetarypy.diviner._read_options': ('api/diviner.html#_read_options', 'planetarypy/diviner.py'),
                                      'planetarypy.diviner.get_data_path': ('api/diviner.html#get_data_path', 'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.iter_l1a_data': ('api/diviner.html#iter_l1a_data', 'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.l1a_tstrs': ('api/diviner.html#l1a_tstrs', 'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.load_l1a_range': ('api/diviner.html#load_l1a_range', 'planetarypy/diviner.py'),
+                                     'planetarypy.diviner.local_l1a_files': ('api/diviner.html#local_l1a_files', 'planetarypy/diviner.py'),
                                      'planetarypy.diviner.parse_header_line': ( 'api/diviner.html#parse_header_line',
                                                                                 'planetarypy/diviner.py'),
                                      'planetarypy.diviner.read_l1a_data': ('api/diviner.html#read_l1a_data', 'planetarypy/diviner.py')},
@@ -163,98 +237,134 @@ d = { 'settings': { 'branch': 'master',
                                                                                             'planetarypy/exceptions.py'),
                                         'planetarypy.exceptions.MissingParameterError': ( 'api/exceptions.html#missingparametererror',
                                                                                           'planetarypy/exceptions.py'),
-                                        'planetarypy.exceptions.MissingParameterError.__init__': ( 'api/exceptions.html#__init__',
+                                        'planetarypy.exceptions.MissingParameterError.__init__': ( 'api/exceptions.html#missingparametererror.__init__',
                                                                                                    'planetarypy/exceptions.py'),
-                                        'planetarypy.exceptions.MissingParameterError.__str__': ( 'api/exceptions.html#__str__',
+                                        'planetarypy.exceptions.MissingParameterError.__str__': ( 'api/exceptions.html#missingparametererror.__str__',
                                                                                                   'planetarypy/exceptions.py'),
                                         'planetarypy.exceptions.ObserverNotSetError': ( 'api/exceptions.html#observernotseterror',
                                                                                         'planetarypy/exceptions.py'),
-                                        'planetarypy.exceptions.ObserverNotSetError.__str__': ( 'api/exceptions.html#__str__',
+                                        'planetarypy.exceptions.ObserverNotSetError.__str__': ( 'api/exceptions.html#observernotseterror.__str__',
                                                                                                 'planetarypy/exceptions.py'),
                                         'planetarypy.exceptions.ProjectionNotSetError': ( 'api/exceptions.html#projectionnotseterror',
                                                                                           'planetarypy/exceptions.py'),
                                         'planetarypy.exceptions.SPointNotSetError': ( 'api/exceptions.html#spointnotseterror',
                                                                                       'planetarypy/exceptions.py'),
-                                        'planetarypy.exceptions.SPointNotSetError.__init': ( 'api/exceptions.html#__init',
+                                        'planetarypy.exceptions.SPointNotSetError.__init': ( 'api/exceptions.html#spointnotseterror.__init',
                                                                                              'planetarypy/exceptions.py'),
-                                        'planetarypy.exceptions.SPointNotSetError.__str__': ( 'api/exceptions.html#__str__',
+                                        'planetarypy.exceptions.SPointNotSetError.__str__': ( 'api/exceptions.html#spointnotseterror.__str__',
                                                                                               'planetarypy/exceptions.py'),
                                         'planetarypy.exceptions.SomethingNotSetError': ( 'api/exceptions.html#somethingnotseterror',
                                                                                          'planetarypy/exceptions.py'),
-                                        'planetarypy.exceptions.SomethingNotSetError.__init__': ( 'api/exceptions.html#__init__',
+                                        'planetarypy.exceptions.SomethingNotSetError.__init__': ( 'api/exceptions.html#somethingnotseterror.__init__',
                                                                                                   'planetarypy/exceptions.py'),
-                                        'planetarypy.exceptions.SomethingNotSetError.__str__': ( 'api/exceptions.html#__str__',
+                                        'planetarypy.exceptions.SomethingNotSetError.__str__': ( 'api/exceptions.html#somethingnotseterror.__str__',
                                                                                                  'planetarypy/exceptions.py'),
                                         'planetarypy.exceptions.SpiceError': ( 'api/exceptions.html#spiceerror',
                                                                                'planetarypy/exceptions.py'),
-                                        'planetarypy.exceptions.SpiceError.__init__': ( 'api/exceptions.html#__init__',
+                                        'planetarypy.exceptions.SpiceError.__init__': ( 'api/exceptions.html#spiceerror.__init__',
                                                                                         'planetarypy/exceptions.py'),
-                                        'planetarypy.exceptions.SpiceError.__str__': ( 'api/exceptions.html#__str__',
+                                        'planetarypy.exceptions.SpiceError.__str__': ( 'api/exceptions.html#spiceerror.__str__',
                                                                                        'planetarypy/exceptions.py'),
                                         'planetarypy.exceptions.SpicerError': ( 'api/exceptions.html#spicererror',
                                                                                 'planetarypy/exceptions.py')},
             'planetarypy.geotools': { 'planetarypy.geotools.ImgData': ('api/geotools.html#imgdata', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.ImgData.__init__': ('api/geotools.html#__init__', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.ImgData._read_data': ( 'api/geotools.html#_read_data',
+                                      'planetarypy.geotools.ImgData.__init__': ( 'api/geotools.html#imgdata.__init__',
+                                                                                 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.ImgData._read_data': ( 'api/geotools.html#imgdata._read_data',
                                                                                    'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.ImgData.add_scalebar': ( 'api/geotools.html#add_scalebar',
+                                      'planetarypy.geotools.ImgData.add_scalebar': ( 'api/geotools.html#imgdata.add_scalebar',
                                                                                      'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.ImgData.convert_to_uint8': ( 'api/geotools.html#convert_to_uint8',
+                                      'planetarypy.geotools.ImgData.block_histogram': ( 'api/geotools.html#imgdata.block_histogram',
+                                                                                        'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.ImgData.block_stats': ( 'api/geotools.html#imgdata.block_stats',
+                                                                                    'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.ImgData.block_windows': ( 'api/geotools.html#imgdata.block_windows',
+                                                                                      'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.ImgData.convert_to_uint8': ( 'api/geotools.html#imgdata.convert_to_uint8',
                                                                                          'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.ImgData.normalize': ('api/geotools.html#normalize', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.ImgData.read_all': ('api/geotools.html#read_all', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.ImgData.read_center_window': ( 'api/geotools.html#read_center_window',
+                                      'planetarypy.geotools.ImgData.iter_blocks': ( 'api/geotools.html#imgdata.iter_blocks',
+                                                                                    'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.ImgData.iter_uint8_blocks': ( 'api/geotools.html#imgdata.iter_uint8_blocks',
+                                                                                          'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.ImgData.normalize': ( 'api/geotools.html#imgdata.normalize',
+                                                                                  'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.ImgData.read_all': ( 'api/geotools.html#imgdata.read_all',
+                                                                                 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.ImgData.read_center_window': ( 'api/geotools.html#imgdata.read_center_window',
                                                                                            'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.ImgData.read_cropped_by_n': ( 'api/geotools.html#read_cropped_by_n',
+                                      'planetarypy.geotools.ImgData.read_cropped_by_n': ( 'api/geotools.html#imgdata.read_cropped_by_n',
                                                                                           'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.ImgData.read_window': ( 'api/geotools.html#read_window',
+                                      'planetarypy.geotools.ImgData.read_window': ( 'api/geotools.html#imgdata.read_window',
                                                                                     'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.ImgData.show': ('api/geotools.html#show', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.ImgData.window_coords_to_lonlat': ( 'api/geotools.html#window_coords_to_lonlat',
+                                      'planetarypy.geotools.ImgData.show': ('api/geotools.html#imgdata.show', 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.ImgData.window_coords_to_lonlat': ( 'api/geotools.html#imgdata.window_coords_to_lonlat',
                                                                                                 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.ImgData.window_coords_to_meter': ( 'api/geotools.html#window_coords_to_meter',
+                                      'planetarypy.geotools.ImgData.window_coords_to_meter': ( 'api/geotools.html#imgdata.window_coords_to_meter',
                                                                                                'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.ImgData.window_coords_to_pixel': ( 'api/geotools.html#window_coords_to_pixel',
+                                      'planetarypy.geotools.ImgData.window_coords_to_pixel': ( 'api/geotools.html#imgdata.window_coords_to_pixel',
                                                                                                'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.ImgData.write_uint8': ( 'api/geotools.html#imgdata.write_uint8',
+                                                                                    'planetarypy/geotools.py'),
                                       'planetarypy.geotools.Point': ('api/geotools.html#point', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.__add__': ('api/geotools.html#__add__', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.__init__': ('api/geotools.html#__init__', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.__repr__': ('api/geotools.html#__repr__', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.__str__': ('api/geotools.html#__str__', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.calculate_azimuth': ( 'api/geotools.html#calculate_azimuth',
+                                      'planetarypy.geotools.Point.__add__': ('api/geotools.html#point.__add__', 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.Point.__init__': ( 'api/geotools.html#point.__init__',
+                                                                               'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.Point.__repr__': ( 'api/geotools.html#point.__repr__',
+                                                                               'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.Point.__str__': ('api/geotools.html#point.__str__', 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.Point.calculate_azimuth': ( 'api/geotools.html#point.calculate_azimuth',
                                                                                         'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.coords': ('api/geotools.html#coords', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.copy_geodata': ( 'api/geotools.html#copy_geodata',
+                                      'planetarypy.geotools.Point.coords': ('api/geotools.html#point.coords', 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.Point.copy_geodata': ( 'api/geotools.html#point.copy_geodata',
                                                                                    'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.lonlat_to_meter': ( 'api/geotools.html#lonlat_to_meter',
+                                      'planetarypy.geotools.Point.lonlat_to_meter': ( 'api/geotools.html#point.lonlat_to_meter',
                                                                                       'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.lonlat_to_pixel': ( 'api/geotools.html#lonlat_to_pixel',
+                                      'planetarypy.geotools.Point.lonlat_to_pixel': ( 'api/geotools.html#point.lonlat_to_pixel',
                                                                                       'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.lonlats': ('api/geotools.html#lonlats', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.meter_to_lonlat': ( 'api/geotools.html#meter_to_lonlat',
+                                      'planetarypy.geotools.Point.lonlats': ('api/geotools.html#point.lonlats', 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.Point.meter_to_lonlat': ( 'api/geotools.html#point.meter_to_lonlat',
                                                                                       'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.meter_to_pixel': ( 'api/geotools.html#meter_to_pixel',
+                                      'planetarypy.geotools.Point.meter_to_pixel': ( 'api/geotools.html#point.meter_to_pixel',
                                                                                      'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.pixel_to_lonlat': ( 'api/geotools.html#pixel_to_lonlat',
+                                      'planetarypy.geotools.Point.pixel_to_lonlat': ( 'api/geotools.html#point.pixel_to_lonlat',
                                                                                       'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.pixel_to_meter': ( 'api/geotools.html#pixel_to_meter',
+                                      'planetarypy.geotools.Point.pixel_to_meter': ( 'api/geotools.html#point.pixel_to_meter',
                                                                                      'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.pixels': ('api/geotools.html#pixels', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Point.shift_to_center': ( 'api/geotools.html#shift_to_center',
+                                      'planetarypy.geotools.Point.pixels': ('api/geotools.html#point.pixels', 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.Point.shift_to_center': ( 'api/geotools.html#point.shift_to_center',
                                                                                       'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.SRSCache': ('api/geotools.html#srscache', 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.SRSCache.__init__': ( 'api/geotools.html#srscache.__init__',
+                                                                                  'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.SRSCache._get': ('api/geotools.html#srscache._get', 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.SRSCache.clear': ( 'api/geotools.html#srscache.clear',
+                                                                               'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.SRSCache.inv_geotransform': ( 'api/geotools.html#srscache.inv_geotransform',
+                                                                                          'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.SRSCache.srs': ('api/geotools.html#srscache.srs', 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.SRSCache.transformation': ( 'api/geotools.html#srscache.transformation',
+                                                                                        'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.ThreadLocalSRSCache': ( 'api/geotools.html#threadlocalsrscache',
+                                                                                    'planetarypy/geotools.py'),
                                       'planetarypy.geotools.Window': ('api/geotools.html#window', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Window.__init__': ('api/geotools.html#__init__', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Window.__repr__': ('api/geotools.html#__repr__', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Window.__str__': ('api/geotools.html#__str__', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Window.copy': ('api/geotools.html#copy', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Window.get_corners_from_center': ( 'api/geotools.html#get_corners_from_center',
+                                      'planetarypy.geotools.Window.__init__': ( 'api/geotools.html#window.__init__',
+                                                                                'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.Window.__repr__': ( 'api/geotools.html#window.__repr__',
+                                                                                'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.Window.__str__': ( 'api/geotools.html#window.__str__',
+                                                                               'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.Window.copy': ('api/geotools.html#window.copy', 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.Window.get_corners_from_center': ( 'api/geotools.html#window.get_corners_from_center',
                                                                                                'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Window.get_extent': ('api/geotools.html#get_extent', 'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Window.get_gdal_window': ( 'api/geotools.html#get_gdal_window',
+                                      'planetarypy.geotools.Window.get_extent': ( 'api/geotools.html#window.get_extent',
+                                                                                  'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.Window.get_gdal_window': ( 'api/geotools.html#window.get_gdal_window',
                                                                                        'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Window.get_lr_from_width': ( 'api/geotools.html#get_lr_from_width',
+                                      'planetarypy.geotools.Window.get_lr_from_width': ( 'api/geotools.html#window.get_lr_from_width',
                                                                                          'planetarypy/geotools.py'),
-                                      'planetarypy.geotools.Window.usage': ('api/geotools.html#usage', 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.Window.usage': ('api/geotools.html#window.usage', 'planetarypy/geotools.py'),
+                                      'planetarypy.geotools._sun_angles_chunk': ( 'api/geotools.html#_sun_angles_chunk',
+                                                                                  'planetarypy/geotools.py'),
                                       'planetarypy.geotools.calculate_image_azimuth': ( 'api/geotools.html#calculate_image_azimuth',
                                                                                         'planetarypy/geotools.py'),
                                       'planetarypy.geotools.calculate_image_north_azimuth': ( 'api/geotools.html#calculate_image_north_azimuth',
@@ -264,315 +374,662 @@ d = { 'settings': { 'branch': 'master',
                                                                                         'planetarypy/geotools.py'),
                                       'planetarypy.geotools.get_sun_angles': ( 'api/geotools.html#get_sun_angles',
                                                                                'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.get_sun_angles_batch': ( 'api/geotools.html#get_sun_angles_batch',
+                                                                                     'planetarypy/geotools.py'),
+                                      'planetarypy.geotools.mask_nodata': ('api/geotools.html#mask_nodata', 'planetarypy/geotools.py'),
                                       'planetarypy.geotools.pixel_to_meter': ( 'api/geotools.html#pixel_to_meter',
                                                                                'planetarypy/geotools.py'),
                                       'planetarypy.geotools.shift_to_center': ( 'api/geotools.html#shift_to_center',
                                                                                 'planetarypy/geotools.py')},
             'planetarypy.hirise': { 'planetarypy.hirise.BG_PRODUCT': ('api/hirise.html#bg_product', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.BG_PRODUCT.__init__': ('api/hirise.html#__init__', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.BG_PRODUCT.__init__': ( 'api/hirise.html#bg_product.__init__',
+                                                                                'planetarypy/hirise.py'),
                                     'planetarypy.hirise.COLOR_PRODUCT': ('api/hirise.html#color_product', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.COLOR_PRODUCT.__init__': ('api/hirise.html#__init__', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.COLOR_PRODUCT.download': ('api/hirise.html#download', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.COLOR_PRODUCT.local_path': ('api/hirise.html#local_path', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.COLOR_PRODUCT.meta': ('api/hirise.html#meta', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.COLOR_PRODUCT.plot_da': ('api/hirise.html#plot_da', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.COLOR_PRODUCT.product_id': ('api/hirise.html#product_id', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.COLOR_PRODUCT.read': ('api/hirise.html#read', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.COLOR_PRODUCT.remote_path': ( 'api/hirise.html#remote_path',
+                                    'planetarypy.hirise.COLOR_PRODUCT.__init__': ( 'api/hirise.html#color_product.__init__',
+                                                                                   'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.COLOR_PRODUCT.download': ( 'api/hirise.html#color_product.download',
+                                                                                   'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.COLOR_PRODUCT.local_path': ( 'api/hirise.html#color_product.local_path',
+                                                                                     'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.COLOR_PRODUCT.meta': ( 'api/hirise.html#color_product.meta',
+                                                                               'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.COLOR_PRODUCT.plot_da': ( 'api/hirise.html#color_product.plot_da',
+                                                                                  'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.COLOR_PRODUCT.product_id': ( 'api/hirise.html#color_product.product_id',
+                                                                                     'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.COLOR_PRODUCT.read': ( 'api/hirise.html#color_product.read',
+                                                                               'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.COLOR_PRODUCT.remote_path': ( 'api/hirise.html#color_product.remote_path',
                                                                                       'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.COLOR_PRODUCT.show': ('api/hirise.html#show', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.COLOR_PRODUCT.url': ('api/hirise.html#url', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.COLOR_PRODUCT.show': ( 'api/hirise.html#color_product.show',
+                                                                               'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.COLOR_PRODUCT.url': ('api/hirise.html#color_product.url', 'planetarypy/hirise.py'),
                                     'planetarypy.hirise.IR_PRODUCT': ('api/hirise.html#ir_product', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.IR_PRODUCT.__init__': ('api/hirise.html#__init__', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.IR_PRODUCT.__init__': ( 'api/hirise.html#ir_product.__init__',
+                                                                                'planetarypy/hirise.py'),
                                     'planetarypy.hirise.OBSID': ('api/hirise.html#obsid', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.OBSID.__init__': ('api/hirise.html#__init__', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.OBSID.__repr__': ('api/hirise.html#__repr__', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.OBSID.__str__': ('api/hirise.html#__str__', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.OBSID.id': ('api/hirise.html#id', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.OBSID.orbit': ('api/hirise.html#orbit', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.OBSID.phase': ('api/hirise.html#phase', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.OBSID.storage_path_stem': ( 'api/hirise.html#storage_path_stem',
+                                    'planetarypy.hirise.OBSID.__init__': ('api/hirise.html#obsid.__init__', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.OBSID.__repr__': ('api/hirise.html#obsid.__repr__', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.OBSID.__str__': ('api/hirise.html#obsid.__str__', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.OBSID.id': ('api/hirise.html#obsid.id', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.OBSID.orbit': ('api/hirise.html#obsid.orbit', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.OBSID.phase': ('api/hirise.html#obsid.phase', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.OBSID.storage_path_stem': ( 'api/hirise.html#obsid.storage_path_stem',
                                                                                     'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.OBSID.targetcode': ('api/hirise.html#targetcode', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.OBSID.upper_orbit_folder': ( 'api/hirise.html#upper_orbit_folder',
+                                    'planetarypy.hirise.OBSID.targetcode': ('api/hirise.html#obsid.targetcode', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.OBSID.upper_orbit_folder': ( 'api/hirise.html#obsid.upper_orbit_folder',
                                                                                      'planetarypy/hirise.py'),
                                     'planetarypy.hirise.ProductPathfinder': ('api/hirise.html#productpathfinder', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.__getattr__': ( 'api/hirise.html#__getattr__',
+                                    'planetarypy.hirise.ProductPathfinder.__getattr__': ( 'api/hirise.html#productpathfinder.__getattr__',
                                                                                           'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.__init__': ('api/hirise.html#__init__', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.__repr__': ('api/hirise.html#__repr__', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.__str__': ('api/hirise.html#__str__', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder._make_url': ( 'api/hirise.html#_make_url',
+                                    'planetarypy.hirise.ProductPathfinder.__init__': ( 'api/hirise.html#productpathfinder.__init__',
+                                                                                       'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.ProductPathfinder.__repr__': ( 'api/hirise.html#productpathfinder.__repr__',
+                                                                                       'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.ProductPathfinder.__str__': ( 'api/hirise.html#productpathfinder.__str__',
+                                                                                      'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.ProductPathfinder._make_url': ( 'api/hirise.html#productpathfinder._make_url',
                                                                                         'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.abrowse_path': ( 'api/hirise.html#abrowse_path',
+                                    'planetarypy.hirise.ProductPathfinder.abrowse_path': ( 'api/hirise.html#productpathfinder.abrowse_path',
                                                                                            'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.browse_path': ( 'api/hirise.html#browse_path',
+                                    'planetarypy.hirise.ProductPathfinder.browse_path': ( 'api/hirise.html#productpathfinder.browse_path',
                                                                                           'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.download_label': ( 'api/hirise.html#download_label',
+                                    'planetarypy.hirise.ProductPathfinder.download_label': ( 'api/hirise.html#productpathfinder.download_label',
                                                                                              'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.edr_storage_stem': ( 'api/hirise.html#edr_storage_stem',
+                                    'planetarypy.hirise.ProductPathfinder.edr_storage_stem': ( 'api/hirise.html#productpathfinder.edr_storage_stem',
                                                                                                'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.from_path': ( 'api/hirise.html#from_path',
+                                    'planetarypy.hirise.ProductPathfinder.from_path': ( 'api/hirise.html#productpathfinder.from_path',
                                                                                         'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.go_to_homepage': ( 'api/hirise.html#go_to_homepage',
+                                    'planetarypy.hirise.ProductPathfinder.go_to_homepage': ( 'api/hirise.html#productpathfinder.go_to_homepage',
                                                                                              'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.homepage': ('api/hirise.html#homepage', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.jp2_fname': ( 'api/hirise.html#jp2_fname',
+                                    'planetarypy.hirise.ProductPathfinder.homepage': ( 'api/hirise.html#productpathfinder.homepage',
+                                                                                       'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.ProductPathfinder.jp2_fname': ( 'api/hirise.html#productpathfinder.jp2_fname',
                                                                                         'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.jp2_path': ('api/hirise.html#jp2_path', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.kind': ('api/hirise.html#kind', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.label_fname': ( 'api/hirise.html#label_fname',
+                                    'planetarypy.hirise.ProductPathfinder.jp2_path': ( 'api/hirise.html#productpathfinder.jp2_path',
+                                                                                       'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.ProductPathfinder.kind': ( 'api/hirise.html#productpathfinder.kind',
+                                                                                   'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.ProductPathfinder.label_fname': ( 'api/hirise.html#productpathfinder.label_fname',
                                                                                           'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.label_path': ( 'api/hirise.html#label_path',
+                                    'planetarypy.hirise.ProductPathfinder.label_path': ( 'api/hirise.html#productpathfinder.label_path',
                                                                                          'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.local_label_path': ( 'api/hirise.html#local_label_path',
+                                    'planetarypy.hirise.ProductPathfinder.local_label_path': ( 'api/hirise.html#productpathfinder.local_label_path',
                                                                                                'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.nomap_browse_path': ( 'api/hirise.html#nomap_browse_path',
+                                    'planetarypy.hirise.ProductPathfinder.nomap_browse_path': ( 'api/hirise.html#productpathfinder.nomap_browse_path',
                                                                                                 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.nomap_jp2_path': ( 'api/hirise.html#nomap_jp2_path',
+                                    'planetarypy.hirise.ProductPathfinder.nomap_jp2_path': ( 'api/hirise.html#productpathfinder.nomap_jp2_path',
                                                                                              'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.nomap_thumbnail_path': ( 'api/hirise.html#nomap_thumbnail_path',
+                                    'planetarypy.hirise.ProductPathfinder.nomap_thumbnail_path': ( 'api/hirise.html#productpathfinder.nomap_thumbnail_path',
                                                                                                    'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.obsid': ('api/hirise.html#obsid', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.product_id': ( 'api/hirise.html#product_id',
+                                    'planetarypy.hirise.ProductPathfinder.obsid': ( 'api/hirise.html#productpathfinder.obsid',
+                                                                                    'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.ProductPathfinder.product_id': ( 'api/hirise.html#productpathfinder.product_id',
                                                                                          'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.quicklook_path': ( 'api/hirise.html#quicklook_path',
+                                    'planetarypy.hirise.ProductPathfinder.quicklook_path': ( 'api/hirise.html#productpathfinder.quicklook_path',
                                                                                              'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.storage_stem': ( 'api/hirise.html#storage_stem',
+                                    'planetarypy.hirise.ProductPathfinder.storage_stem': ( 'api/hirise.html#productpathfinder.storage_stem',
                                                                                            'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.ProductPathfinder.thumbnail_path': ( 'api/hirise.html#thumbnail_path',
+                                    'planetarypy.hirise.ProductPathfinder.thumbnail_path': ( 'api/hirise.html#productpathfinder.thumbnail_path',
                                                                                              'planetarypy/hirise.py'),
                                     'planetarypy.hirise.RED_PRODUCT': ('api/hirise.html#red_product', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.RED_PRODUCT.__init__': ('api/hirise.html#__init__', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.RED_PRODUCT.__init__': ( 'api/hirise.html#red_product.__init__',
+                                                                                 'planetarypy/hirise.py'),
                                     'planetarypy.hirise.RGB_NOMAP': ('api/hirise.html#rgb_nomap', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.RGB_NOMAP.__init__': ('api/hirise.html#__init__', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.RGB_NOMAP.__init__': ( 'api/hirise.html#rgb_nomap.__init__',
+                                                                               'planetarypy/hirise.py'),
                                     'planetarypy.hirise.RGB_NOMAPCollection': ( 'api/hirise.html#rgb_nomapcollection',
                                                                                 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.RGB_NOMAPCollection.__init__': ( 'api/hirise.html#__init__',
+                                    'planetarypy.hirise.RGB_NOMAPCollection.__init__': ( 'api/hirise.html#rgb_nomapcollection.__init__',
                                                                                          'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.RGB_NOMAPCollection.download_collection': ( 'api/hirise.html#download_collection',
+                                    'planetarypy.hirise.RGB_NOMAPCollection.download_collection': ( 'api/hirise.html#rgb_nomapcollection.download_collection',
                                                                                                     'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.RGB_NOMAPCollection.get_urls': ( 'api/hirise.html#get_urls',
+                                    'planetarypy.hirise.RGB_NOMAPCollection.get_urls': ( 'api/hirise.html#rgb_nomapcollection.get_urls',
                                                                                          'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.RGB_NOMAPCollection.local_paths': ( 'api/hirise.html#local_paths',
+                                    'planetarypy.hirise.RGB_NOMAPCollection.local_paths': ( 'api/hirise.html#rgb_nomapcollection.local_paths',
                                                                                             'planetarypy/hirise.py'),
                                     'planetarypy.hirise.RedMosaic': ('api/hirise.html#redmosaic', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.RedMosaic.__init__': ('api/hirise.html#__init__', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.RedMosaic.fname': ('api/hirise.html#fname', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.RedMosaic.local_path': ('api/hirise.html#local_path', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.RedMosaic.__init__': ( 'api/hirise.html#redmosaic.__init__',
+                                                                               'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.RedMosaic.fname': ('api/hirise.html#redmosaic.fname', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.RedMosaic.local_path': ( 'api/hirise.html#redmosaic.local_path',
+                                                                                 'planetarypy/hirise.py'),
                                     'planetarypy.hirise.SOURCE_PRODUCT': ('api/hirise.html#source_product', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.__getattr__': ( 'api/hirise.html#__getattr__',
+                                    'planetarypy.hirise.SOURCE_PRODUCT.__getattr__': ( 'api/hirise.html#source_product.__getattr__',
                                                                                        'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.__init__': ('api/hirise.html#__init__', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.__repr__': ('api/hirise.html#__repr__', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.__str__': ('api/hirise.html#__str__', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT._parse_ccd': ('api/hirise.html#_parse_ccd', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.ccd': ('api/hirise.html#ccd', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.ccdno': ('api/hirise.html#ccdno', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.channel': ('api/hirise.html#channel', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.color': ('api/hirise.html#color', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.download': ('api/hirise.html#download', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.fname': ('api/hirise.html#fname', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.local_cube': ('api/hirise.html#local_cube', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.local_path': ('api/hirise.html#local_path', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.remote_path': ( 'api/hirise.html#remote_path',
+                                    'planetarypy.hirise.SOURCE_PRODUCT.__init__': ( 'api/hirise.html#source_product.__init__',
+                                                                                    'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT.__repr__': ( 'api/hirise.html#source_product.__repr__',
+                                                                                    'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT.__str__': ( 'api/hirise.html#source_product.__str__',
+                                                                                   'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT._parse_ccd': ( 'api/hirise.html#source_product._parse_ccd',
+                                                                                      'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT.ccd': ( 'api/hirise.html#source_product.ccd',
+                                                                               'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT.ccdno': ( 'api/hirise.html#source_product.ccdno',
+                                                                                 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT.channel': ( 'api/hirise.html#source_product.channel',
+                                                                                   'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT.color': ( 'api/hirise.html#source_product.color',
+                                                                                 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT.download': ( 'api/hirise.html#source_product.download',
+                                                                                    'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT.fname': ( 'api/hirise.html#source_product.fname',
+                                                                                 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT.local_cube': ( 'api/hirise.html#source_product.local_cube',
+                                                                                      'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT.local_path': ( 'api/hirise.html#source_product.local_path',
+                                                                                      'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT.remote_path': ( 'api/hirise.html#source_product.remote_path',
                                                                                        'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.spid': ('api/hirise.html#spid', 'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.stitched_cube_name': ( 'api/hirise.html#stitched_cube_name',
+                                    'planetarypy.hirise.SOURCE_PRODUCT.spid': ( 'api/hirise.html#source_product.spid',
+                                                                                'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT.stitched_cube_name': ( 'api/hirise.html#source_product.stitched_cube_name',
                                                                                               'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.stitched_cube_path': ( 'api/hirise.html#stitched_cube_path',
+                                    'planetarypy.hirise.SOURCE_PRODUCT.stitched_cube_path': ( 'api/hirise.html#source_product.stitched_cube_path',
                                                                                               'planetarypy/hirise.py'),
-                                    'planetarypy.hirise.SOURCE_PRODUCT.url': ('api/hirise.html#url', 'planetarypy/hirise.py')},
-            'planetarypy.pds.apps': { 'planetarypy.pds.apps.find_indexes': ('api/pds.apps.html#find_indexes', 'planetarypy/pds/apps.py'),
+                                    'planetarypy.hirise.SOURCE_PRODUCT.url': ( 'api/hirise.html#source_product.url',
+                                                                               'planetarypy/hirise.py')},
+            'planetarypy.metrics': { 'planetarypy.metrics.Histogram': ('api/metrics.html#histogram', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.Histogram.__init__': ( 'api/metrics.html#histogram.__init__',
+                                                                                 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.Histogram.cumulative': ( 'api/metrics.html#histogram.cumulative',
+                                                                                   'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.Histogram.observe': ( 'api/metrics.html#histogram.observe',
+                                                                                'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.Registry': ('api/metrics.html#registry', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.Registry.__init__': ( 'api/metrics.html#registry.__init__',
+                                                                                'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.Registry.describe': ( 'api/metrics.html#registry.describe',
+                                                                                'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.Registry.inc': ('api/metrics.html#registry.inc', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.Registry.observe': ( 'api/metrics.html#registry.observe',
+                                                                               'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.Registry.reset': ('api/metrics.html#registry.reset', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.Registry.snapshot': ( 'api/metrics.html#registry.snapshot',
+                                                                                'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.Registry.to_prometheus': ( 'api/metrics.html#registry.to_prometheus',
+                                                                                     'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.Registry.write': ('api/metrics.html#registry.write', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics._labels': ('api/metrics.html#_labels', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics._number': ('api/metrics.html#_number', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics._timed': ('api/metrics.html#_timed', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.cache_access': ('api/metrics.html#cache_access', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.disable': ('api/metrics.html#disable', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.enable': ('api/metrics.html#enable', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.inc': ('api/metrics.html#inc', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.observe': ('api/metrics.html#observe', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.snapshot': ('api/metrics.html#snapshot', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.start_exporter': ('api/metrics.html#start_exporter', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.timer': ('api/metrics.html#timer', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.track_bytes': ('api/metrics.html#track_bytes', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.track_parse': ('api/metrics.html#track_parse', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.track_response': ('api/metrics.html#track_response', 'planetarypy/metrics.py'),
+                                     'planetarypy.metrics.write': ('api/metrics.html#write', 'planetarypy/metrics.py')},
+            'planetarypy.pds.apps': { 'planetarypy.pds.apps._check_all': ('api/pds.apps.html#_check_all', 'planetarypy/pds/apps.py'),
+                                      'planetarypy.pds.apps._check_index': ('api/pds.apps.html#_check_index', 'planetarypy/pds/apps.py'),
+                                      'planetarypy.pds.apps.check_indexes': ('api/pds.apps.html#check_indexes', 'planetarypy/pds/apps.py'),
+                                      'planetarypy.pds.apps.find_indexes': ('api/pds.apps.html#find_indexes', 'planetarypy/pds/apps.py'),
                                       'planetarypy.pds.apps.find_instruments': ( 'api/pds.apps.html#find_instruments',
                                                                                  'planetarypy/pds/apps.py'),
-                                      'planetarypy.pds.apps.get_index': ('api/pds.apps.html#get_index', 'planetarypy/pds/apps.py')},
+                                      'planetarypy.pds.apps.get_index': ('api/pds.apps.html#get_index', 'planetarypy/pds/apps.py'),
+                                      'planetarypy.pds.apps.list_all_indexes': ( 'api/pds.apps.html#list_all_indexes',
+                                                                                 'planetarypy/pds/apps.py'),
+                                      'planetarypy.pds.apps.pds_index_refresh': ( 'api/pds.apps.html#pds_index_refresh',
+                                                                                  'planetarypy/pds/apps.py'),
+                                      'planetarypy.pds.apps.refresh_indexes': ( 'api/pds.apps.html#refresh_indexes',
+                                                                                'planetarypy/pds/apps.py')},
             'planetarypy.pds.crism_index': { 'planetarypy.pds.crism_index.MTRDRIndex': ( 'api/pds.crism_index.html#mtrdrindex',
                                                                                          'planetarypy/pds/crism_index.py'),
-                                             'planetarypy.pds.crism_index.MTRDRIndex.__init__': ( 'api/pds.crism_index.html#__init__',
+                                             'planetarypy.pds.crism_index.MTRDRIndex.__init__': ( 'api/pds.crism_index.html#mtrdrindex.__init__',
                                                                                                   'planetarypy/pds/crism_index.py')},
             'planetarypy.pds.ctx_index': { 'planetarypy.pds.ctx_index.CTXIndex': ( 'api/pds.ctx_index.html#ctxindex',
                                                                                    'planetarypy/pds/ctx_index.py'),
-                                           'planetarypy.pds.ctx_index.CTXIndex.__init__': ( 'api/pds.ctx_index.html#__init__',
+                                           'planetarypy.pds.ctx_index.CTXIndex.__init__': ( 'api/pds.ctx_index.html#ctxindex.__init__',
                                                                                             'planetarypy/pds/ctx_index.py'),
-                                           'planetarypy.pds.ctx_index.CTXIndex.latest_index_label_url': ( 'api/pds.ctx_index.html#latest_index_label_url',
+                                           'planetarypy.pds.ctx_index.CTXIndex.latest_index_label_url': ( 'api/pds.ctx_index.html#ctxindex.latest_index_label_url',
                                                                                                           'planetarypy/pds/ctx_index.py'),
-                                           'planetarypy.pds.ctx_index.CTXIndex.latest_release_folder': ( 'api/pds.ctx_index.html#latest_release_folder',
+                                           'planetarypy.pds.ctx_index.CTXIndex.latest_release_folder': ( 'api/pds.ctx_index.html#ctxindex.latest_release_folder',
                                                                                                          'planetarypy/pds/ctx_index.py'),
-                                           'planetarypy.pds.ctx_index.CTXIndex.latest_release_number': ( 'api/pds.ctx_index.html#latest_release_number',
+                                           'planetarypy.pds.ctx_index.CTXIndex.latest_release_number': ( 'api/pds.ctx_index.html#ctxindex.latest_release_number',
                                                                                                          'planetarypy/pds/ctx_index.py'),
-                                           'planetarypy.pds.ctx_index.CTXIndex.volumes_table': ( 'api/pds.ctx_index.html#volumes_table',
+                                           'planetarypy.pds.ctx_index.CTXIndex.volumes_table': ( 'api/pds.ctx_index.html#ctxindex.volumes_table',
                                                                                                  'planetarypy/pds/ctx_index.py')},
+            'planetarypy.pds.footprints': { 'planetarypy.pds.footprints.FootprintIndex': ( 'api/pds.footprints.html#footprintindex',
+                                                                                           'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.FootprintIndex.__init__': ( 'api/pds.footprints.html#footprintindex.__init__',
+                                                                                                    'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.FootprintIndex.__len__': ( 'api/pds.footprints.html#footprintindex.__len__',
+                                                                                                   'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.FootprintIndex.__repr__': ( 'api/pds.footprints.html#footprintindex.__repr__',
+                                                                                                    'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.FootprintIndex._build_levels': ( 'api/pds.footprints.html#footprintindex._build_levels',
+                                                                                                         'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.FootprintIndex._candidates': ( 'api/pds.footprints.html#footprintindex._candidates',
+                                                                                                       'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.FootprintIndex._polar': ( 'api/pds.footprints.html#footprintindex._polar',
+                                                                                                  'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.FootprintIndex._str_order': ( 'api/pds.footprints.html#footprintindex._str_order',
+                                                                                                      'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.FootprintIndex.from_df': ( 'api/pds.footprints.html#footprintindex.from_df',
+                                                                                                   'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.FootprintIndex.load': ( 'api/pds.footprints.html#footprintindex.load',
+                                                                                                'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.FootprintIndex.query_bbox': ( 'api/pds.footprints.html#footprintindex.query_bbox',
+                                                                                                      'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.FootprintIndex.query_point': ( 'api/pds.footprints.html#footprintindex.query_point',
+                                                                                                       'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.FootprintIndex.query_polygon': ( 'api/pds.footprints.html#footprintindex.query_polygon',
+                                                                                                         'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.FootprintIndex.save': ( 'api/pds.footprints.html#footprintindex.save',
+                                                                                                'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints._edges_cross': ( 'api/pds.footprints.html#_edges_cross',
+                                                                                         'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints._points_in_polygon': ( 'api/pds.footprints.html#_points_in_polygon',
+                                                                                               'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints._to_plane': ( 'api/pds.footprints.html#_to_plane',
+                                                                                      'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.find_corner_columns': ( 'api/pds.footprints.html#find_corner_columns',
+                                                                                                'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.footprint_boxes': ( 'api/pds.footprints.html#footprint_boxes',
+                                                                                            'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.footprint_path': ( 'api/pds.footprints.html#footprint_path',
+                                                                                           'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.get_footprint_index': ( 'api/pds.footprints.html#get_footprint_index',
+                                                                                                'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.polar_caps': ( 'api/pds.footprints.html#polar_caps',
+                                                                                       'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.polygons_intersect': ( 'api/pds.footprints.html#polygons_intersect',
+                                                                                               'planetarypy/pds/footprints.py'),
+                                            'planetarypy.pds.footprints.unwrap_lons': ( 'api/pds.footprints.html#unwrap_lons',
+                                                                                        'planetarypy/pds/footprints.py')},
             'planetarypy.pds.indexes': { 'planetarypy.pds.indexes.Index': ('api/pds.indexes.html#index', 'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.__init__': ( 'api/pds.indexes.html#__init__',
+                                         'planetarypy.pds.indexes.Index.__init__': ( 'api/pds.indexes.html#index.__init__',
                                                                                      'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.__repr__': ( 'api/pds.indexes.html#__repr__',
+                                         'planetarypy.pds.indexes.Index.__repr__': ( 'api/pds.indexes.html#index.__repr__',
                                                                                      'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.__str__': ( 'api/pds.indexes.html#__str__',
+                                         'planetarypy.pds.indexes.Index.__str__': ( 'api/pds.indexes.html#index.__str__',
                                                                                     'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.convert_to_parquet': ( 'api/pds.indexes.html#convert_to_parquet',
+                                         'planetarypy.pds.indexes.Index._download_all': ( 'api/pds.indexes.html#index._download_all',
+                                                                                          'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.arrow_cache': ( 'api/pds.indexes.html#index.arrow_cache',
+                                                                                        'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.check_remote': ( 'api/pds.indexes.html#index.check_remote',
+                                                                                         'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.convert_to_parquet': ( 'api/pds.indexes.html#index.convert_to_parquet',
                                                                                                'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.download': ( 'api/pds.indexes.html#index.download',
                                                                                      'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.index_name': ( 'api/pds.indexes.html#index_name',
+                                         'planetarypy.pds.indexes.Index.download_increment': ( 'api/pds.indexes.html#index.download_increment',
+                                                                                               'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.index_name': ( 'api/pds.indexes.html#index.index_name',
                                                                                        'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.instrument': ( 'api/pds.indexes.html#instrument',
+                                         'planetarypy.pds.indexes.Index.instrument': ( 'api/pds.indexes.html#index.instrument',
                                                                                        'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.instrument_key': ( 'api/pds.indexes.html#instrument_key',
+                                         'planetarypy.pds.indexes.Index.instrument_key': ( 'api/pds.indexes.html#index.instrument_key',
                                                                                            'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.isotimestamp': ( 'api/pds.indexes.html#isotimestamp',
+                                         'planetarypy.pds.indexes.Index.is_cumulative': ( 'api/pds.indexes.html#index.is_cumulative',
+                                                                                          'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.isotimestamp': ( 'api/pds.indexes.html#index.isotimestamp',
                                                                                          'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.isupper': ( 'api/pds.indexes.html#isupper',
+                                         'planetarypy.pds.indexes.Index.isupper': ( 'api/pds.indexes.html#index.isupper',
                                                                                     'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.key_tokens': ( 'api/pds.indexes.html#key_tokens',
+                                         'planetarypy.pds.indexes.Index.key_index': ( 'api/pds.indexes.html#index.key_index',
+                                                                                      'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.key_tokens': ( 'api/pds.indexes.html#index.key_tokens',
                                                                                        'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.label': ( 'api/pds.indexes.html#label',
+                                         'planetarypy.pds.indexes.Index.label': ( 'api/pds.indexes.html#index.label',
                                                                                   'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.label_filename': ( 'api/pds.indexes.html#label_filename',
+                                         'planetarypy.pds.indexes.Index.label_filename': ( 'api/pds.indexes.html#index.label_filename',
                                                                                            'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.local_dir': ( 'api/pds.indexes.html#local_dir',
+                                         'planetarypy.pds.indexes.Index.local_arrow_path': ( 'api/pds.indexes.html#index.local_arrow_path',
+                                                                                             'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.local_dataset_path': ( 'api/pds.indexes.html#index.local_dataset_path',
+                                                                                               'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.local_dir': ( 'api/pds.indexes.html#index.local_dir',
                                                                                       'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.local_label_path': ( 'api/pds.indexes.html#local_label_path',
+                                         'planetarypy.pds.indexes.Index.local_label_path': ( 'api/pds.indexes.html#index.local_label_path',
                                                                                              'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.local_parq_path': ( 'api/pds.indexes.html#local_parq_path',
+                                         'planetarypy.pds.indexes.Index.local_parq_path': ( 'api/pds.indexes.html#index.local_parq_path',
                                                                                             'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.local_table_path': ( 'api/pds.indexes.html#local_table_path',
+                                         'planetarypy.pds.indexes.Index.local_table_path': ( 'api/pds.indexes.html#index.local_table_path',
                                                                                              'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.mission': ( 'api/pds.indexes.html#mission',
+                                         'planetarypy.pds.indexes.Index.lookup': ( 'api/pds.indexes.html#index.lookup',
+                                                                                   'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.mission': ( 'api/pds.indexes.html#index.mission',
                                                                                     'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.mission_key': ( 'api/pds.indexes.html#mission_key',
+                                         'planetarypy.pds.indexes.Index.mission_key': ( 'api/pds.indexes.html#index.mission_key',
                                                                                         'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.parquet': ( 'api/pds.indexes.html#parquet',
+                                         'planetarypy.pds.indexes.Index.parquet': ( 'api/pds.indexes.html#index.parquet',
                                                                                     'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.parse_key': ( 'api/pds.indexes.html#index.parse_key',
                                                                                       'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.read_index_data': ( 'api/pds.indexes.html#read_index_data',
+                                         'planetarypy.pds.indexes.Index.partitioning': ( 'api/pds.indexes.html#index.partitioning',
+                                                                                         'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.query_time': ( 'api/pds.indexes.html#index.query_time',
+                                                                                       'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.read_arrow': ( 'api/pds.indexes.html#index.read_arrow',
+                                                                                       'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.read_index_data': ( 'api/pds.indexes.html#index.read_index_data',
                                                                                             'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.remote_timestamp': ( 'api/pds.indexes.html#remote_timestamp',
+                                         'planetarypy.pds.indexes.Index.read_parquet': ( 'api/pds.indexes.html#index.read_parquet',
+                                                                                         'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.remote_timestamp': ( 'api/pds.indexes.html#index.remote_timestamp',
                                                                                              'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.set_url': ( 'api/pds.indexes.html#set_url',
+                                         'planetarypy.pds.indexes.Index.set_url': ( 'api/pds.indexes.html#index.set_url',
                                                                                     'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.tab_extension': ( 'api/pds.indexes.html#tab_extension',
+                                         'planetarypy.pds.indexes.Index.tab_extension': ( 'api/pds.indexes.html#index.tab_extension',
                                                                                           'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.table_filename': ( 'api/pds.indexes.html#table_filename',
+                                         'planetarypy.pds.indexes.Index.table_filename': ( 'api/pds.indexes.html#index.table_filename',
                                                                                            'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.table_url': ( 'api/pds.indexes.html#table_url',
+                                         'planetarypy.pds.indexes.Index.table_url': ( 'api/pds.indexes.html#index.table_url',
                                                                                       'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.time_column': ( 'api/pds.indexes.html#index.time_column',
+                                                                                        'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.time_index': ( 'api/pds.indexes.html#index.time_index',
+                                                                                       'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.update_available': ( 'api/pds.indexes.html#index.update_available',
                                                                                              'planetarypy/pds/indexes.py'),
-                                         'planetarypy.pds.indexes.Index.update_timestamp': ( 'api/pds.indexes.html#update_timestamp',
+                                         'planetarypy.pds.indexes.Index.update_timestamp': ( 'api/pds.indexes.html#index.update_timestamp',
                                                                                              'planetarypy/pds/indexes.py')},
             'planetarypy.pds.lroc_index': { 'planetarypy.pds.lroc_index.LROCIndex': ( 'api/pds.lroc_index.html#lrocindex',
                                                                                       'planetarypy/pds/lroc_index.py'),
-                                            'planetarypy.pds.lroc_index.LROCIndex.__init__': ( 'api/pds.lroc_index.html#__init__',
+                                            'planetarypy.pds.lroc_index.LROCIndex.__init__': ( 'api/pds.lroc_index.html#lrocindex.__init__',
                                                                                                'planetarypy/pds/lroc_index.py'),
-                                            'planetarypy.pds.lroc_index.LROCIndex.latest_index_label_url': ( 'api/pds.lroc_index.html#latest_index_label_url',
+                                            'planetarypy.pds.lroc_index.LROCIndex.latest_index_label_url': ( 'api/pds.lroc_index.html#lrocindex.latest_index_label_url',
                                                                                                              'planetarypy/pds/lroc_index.py'),
-                                            'planetarypy.pds.lroc_index.LROCIndex.latest_release_folder': ( 'api/pds.lroc_index.html#latest_release_folder',
+                                            'planetarypy.pds.lroc_index.LROCIndex.latest_release_folder': ( 'api/pds.lroc_index.html#lrocindex.latest_release_folder',
                                                                                                             'planetarypy/pds/lroc_index.py'),
-                                            'planetarypy.pds.lroc_index.LROCIndex.latest_release_number': ( 'api/pds.lroc_index.html#latest_release_number',
+                                            'planetarypy.pds.lroc_index.LROCIndex.latest_release_number': ( 'api/pds.lroc_index.html#lrocindex.latest_release_number',
                                                                                                             'planetarypy/pds/lroc_index.py'),
-                                            'planetarypy.pds.lroc_index.LROCIndex.volumes_table': ( 'api/pds.lroc_index.html#volumes_table',
+                                            'planetarypy.pds.lroc_index.LROCIndex.volumes_table': ( 'api/pds.lroc_index.html#lrocindex.volumes_table',
                                                                                                     'planetarypy/pds/lroc_index.py')},
             'planetarypy.pds.opusapi': { 'planetarypy.pds.opusapi.OPUS': ('api/pds.opusapi.html#opus', 'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.__init__': ( 'api/pds.opusapi.html#__init__',
+                                         'planetarypy.pds.opusapi.OPUS.__init__': ( 'api/pds.opusapi.html#opus.__init__',
                                                                                     'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS._get_time_query': ( 'api/pds.opusapi.html#_get_time_query',
+                                         'planetarypy.pds.opusapi.OPUS._get_time_query': ( 'api/pds.opusapi.html#opus._get_time_query',
                                                                                            'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.create_files_request': ( 'api/pds.opusapi.html#create_files_request',
+                                         'planetarypy.pds.opusapi.OPUS._read_cache': ( 'api/pds.opusapi.html#opus._read_cache',
+                                                                                       'planetarypy/pds/opusapi.py'),
+                                         'planetarypy.pds.opusapi.OPUS._write_cache': ( 'api/pds.opusapi.html#opus._write_cache',
+                                                                                        'planetarypy/pds/opusapi.py'),
+                                         'planetarypy.pds.opusapi.OPUS.cache_key': ( 'api/pds.opusapi.html#opus.cache_key',
+                                                                                     'planetarypy/pds/opusapi.py'),
+                                         'planetarypy.pds.opusapi.OPUS.create_files_request': ( 'api/pds.opusapi.html#opus.create_files_request',
                                                                                                 'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.create_images_request': ( 'api/pds.opusapi.html#create_images_request',
+                                         'planetarypy.pds.opusapi.OPUS.create_images_request': ( 'api/pds.opusapi.html#opus.create_images_request',
                                                                                                  'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.create_request_with_query': ( 'api/pds.opusapi.html#create_request_with_query',
+                                         'planetarypy.pds.opusapi.OPUS.create_request_with_query': ( 'api/pds.opusapi.html#opus.create_request_with_query',
                                                                                                      'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.download_previews': ( 'api/pds.opusapi.html#download_previews',
+                                         'planetarypy.pds.opusapi.OPUS.download_previews': ( 'api/pds.opusapi.html#opus.download_previews',
                                                                                              'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.download_results': ( 'api/pds.opusapi.html#download_results',
+                                         'planetarypy.pds.opusapi.OPUS.download_results': ( 'api/pds.opusapi.html#opus.download_results',
                                                                                             'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.get_between_resolutions': ( 'api/pds.opusapi.html#get_between_resolutions',
+                                         'planetarypy.pds.opusapi.OPUS.fetch': ( 'api/pds.opusapi.html#opus.fetch',
+                                                                                 'planetarypy/pds/opusapi.py'),
+                                         'planetarypy.pds.opusapi.OPUS.get_between_resolutions': ( 'api/pds.opusapi.html#opus.get_between_resolutions',
                                                                                                    'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.get_between_times': ( 'api/pds.opusapi.html#get_between_times',
+                                         'planetarypy.pds.opusapi.OPUS.get_between_times': ( 'api/pds.opusapi.html#opus.get_between_times',
                                                                                              'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.get_radial_res_query': ( 'api/pds.opusapi.html#get_radial_res_query',
+                                         'planetarypy.pds.opusapi.OPUS.get_radial_res_query': ( 'api/pds.opusapi.html#opus.get_radial_res_query',
                                                                                                 'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.get_volume_id': ( 'api/pds.opusapi.html#get_volume_id',
+                                         'planetarypy.pds.opusapi.OPUS.get_volume_id': ( 'api/pds.opusapi.html#opus.get_volume_id',
                                                                                          'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.query_image_id': ( 'api/pds.opusapi.html#query_image_id',
+                                         'planetarypy.pds.opusapi.OPUS.query_image_id': ( 'api/pds.opusapi.html#opus.query_image_id',
                                                                                           'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.response': ( 'api/pds.opusapi.html#response',
+                                         'planetarypy.pds.opusapi.OPUS.query_image_ids': ( 'api/pds.opusapi.html#opus.query_image_ids',
+                                                                                           'planetarypy/pds/opusapi.py'),
+                                         'planetarypy.pds.opusapi.OPUS.response': ( 'api/pds.opusapi.html#opus.response',
                                                                                     'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.show_images': ( 'api/pds.opusapi.html#show_images',
+                                         'planetarypy.pds.opusapi.OPUS.show_images': ( 'api/pds.opusapi.html#opus.show_images',
                                                                                        'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUS.unpack_json_response': ( 'api/pds.opusapi.html#unpack_json_response',
+                                         'planetarypy.pds.opusapi.OPUS.unpack_json_response': ( 'api/pds.opusapi.html#opus.unpack_json_response',
                                                                                                 'planetarypy/pds/opusapi.py'),
+                                         'planetarypy.pds.opusapi.OPUS.url_for': ( 'api/pds.opusapi.html#opus.url_for',
+                                                                                   'planetarypy/pds/opusapi.py'),
                                          'planetarypy.pds.opusapi.OPUSImageURL': ( 'api/pds.opusapi.html#opusimageurl',
                                                                                    'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSImageURL.__init__': ( 'api/pds.opusapi.html#__init__',
+                                         'planetarypy.pds.opusapi.OPUSImageURL.__init__': ( 'api/pds.opusapi.html#opusimageurl.__init__',
                                                                                             'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSImageURL.__repr__': ( 'api/pds.opusapi.html#__repr__',
+                                         'planetarypy.pds.opusapi.OPUSImageURL.__repr__': ( 'api/pds.opusapi.html#opusimageurl.__repr__',
                                                                                             'planetarypy/pds/opusapi.py'),
                                          'planetarypy.pds.opusapi.OPUSObsID': ( 'api/pds.opusapi.html#opusobsid',
                                                                                 'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSObsID.__init__': ( 'api/pds.opusapi.html#__init__',
+                                         'planetarypy.pds.opusapi.OPUSObsID.__init__': ( 'api/pds.opusapi.html#opusobsid.__init__',
                                                                                          'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSObsID.__repr__': ( 'api/pds.opusapi.html#__repr__',
+                                         'planetarypy.pds.opusapi.OPUSObsID.__repr__': ( 'api/pds.opusapi.html#opusobsid.__repr__',
                                                                                          'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSObsID._get_img_url': ( 'api/pds.opusapi.html#_get_img_url',
+                                         'planetarypy.pds.opusapi.OPUSObsID._get_img_url': ( 'api/pds.opusapi.html#opusobsid._get_img_url',
                                                                                              'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSObsID.all_urls': ( 'api/pds.opusapi.html#all_urls',
+                                         'planetarypy.pds.opusapi.OPUSObsID.all_urls': ( 'api/pds.opusapi.html#opusobsid.all_urls',
                                                                                          'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSObsID.calib_urls': ( 'api/pds.opusapi.html#calib_urls',
+                                         'planetarypy.pds.opusapi.OPUSObsID.calib_urls': ( 'api/pds.opusapi.html#opusobsid.calib_urls',
                                                                                            'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSObsID.full_img_url': ( 'api/pds.opusapi.html#full_img_url',
+                                         'planetarypy.pds.opusapi.OPUSObsID.full_img_url': ( 'api/pds.opusapi.html#opusobsid.full_img_url',
                                                                                              'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSObsID.get_meta_data': ( 'api/pds.opusapi.html#get_meta_data',
+                                         'planetarypy.pds.opusapi.OPUSObsID.get_meta_data': ( 'api/pds.opusapi.html#opusobsid.get_meta_data',
                                                                                               'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSObsID.img_id': ( 'api/pds.opusapi.html#img_id',
+                                         'planetarypy.pds.opusapi.OPUSObsID.img_id': ( 'api/pds.opusapi.html#opusobsid.img_id',
                                                                                        'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSObsID.medium_img_url': ( 'api/pds.opusapi.html#medium_img_url',
+                                         'planetarypy.pds.opusapi.OPUSObsID.medium_img_url': ( 'api/pds.opusapi.html#opusobsid.medium_img_url',
                                                                                                'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSObsID.raw_urls': ( 'api/pds.opusapi.html#raw_urls',
+                                         'planetarypy.pds.opusapi.OPUSObsID.raw_urls': ( 'api/pds.opusapi.html#opusobsid.raw_urls',
                                                                                          'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSObsID.small_img_url': ( 'api/pds.opusapi.html#small_img_url',
+                                         'planetarypy.pds.opusapi.OPUSObsID.small_img_url': ( 'api/pds.opusapi.html#opusobsid.small_img_url',
+                                                                                              'planetarypy/pds/opusapi.py'),
+                                         'planetarypy.pds.opusapi.OPUSObsID.thumb_img_url': ( 'api/pds.opusapi.html#opusobsid.thumb_img_url',
                                                                                               'planetarypy/pds/opusapi.py'),
-                                         'planetarypy.pds.opusapi.OPUSObsID.thumb_img_url': ( 'api/pds.opusapi.html#thumb_img_url',
-                                                                                              'planetarypy/pds/opusapi.py')},
+                                         'planetarypy.pds.opusapi._matches': ( 'api/pds.opusapi.html#_matches',
+                                                                               'planetarypy/pds/opusapi.py'),
+                                         'planetarypy.pds.opusapi.get_session': ( 'api/pds.opusapi.html#get_session',
+                                                                                  'planetarypy/pds/opusapi.py')},
+            'planetarypy.pds.synthetic': { 'planetarypy.pds.synthetic.PDSServer': ( 'api/pds.synthetic.html#pdsserver',
+                                                                                    'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.PDSServer.__enter__': ( 'api/pds.synthetic.html#pdsserver.__enter__',
+                                                                                              'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.PDSServer.__exit__': ( 'api/pds.synthetic.html#pdsserver.__exit__',
+                                                                                             'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.PDSServer.__init__': ( 'api/pds.synthetic.html#pdsserver.__init__',
+                                                                                             'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.PDSServer.stop': ( 'api/pds.synthetic.html#pdsserver.stop',
+                                                                                         'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.RangeRequestHandler': ( 'api/pds.synthetic.html#rangerequesthandler',
+                                                                                              'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.RangeRequestHandler.copyfile': ( 'api/pds.synthetic.html#rangerequesthandler.copyfile',
+                                                                                                       'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.RangeRequestHandler.log_message': ( 'api/pds.synthetic.html#rangerequesthandler.log_message',
+                                                                                                          'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.RangeRequestHandler.not_modified': ( 'api/pds.synthetic.html#rangerequesthandler.not_modified',
+                                                                                                           'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.RangeRequestHandler.send_head': ( 'api/pds.synthetic.html#rangerequesthandler.send_head',
+                                                                                                        'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic._doys': ( 'api/pds.synthetic.html#_doys',
+                                                                                'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic._field': ( 'api/pds.synthetic.html#_field',
+                                                                                 'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.corners': ( 'api/pds.synthetic.html#corners',
+                                                                                  'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.ctx_edr_values': ( 'api/pds.synthetic.html#ctx_edr_values',
+                                                                                         'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.ctx_img_label': ( 'api/pds.synthetic.html#ctx_img_label',
+                                                                                        'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.hirise_common': ( 'api/pds.synthetic.html#hirise_common',
+                                                                                        'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.hirise_edr_values': ( 'api/pds.synthetic.html#hirise_edr_values',
+                                                                                            'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.hirise_observations': ( 'api/pds.synthetic.html#hirise_observations',
+                                                                                              'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.hirise_rdr_values': ( 'api/pds.synthetic.html#hirise_rdr_values',
+                                                                                            'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.index_label': ( 'api/pds.synthetic.html#index_label',
+                                                                                      'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.iss_index_values': ( 'api/pds.synthetic.html#iss_index_values',
+                                                                                           'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.layout_values': ( 'api/pds.synthetic.html#layout_values',
+                                                                                        'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.lroc_edr_values': ( 'api/pds.synthetic.html#lroc_edr_values',
+                                                                                          'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.mro_orbits': ( 'api/pds.synthetic.html#mro_orbits',
+                                                                                     'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.orbit_folder': ( 'api/pds.synthetic.html#orbit_folder',
+                                                                                       'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.pds_times': ( 'api/pds.synthetic.html#pds_times',
+                                                                                    'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.pick': ( 'api/pds.synthetic.html#pick',
+                                                                               'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.temporary_storage': ( 'api/pds.synthetic.html#temporary_storage',
+                                                                                            'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.uniform': ( 'api/pds.synthetic.html#uniform',
+                                                                                  'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.uvis_index_values': ( 'api/pds.synthetic.html#uvis_index_values',
+                                                                                            'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.write_ctx_edrs': ( 'api/pds.synthetic.html#write_ctx_edrs',
+                                                                                         'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.write_ctx_img': ( 'api/pds.synthetic.html#write_ctx_img',
+                                                                                        'planetarypy/pds/synthetic.py'),
+                                           'planetarypy.pds.synthetic.write_index': ( 'api/pds.synthetic.html#write_index',
+                                                                                      'planetarypy/pds/synthetic.py')},
             'planetarypy.pds.utils': { 'planetarypy.pds.utils.IndexLabel': ('api/pds.utils.html#indexlabel', 'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.IndexLabel.__init__': ( 'api/pds.utils.html#__init__',
+                                       'planetarypy.pds.utils.IndexLabel.__init__': ( 'api/pds.utils.html#indexlabel.__init__',
                                                                                       'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.IndexLabel.colnames': ( 'api/pds.utils.html#colnames',
+                                       'planetarypy.pds.utils.IndexLabel.colnames': ( 'api/pds.utils.html#indexlabel.colnames',
                                                                                       'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.IndexLabel.colspecs': ( 'api/pds.utils.html#colspecs',
+                                       'planetarypy.pds.utils.IndexLabel.colspecs': ( 'api/pds.utils.html#indexlabel.colspecs',
                                                                                       'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.IndexLabel.columns_dic': ( 'api/pds.utils.html#columns_dic',
+                                       'planetarypy.pds.utils.IndexLabel.columns_dic': ( 'api/pds.utils.html#indexlabel.columns_dic',
                                                                                          'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.IndexLabel.index_path': ( 'api/pds.utils.html#index_path',
+                                       'planetarypy.pds.utils.IndexLabel.compile_schema': ( 'api/pds.utils.html#indexlabel.compile_schema',
+                                                                                            'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.index_path': ( 'api/pds.utils.html#indexlabel.index_path',
                                                                                         'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.IndexLabel.pvl_columns': ( 'api/pds.utils.html#pvl_columns',
+                                       'planetarypy.pds.utils.IndexLabel.load_schema': ( 'api/pds.utils.html#indexlabel.load_schema',
                                                                                          'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.IndexLabel.pvl_lbl': ( 'api/pds.utils.html#pvl_lbl',
+                                       'planetarypy.pds.utils.IndexLabel.pvl_columns': ( 'api/pds.utils.html#indexlabel.pvl_columns',
+                                                                                         'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.pvl_lbl': ( 'api/pds.utils.html#indexlabel.pvl_lbl',
                                                                                      'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.IndexLabel.read_index_data': ( 'api/pds.utils.html#read_index_data',
+                                       'planetarypy.pds.utils.IndexLabel.read_index_data': ( 'api/pds.utils.html#indexlabel.read_index_data',
                                                                                              'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.IndexLabel.table': ('api/pds.utils.html#table', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.record_bytes': ( 'api/pds.utils.html#indexlabel.record_bytes',
+                                                                                          'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.rows': ( 'api/pds.utils.html#indexlabel.rows',
+                                                                                  'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.save_schema': ( 'api/pds.utils.html#indexlabel.save_schema',
+                                                                                         'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.schema_path': ( 'api/pds.utils.html#indexlabel.schema_path',
+                                                                                         'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.table': ( 'api/pds.utils.html#indexlabel.table',
+                                                                                   'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyIndex': ('api/pds.utils.html#keyindex', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyIndex.__init__': ( 'api/pds.utils.html#keyindex.__init__',
+                                                                                    'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyIndex.__len__': ( 'api/pds.utils.html#keyindex.__len__',
+                                                                                   'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyIndex.load': ( 'api/pds.utils.html#keyindex.load',
+                                                                                'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyIndex.query': ( 'api/pds.utils.html#keyindex.query',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyIndex.save': ( 'api/pds.utils.html#keyindex.save',
+                                                                                'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.PVLColumn': ('api/pds.utils.html#pvlcolumn', 'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.PVLColumn.__init__': ( 'api/pds.utils.html#__init__',
+                                       'planetarypy.pds.utils.PVLColumn.__init__': ( 'api/pds.utils.html#pvlcolumn.__init__',
                                                                                      'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.PVLColumn.__repr__': ( 'api/pds.utils.html#__repr__',
+                                       'planetarypy.pds.utils.PVLColumn.__repr__': ( 'api/pds.utils.html#pvlcolumn.__repr__',
                                                                                      'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.PVLColumn.colspecs': ( 'api/pds.utils.html#colspecs',
+                                       'planetarypy.pds.utils.PVLColumn.colspecs': ( 'api/pds.utils.html#pvlcolumn.colspecs',
                                                                                      'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.PVLColumn.decode': ('api/pds.utils.html#decode', 'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.PVLColumn.item_bytes': ( 'api/pds.utils.html#item_bytes',
+                                       'planetarypy.pds.utils.PVLColumn.decode': ( 'api/pds.utils.html#pvlcolumn.decode',
+                                                                                   'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.PVLColumn.item_bytes': ( 'api/pds.utils.html#pvlcolumn.item_bytes',
                                                                                        'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.PVLColumn.item_offset': ( 'api/pds.utils.html#item_offset',
+                                       'planetarypy.pds.utils.PVLColumn.item_offset': ( 'api/pds.utils.html#pvlcolumn.item_offset',
                                                                                         'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.PVLColumn.items': ('api/pds.utils.html#items', 'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.PVLColumn.name': ('api/pds.utils.html#name', 'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.PVLColumn.name_as_list': ( 'api/pds.utils.html#name_as_list',
+                                       'planetarypy.pds.utils.PVLColumn.items': ( 'api/pds.utils.html#pvlcolumn.items',
+                                                                                  'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.PVLColumn.name': ( 'api/pds.utils.html#pvlcolumn.name',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.PVLColumn.name_as_list': ( 'api/pds.utils.html#pvlcolumn.name_as_list',
                                                                                          'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.PVLColumn.start': ('api/pds.utils.html#start', 'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.PVLColumn.stop': ('api/pds.utils.html#stop', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.PVLColumn.start': ( 'api/pds.utils.html#pvlcolumn.start',
+                                                                                  'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.PVLColumn.stop': ( 'api/pds.utils.html#pvlcolumn.stop',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.Partitioning': ( 'api/pds.utils.html#partitioning',
+                                                                               'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.Partitioning.__init__': ( 'api/pds.utils.html#partitioning.__init__',
+                                                                                        'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.Partitioning.__repr__': ( 'api/pds.utils.html#partitioning.__repr__',
+                                                                                        'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.Partitioning.add_column': ( 'api/pds.utils.html#partitioning.add_column',
+                                                                                          'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.Partitioning.available': ( 'api/pds.utils.html#partitioning.available',
+                                                                                         'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.Partitioning.hive': ( 'api/pds.utils.html#partitioning.hive',
+                                                                                    'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.Partitioning.keys': ( 'api/pds.utils.html#partitioning.keys',
+                                                                                    'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.Partitioning.prune': ( 'api/pds.utils.html#partitioning.prune',
+                                                                                     'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.SharedIndex': ('api/pds.utils.html#sharedindex', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.SharedIndex.__init__': ( 'api/pds.utils.html#sharedindex.__init__',
+                                                                                       'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.SharedIndex.__repr__': ( 'api/pds.utils.html#sharedindex.__repr__',
+                                                                                       'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.SharedIndex.attach': ( 'api/pds.utils.html#sharedindex.attach',
+                                                                                     'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.SharedIndex.publish': ( 'api/pds.utils.html#sharedindex.publish',
+                                                                                      'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader': ('api/pds.utils.html#tabreader', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader.__enter__': ( 'api/pds.utils.html#tabreader.__enter__',
+                                                                                      'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader.__exit__': ( 'api/pds.utils.html#tabreader.__exit__',
+                                                                                     'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader.__getitem__': ( 'api/pds.utils.html#tabreader.__getitem__',
+                                                                                        'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader.__init__': ( 'api/pds.utils.html#tabreader.__init__',
+                                                                                     'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader.__len__': ( 'api/pds.utils.html#tabreader.__len__',
+                                                                                    'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader._convert': ( 'api/pds.utils.html#tabreader._convert',
+                                                                                     'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader.close': ( 'api/pds.utils.html#tabreader.close',
+                                                                                  'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader.column_bytes': ( 'api/pds.utils.html#tabreader.column_bytes',
+                                                                                         'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader.decode': ( 'api/pds.utils.html#tabreader.decode',
+                                                                                   'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader.record': ( 'api/pds.utils.html#tabreader.record',
+                                                                                   'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader.row': ( 'api/pds.utils.html#tabreader.row',
+                                                                                'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader.rows': ( 'api/pds.utils.html#tabreader.rows',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabReader.take': ( 'api/pds.utils.html#tabreader.take',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TimeIndex': ('api/pds.utils.html#timeindex', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TimeIndex.__init__': ( 'api/pds.utils.html#timeindex.__init__',
+                                                                                     'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TimeIndex.__len__': ( 'api/pds.utils.html#timeindex.__len__',
+                                                                                    'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TimeIndex.load': ( 'api/pds.utils.html#timeindex.load',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TimeIndex.query': ( 'api/pds.utils.html#timeindex.query',
+                                                                                  'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TimeIndex.save': ( 'api/pds.utils.html#timeindex.save',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._common_type': ( 'api/pds.utils.html#_common_type',
+                                                                               'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._pandas_dtype': ( 'api/pds.utils.html#_pandas_dtype',
+                                                                                'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._parse_tab_range': ( 'api/pds.utils.html#_parse_tab_range',
+                                                                                   'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._records_aligned': ( 'api/pds.utils.html#_records_aligned',
+                                                                                   'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._write_partitions': ( 'api/pds.utils.html#_write_partitions',
+                                                                                    'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.append_to_parquet': ( 'api/pds.utils.html#append_to_parquet',
+                                                                                    'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.convert_times': ( 'api/pds.utils.html#convert_times',
                                                                                 'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.decode_line': ('api/pds.utils.html#decode_line', 'planetarypy/pds/utils.py'),
@@ -580,32 +1037,48 @@ d = { 'settings': { 'branch': 'master',
                                                                                        'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.fix_hirise_edrcumindex': ( 'api/pds.utils.html#fix_hirise_edrcumindex',
                                                                                          'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.index_to_df': ('api/pds.utils.html#index_to_df', 'planetarypy/pds/utils.py')},
+                                       'planetarypy.pds.utils.index_to_df': ('api/pds.utils.html#index_to_df', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.parquet_to_arrow': ( 'api/pds.utils.html#parquet_to_arrow',
+                                                                                   'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.parquet_to_dataset': ( 'api/pds.utils.html#parquet_to_dataset',
+                                                                                     'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.read_arrow_file': ( 'api/pds.utils.html#read_arrow_file',
+                                                                                  'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.read_dataset': ( 'api/pds.utils.html#read_dataset',
+                                                                               'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.read_parquet_rows': ( 'api/pds.utils.html#read_parquet_rows',
+                                                                                    'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.record_ranges': ( 'api/pds.utils.html#record_ranges',
+                                                                                'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.tab_to_parquet': ( 'api/pds.utils.html#tab_to_parquet',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.write_dataset': ( 'api/pds.utils.html#write_dataset',
+                                                                                'planetarypy/pds/utils.py')},
             'planetarypy.spice.kernels': { 'planetarypy.spice.kernels.Subsetter': ( 'api/spice.kernels.html#subsetter',
                                                                                     'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter.__init__': ( 'api/spice.kernels.html#__init__',
+                                           'planetarypy.spice.kernels.Subsetter.__init__': ( 'api/spice.kernels.html#subsetter.__init__',
                                                                                              'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter._concurrent_download': ( 'api/spice.kernels.html#_concurrent_download',
+                                           'planetarypy.spice.kernels.Subsetter._concurrent_download': ( 'api/spice.kernels.html#subsetter._concurrent_download',
                                                                                                          'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter._non_blocking_download': ( 'api/spice.kernels.html#_non_blocking_download',
+                                           'planetarypy.spice.kernels.Subsetter._non_blocking_download': ( 'api/spice.kernels.html#subsetter._non_blocking_download',
                                                                                                            'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter.download_kernels': ( 'api/spice.kernels.html#download_kernels',
+                                           'planetarypy.spice.kernels.Subsetter.download_kernels': ( 'api/spice.kernels.html#subsetter.download_kernels',
                                                                                                      'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter.get_local_path': ( 'api/spice.kernels.html#get_local_path',
+                                           'planetarypy.spice.kernels.Subsetter.get_local_path': ( 'api/spice.kernels.html#subsetter.get_local_path',
                                                                                                    'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter.get_metakernel': ( 'api/spice.kernels.html#get_metakernel',
+                                           'planetarypy.spice.kernels.Subsetter.get_metakernel': ( 'api/spice.kernels.html#subsetter.get_metakernel',
                                                                                                    'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter.initialize': ( 'api/spice.kernels.html#initialize',
+                                           'planetarypy.spice.kernels.Subsetter.initialize': ( 'api/spice.kernels.html#subsetter.initialize',
                                                                                                'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter.kernel_names': ( 'api/spice.kernels.html#kernel_names',
+                                           'planetarypy.spice.kernels.Subsetter.kernel_names': ( 'api/spice.kernels.html#subsetter.kernel_names',
                                                                                                  'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter.payload': ( 'api/spice.kernels.html#payload',
+                                           'planetarypy.spice.kernels.Subsetter.payload': ( 'api/spice.kernels.html#subsetter.payload',
                                                                                             'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter.r': ( 'api/spice.kernels.html#r',
+                                           'planetarypy.spice.kernels.Subsetter.r': ( 'api/spice.kernels.html#subsetter.r',
                                                                                       'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter.start': ( 'api/spice.kernels.html#start',
+                                           'planetarypy.spice.kernels.Subsetter.start': ( 'api/spice.kernels.html#subsetter.start',
                                                                                           'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter.stop': ( 'api/spice.kernels.html#stop',
+                                           'planetarypy.spice.kernels.Subsetter.stop': ( 'api/spice.kernels.html#subsetter.stop',
                                                                                          'planetarypy/spice/kernels.py'),
                                            'planetarypy.spice.kernels.download_generic_kernels': ( 'api/spice.kernels.html#download_generic_kernels',
                                                                                                    'planetarypy/spice/kernels.py'),
@@ -625,144 +1098,146 @@ d = { 'settings': { 'branch': 'master',
                                                                                               'planetarypy/spice/kernels.py')},
             'planetarypy.spice.spicer': { 'planetarypy.spice.spicer.EarthSpicer': ( 'api/spice.spicer.html#earthspicer',
                                                                                     'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.EarthSpicer.__init__': ( 'api/spice.spicer.html#__init__',
+                                          'planetarypy.spice.spicer.EarthSpicer.__init__': ( 'api/spice.spicer.html#earthspicer.__init__',
                                                                                              'planetarypy/spice/spicer.py'),
                                           'planetarypy.spice.spicer.EnceladusSpicer': ( 'api/spice.spicer.html#enceladusspicer',
                                                                                         'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.EnceladusSpicer.__init__': ( 'api/spice.spicer.html#__init__',
+                                          'planetarypy.spice.spicer.EnceladusSpicer.__init__': ( 'api/spice.spicer.html#enceladusspicer.__init__',
                                                                                                  'planetarypy/spice/spicer.py'),
                                           'planetarypy.spice.spicer.IllumAngles': ( 'api/spice.spicer.html#illumangles',
                                                                                     'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.IllumAngles.__init__': ( 'api/spice.spicer.html#__init__',
+                                          'planetarypy.spice.spicer.IllumAngles.__init__': ( 'api/spice.spicer.html#illumangles.__init__',
                                                                                              'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.IllumAngles.__repr__': ( 'api/spice.spicer.html#__repr__',
+                                          'planetarypy.spice.spicer.IllumAngles.__repr__': ( 'api/spice.spicer.html#illumangles.__repr__',
                                                                                              'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.IllumAngles.__str__': ( 'api/spice.spicer.html#__str__',
+                                          'planetarypy.spice.spicer.IllumAngles.__str__': ( 'api/spice.spicer.html#illumangles.__str__',
                                                                                             'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.IllumAngles.demission': ( 'api/spice.spicer.html#demission',
+                                          'planetarypy.spice.spicer.IllumAngles.demission': ( 'api/spice.spicer.html#illumangles.demission',
                                                                                               'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.IllumAngles.dphase': ( 'api/spice.spicer.html#dphase',
+                                          'planetarypy.spice.spicer.IllumAngles.dphase': ( 'api/spice.spicer.html#illumangles.dphase',
                                                                                            'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.IllumAngles.dsolar': ( 'api/spice.spicer.html#dsolar',
+                                          'planetarypy.spice.spicer.IllumAngles.dsolar': ( 'api/spice.spicer.html#illumangles.dsolar',
                                                                                            'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.IllumAngles.fromtuple': ( 'api/spice.spicer.html#fromtuple',
+                                          'planetarypy.spice.spicer.IllumAngles.fromtuple': ( 'api/spice.spicer.html#illumangles.fromtuple',
                                                                                               'planetarypy/spice/spicer.py'),
                                           'planetarypy.spice.spicer.MarsSpicer': ( 'api/spice.spicer.html#marsspicer',
                                                                                    'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.MarsSpicer.__init__': ( 'api/spice.spicer.html#__init__',
+                                          'planetarypy.spice.spicer.MarsSpicer.__init__': ( 'api/spice.spicer.html#marsspicer.__init__',
                                                                                             'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.MarsSpicer.goto': ( 'api/spice.spicer.html#goto',
+                                          'planetarypy.spice.spicer.MarsSpicer.goto': ( 'api/spice.spicer.html#marsspicer.goto',
                                                                                         'planetarypy/spice/spicer.py'),
                                           'planetarypy.spice.spicer.Mars_Ls_now': ( 'api/spice.spicer.html#mars_ls_now',
                                                                                     'planetarypy/spice/spicer.py'),
                                           'planetarypy.spice.spicer.MoonSpicer': ( 'api/spice.spicer.html#moonspicer',
                                                                                    'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.MoonSpicer.Qs': ( 'api/spice.spicer.html#qs',
+                                          'planetarypy.spice.spicer.MoonSpicer.Qs': ( 'api/spice.spicer.html#moonspicer.qs',
                                                                                       'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.MoonSpicer.__init__': ( 'api/spice.spicer.html#__init__',
+                                          'planetarypy.spice.spicer.MoonSpicer.__init__': ( 'api/spice.spicer.html#moonspicer.__init__',
                                                                                             'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.MoonSpicer.albedo_var': ( 'api/spice.spicer.html#albedo_var',
+                                          'planetarypy.spice.spicer.MoonSpicer.albedo_var': ( 'api/spice.spicer.html#moonspicer.albedo_var',
                                                                                               'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.MoonSpicer.time_series': ( 'api/spice.spicer.html#time_series',
+                                          'planetarypy.spice.spicer.MoonSpicer.time_series': ( 'api/spice.spicer.html#moonspicer.time_series',
                                                                                                'planetarypy/spice/spicer.py'),
                                           'planetarypy.spice.spicer.PlutoSpicer': ( 'api/spice.spicer.html#plutospicer',
                                                                                     'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.PlutoSpicer.__init__': ( 'api/spice.spicer.html#__init__',
+                                          'planetarypy.spice.spicer.PlutoSpicer.__init__': ( 'api/spice.spicer.html#plutospicer.__init__',
                                                                                              'planetarypy/spice/spicer.py'),
                                           'planetarypy.spice.spicer.Spicer': ( 'api/spice.spicer.html#spicer',
                                                                                'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.F_aspect': ( 'api/spice.spicer.html#f_aspect',
+                                          'planetarypy.spice.spicer.Spicer.F_aspect': ( 'api/spice.spicer.html#spicer.f_aspect',
                                                                                         'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.F_flat': ( 'api/spice.spicer.html#f_flat',
+                                          'planetarypy.spice.spicer.Spicer.F_flat': ( 'api/spice.spicer.html#spicer.f_flat',
                                                                                       'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.F_tilt': ( 'api/spice.spicer.html#f_tilt',
+                                          'planetarypy.spice.spicer.Spicer.F_tilt': ( 'api/spice.spicer.html#spicer.f_tilt',
                                                                                       'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.__init__': ( 'api/spice.spicer.html#__init__',
+                                          'planetarypy.spice.spicer.Spicer.__init__': ( 'api/spice.spicer.html#spicer.__init__',
                                                                                         'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer._get_flux': ( 'api/spice.spicer.html#_get_flux',
+                                          'planetarypy.spice.spicer.Spicer._get_flux': ( 'api/spice.spicer.html#spicer._get_flux',
                                                                                          'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.advance_time_by': ( 'api/spice.spicer.html#advance_time_by',
+                                          'planetarypy.spice.spicer.Spicer.advance_time_by': ( 'api/spice.spicer.html#spicer.advance_time_by',
                                                                                                'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.aspect': ( 'api/spice.spicer.html#aspect',
+                                          'planetarypy.spice.spicer.Spicer.aspect': ( 'api/spice.spicer.html#spicer.aspect',
                                                                                       'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.body': ( 'api/spice.spicer.html#body',
+                                          'planetarypy.spice.spicer.Spicer.body': ( 'api/spice.spicer.html#spicer.body',
                                                                                     'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.body_to_object': ( 'api/spice.spicer.html#body_to_object',
+                                          'planetarypy.spice.spicer.Spicer.body_to_object': ( 'api/spice.spicer.html#spicer.body_to_object',
                                                                                               'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.center_to_sun': ( 'api/spice.spicer.html#center_to_sun',
+                                          'planetarypy.spice.spicer.Spicer.center_to_sun': ( 'api/spice.spicer.html#spicer.center_to_sun',
                                                                                              'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.coords': ( 'api/spice.spicer.html#coords',
+                                          'planetarypy.spice.spicer.Spicer.coords': ( 'api/spice.spicer.html#spicer.coords',
                                                                                       'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.et': ('api/spice.spicer.html#et', 'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.fluxes_around_equator': ( 'api/spice.spicer.html#fluxes_around_equator',
+                                          'planetarypy.spice.spicer.Spicer.et': ( 'api/spice.spicer.html#spicer.et',
+                                                                                  'planetarypy/spice/spicer.py'),
+                                          'planetarypy.spice.spicer.Spicer.fluxes_around_equator': ( 'api/spice.spicer.html#spicer.fluxes_around_equator',
                                                                                                      'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.illum_angles': ( 'api/spice.spicer.html#illum_angles',
+                                          'planetarypy.spice.spicer.Spicer.illum_angles': ( 'api/spice.spicer.html#spicer.illum_angles',
                                                                                             'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.l_s': ( 'api/spice.spicer.html#l_s',
+                                          'planetarypy.spice.spicer.Spicer.l_s': ( 'api/spice.spicer.html#spicer.l_s',
                                                                                    'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.local_soltime': ( 'api/spice.spicer.html#local_soltime',
+                                          'planetarypy.spice.spicer.Spicer.local_soltime': ( 'api/spice.spicer.html#spicer.local_soltime',
                                                                                              'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.north_pole': ( 'api/spice.spicer.html#north_pole',
+                                          'planetarypy.spice.spicer.Spicer.north_pole': ( 'api/spice.spicer.html#spicer.north_pole',
                                                                                           'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.point_towards_sun': ( 'api/spice.spicer.html#point_towards_sun',
+                                          'planetarypy.spice.spicer.Spicer.point_towards_sun': ( 'api/spice.spicer.html#spicer.point_towards_sun',
                                                                                                  'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.projected_tilted_rotated_normal': ( 'api/spice.spicer.html#projected_tilted_rotated_normal',
+                                          'planetarypy.spice.spicer.Spicer.projected_tilted_rotated_normal': ( 'api/spice.spicer.html#spicer.projected_tilted_rotated_normal',
                                                                                                                'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.radii': ( 'api/spice.spicer.html#radii',
+                                          'planetarypy.spice.spicer.Spicer.radii': ( 'api/spice.spicer.html#spicer.radii',
                                                                                      'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.ref_frame': ( 'api/spice.spicer.html#ref_frame',
+                                          'planetarypy.spice.spicer.Spicer.ref_frame': ( 'api/spice.spicer.html#spicer.ref_frame',
                                                                                          'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.set_spoint_by': ( 'api/spice.spicer.html#set_spoint_by',
+                                          'planetarypy.spice.spicer.Spicer.set_spoint_by': ( 'api/spice.spicer.html#spicer.set_spoint_by',
                                                                                              'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.snormal': ( 'api/spice.spicer.html#snormal',
+                                          'planetarypy.spice.spicer.Spicer.snormal': ( 'api/spice.spicer.html#spicer.snormal',
                                                                                        'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.solar_constant': ( 'api/spice.spicer.html#solar_constant',
+                                          'planetarypy.spice.spicer.Spicer.solar_constant': ( 'api/spice.spicer.html#spicer.solar_constant',
                                                                                               'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.south_pole': ( 'api/spice.spicer.html#south_pole',
+                                          'planetarypy.spice.spicer.Spicer.south_pole': ( 'api/spice.spicer.html#spicer.south_pole',
                                                                                           'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.srfrec': ( 'api/spice.spicer.html#srfrec',
+                                          'planetarypy.spice.spicer.Spicer.srfrec': ( 'api/spice.spicer.html#spicer.srfrec',
                                                                                       'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.subsolar': ( 'api/spice.spicer.html#subsolar',
+                                          'planetarypy.spice.spicer.Spicer.subsolar': ( 'api/spice.spicer.html#spicer.subsolar',
                                                                                         'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.subsolar2': ( 'api/spice.spicer.html#subsolar2',
+                                          'planetarypy.spice.spicer.Spicer.subsolar2': ( 'api/spice.spicer.html#spicer.subsolar2',
                                                                                          'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.sun_direction': ( 'api/spice.spicer.html#sun_direction',
+                                          'planetarypy.spice.spicer.Spicer.sun_direction': ( 'api/spice.spicer.html#spicer.sun_direction',
                                                                                              'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.target_id': ( 'api/spice.spicer.html#target_id',
+                                          'planetarypy.spice.spicer.Spicer.target_id': ( 'api/spice.spicer.html#spicer.target_id',
                                                                                          'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.tilt': ( 'api/spice.spicer.html#tilt',
+                                          'planetarypy.spice.spicer.Spicer.tilt': ( 'api/spice.spicer.html#spicer.tilt',
                                                                                     'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.tilted_normal': ( 'api/spice.spicer.html#tilted_normal',
+                                          'planetarypy.spice.spicer.Spicer.tilted_normal': ( 'api/spice.spicer.html#spicer.tilted_normal',
                                                                                              'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.tilted_rotated_normal': ( 'api/spice.spicer.html#tilted_rotated_normal',
+                                          'planetarypy.spice.spicer.Spicer.tilted_rotated_normal': ( 'api/spice.spicer.html#spicer.tilted_rotated_normal',
                                                                                                      'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.time_series': ( 'api/spice.spicer.html#time_series',
+                                          'planetarypy.spice.spicer.Spicer.time_series': ( 'api/spice.spicer.html#spicer.time_series',
                                                                                            'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.to_north': ( 'api/spice.spicer.html#to_north',
+                                          'planetarypy.spice.spicer.Spicer.to_north': ( 'api/spice.spicer.html#spicer.to_north',
                                                                                         'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.Spicer.utc': ( 'api/spice.spicer.html#utc',
+                                          'planetarypy.spice.spicer.Spicer.utc': ( 'api/spice.spicer.html#spicer.utc',
                                                                                    'planetarypy/spice/spicer.py'),
                                           'planetarypy.spice.spicer.SurfaceCoords': ( 'api/spice.spicer.html#surfacecoords',
                                                                                       'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.SurfaceCoords.__init__': ( 'api/spice.spicer.html#__init__',
+                                          'planetarypy.spice.spicer.SurfaceCoords.__init__': ( 'api/spice.spicer.html#surfacecoords.__init__',
                                                                                                'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.SurfaceCoords.__repr__': ( 'api/spice.spicer.html#__repr__',
+                                          'planetarypy.spice.spicer.SurfaceCoords.__repr__': ( 'api/spice.spicer.html#surfacecoords.__repr__',
                                                                                                'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.SurfaceCoords.__str__': ( 'api/spice.spicer.html#__str__',
+                                          'planetarypy.spice.spicer.SurfaceCoords.__str__': ( 'api/spice.spicer.html#surfacecoords.__str__',
                                                                                               'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.SurfaceCoords.dlat': ( 'api/spice.spicer.html#dlat',
+                                          'planetarypy.spice.spicer.SurfaceCoords.dlat': ( 'api/spice.spicer.html#surfacecoords.dlat',
                                                                                            'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.SurfaceCoords.dlon': ( 'api/spice.spicer.html#dlon',
+                                          'planetarypy.spice.spicer.SurfaceCoords.dlon': ( 'api/spice.spicer.html#surfacecoords.dlon',
                                                                                            'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.SurfaceCoords.fromtuple': ( 'api/spice.spicer.html#fromtuple',
+                                          'planetarypy.spice.spicer.SurfaceCoords.fromtuple': ( 'api/spice.spicer.html#surfacecoords.fromtuple',
                                                                                                 'planetarypy/spice/spicer.py'),
                                           'planetarypy.spice.spicer.TritonSpicer': ( 'api/spice.spicer.html#tritonspicer',
                                                                                      'planetarypy/spice/spicer.py'),
-                                          'planetarypy.spice.spicer.TritonSpicer.__init__': ( 'api/spice.spicer.html#__init__',
+                                          'planetarypy.spice.spicer.TritonSpicer.__init__': ( 'api/spice.spicer.html#tritonspicer.__init__',
                                                                                               'planetarypy/spice/spicer.py'),
                                           'planetarypy.spice.spicer.make_axis_rotation_matrix': ( 'api/spice.spicer.html#make_axis_rotation_matrix',
                                                                                                   'planetarypy/spice/spicer.py')},
-            'planetarypy.utils': { 'planetarypy.utils._nasa_date_to_datetime': ( 'api/utils.html#_nasa_date_to_datetime',
+            'planetarypy.utils': { 'planetarypy.utils._int_field': ('api/utils.html#_int_field', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._nasa_date_to_datetime': ( 'api/utils.html#_nasa_date_to_datetime',
                                                                                  'planetarypy/utils.py'),
                                    'planetarypy.utils._nasa_datetime_to_datetime': ( 'api/utils.html#_nasa_datetime_to_datetime',
                                                                                      'planetarypy/utils.py'),
@@ -771,12 +1246,14 @@ d = { 'settings': { 'branch': 'master',
                                    'planetarypy.utils.catch_isis_error': ('api/utils.html#catch_isis_error', 'planetarypy/utils.py'),
                                    'planetarypy.utils.check_url_exists': ('api/utils.html#check_url_exists', 'planetarypy/utils.py'),
                                    'planetarypy.utils.file_variations': ('api/utils.html#file_variations', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.format_http_date': ('api/utils.html#format_http_date', 'planetarypy/utils.py'),
                                    'planetarypy.utils.get_gdal_center_coords': ( 'api/utils.html#get_gdal_center_coords',
                                                                                  'planetarypy/utils.py'),
                                    'planetarypy.utils.get_remote_timestamp': ( 'api/utils.html#get_remote_timestamp',
                                                                                'planetarypy/utils.py'),
                                    'planetarypy.utils.have_internet': ('api/utils.html#have_internet', 'planetarypy/utils.py'),
                                    'planetarypy.utils.height_from_shadow': ('api/utils.html#height_from_shadow', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.is_nasa_time': ('api/utils.html#is_nasa_time', 'planetarypy/utils.py'),
                                    'planetarypy.utils.iso_to_nasa_datetime': ( 'api/utils.html#iso_to_nasa_datetime',
                                                                                'planetarypy/utils.py'),
                                    'planetarypy.utils.iso_to_nasa_time': ('api/utils.html#iso_to_nasa_time', 'planetarypy/utils.py'),
@@ -784,32 +1261,65 @@ d = { 'settings': { 'branch': 'master',
                                                                                 'planetarypy/utils.py'),
                                    'planetarypy.utils.nasa_time_to_iso': ('api/utils.html#nasa_time_to_iso', 'planetarypy/utils.py'),
                                    'planetarypy.utils.parse_http_date': ('api/utils.html#parse_http_date', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.parse_nasa_times': ('api/utils.html#parse_nasa_times', 'planetarypy/utils.py'),
                                    'planetarypy.utils.replace_all_nasa_times': ( 'api/utils.html#replace_all_nasa_times',
                                                                                  'planetarypy/utils.py'),
                                    'planetarypy.utils.url_retrieve': ('api/utils.html#url_retrieve', 'planetarypy/utils.py')},
             'planetarypy.uvis': { 'planetarypy.uvis.DataManager': ('api/cassini_uvis.html#datamanager', 'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.__init__': ('api/cassini_uvis.html#__init__', 'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.__repr__': ('api/cassini_uvis.html#__repr__', 'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.calib_corr_path': ( 'api/cassini_uvis.html#calib_corr_path',
+                                  'planetarypy.uvis.DataManager.__init__': ( 'api/cassini_uvis.html#datamanager.__init__',
+                                                                             'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.DataManager.__repr__': ( 'api/cassini_uvis.html#datamanager.__repr__',
+                                                                             'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.DataManager.calib_corr_path': ( 'api/cassini_uvis.html#datamanager.calib_corr_path',
                                                                                     'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.calib_label_path': ( 'api/cassini_uvis.html#calib_label_path',
+                                  'planetarypy.uvis.DataManager.calib_label_path': ( 'api/cassini_uvis.html#datamanager.calib_label_path',
                                                                                      'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.download': ('api/cassini_uvis.html#download', 'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.folder': ('api/cassini_uvis.html#folder', 'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.original_pid_file': ( 'api/cassini_uvis.html#original_pid_file',
+                                  'planetarypy.uvis.DataManager.calibrated': ( 'api/cassini_uvis.html#datamanager.calibrated',
+                                                                               'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.DataManager.download': ( 'api/cassini_uvis.html#datamanager.download',
+                                                                             'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.DataManager.folder': ( 'api/cassini_uvis.html#datamanager.folder',
+                                                                           'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.DataManager.original_pid_file': ( 'api/cassini_uvis.html#datamanager.original_pid_file',
                                                                                       'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.pds_id': ('api/cassini_uvis.html#pds_id', 'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.query': ('api/cassini_uvis.html#query', 'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.raw_data_path': ( 'api/cassini_uvis.html#raw_data_path',
+                                  'planetarypy.uvis.DataManager.pds_id': ( 'api/cassini_uvis.html#datamanager.pds_id',
+                                                                           'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.DataManager.query': ('api/cassini_uvis.html#datamanager.query', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.DataManager.raw': ('api/cassini_uvis.html#datamanager.raw', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.DataManager.raw_data_path': ( 'api/cassini_uvis.html#datamanager.raw_data_path',
                                                                                   'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.raw_data_url': ( 'api/cassini_uvis.html#raw_data_url',
+                                  'planetarypy.uvis.DataManager.raw_data_url': ( 'api/cassini_uvis.html#datamanager.raw_data_url',
                                                                                  'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.raw_label_path': ( 'api/cassini_uvis.html#raw_label_path',
+                                  'planetarypy.uvis.DataManager.raw_label_path': ( 'api/cassini_uvis.html#datamanager.raw_label_path',
                                                                                    'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.raw_label_url': ( 'api/cassini_uvis.html#raw_label_url',
+                                  'planetarypy.uvis.DataManager.raw_label_url': ( 'api/cassini_uvis.html#datamanager.raw_label_url',
                                                                                   'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.DataManager.results_file': ( 'api/cassini_uvis.html#results_file',
+                                  'planetarypy.uvis.DataManager.resolve': ( 'api/cassini_uvis.html#datamanager.resolve',
+                                                                            'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.DataManager.results_file': ( 'api/cassini_uvis.html#datamanager.results_file',
                                                                                  'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.UVISLabel': ('api/cassini_uvis.html#uvislabel', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.UVISLabel.__init__': ( 'api/cassini_uvis.html#uvislabel.__init__',
+                                                                           'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.UVISLabel.axis_items': ( 'api/cassini_uvis.html#uvislabel.axis_items',
+                                                                             'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.UVISLabel.axis_names': ( 'api/cassini_uvis.html#uvislabel.axis_names',
+                                                                             'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.UVISLabel.data_path': ( 'api/cassini_uvis.html#uvislabel.data_path',
+                                                                            'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.UVISLabel.dims': ('api/cassini_uvis.html#uvislabel.dims', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.UVISLabel.dtype': ('api/cassini_uvis.html#uvislabel.dtype', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.UVISLabel.memmap': ('api/cassini_uvis.html#uvislabel.memmap', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.UVISLabel.obj': ('api/cassini_uvis.html#uvislabel.obj', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.UVISLabel.offset': ('api/cassini_uvis.html#uvislabel.offset', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.UVISLabel.shape': ('api/cassini_uvis.html#uvislabel.shape', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis._as_list': ('api/cassini_uvis.html#_as_list', 'planetarypy/uvis.py'),
                                   'planetarypy.uvis.get_data_path': ('api/cassini_uvis.html#get_data_path', 'planetarypy/uvis.py'),
                                   'planetarypy.uvis.get_label_path': ('api/cassini_uvis.html#get_label_path', 'planetarypy/uvis.py'),
-                                  'planetarypy.uvis.get_user_guide': ('api/cassini_uvis.html#get_user_guide', 'planetarypy/uvis.py')}}}
\ No newline at end of file
+                                  'planetarypy.uvis.get_user_guide': ('api/cassini_uvis.html#get_user_guide', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.index_lookup': ('api/cassini_uvis.html#index_lookup', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.index_urls': ('api/cassini_uvis.html#index_urls', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.open_calibrated': ('api/cassini_uvis.html#open_calibrated', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.open_calibration': ('api/cassini_uvis.html#open_calibration', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.open_raw': ('api/cassini_uvis.html#open_raw', 'planetarypy/uvis.py'),
+                                  'planetarypy.uvis.pds3_dtype': ('api/cassini_uvis.html#pds3_dtype', 'planetarypy/uvis.py')}}}
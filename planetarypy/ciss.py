@@ -1,17 +1,18 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/api/06_cassini_iss.ipynb.
 
 # %% auto 0
-__all__ = ['base_url', 'raw_url', 'calib_url', 'cache', 'storage_root', 'opus_keys', 'DataRetriever', 'ISS']
+__all__ = ['base_url', 'raw_url', 'calib_url', 'cache', 'storage_root', 'opus_keys', 'index_lookup', 'DataRetriever', 'ISS']
 
 # %% ../notebooks/api/06_cassini_iss.ipynb 2
 from pathlib import Path
 
 from yarl import URL
 
+from . import metrics
 from .config import config
 from .pds.apps import get_index
 from .pds.opusapi import OPUS
-from .utils import have_internet, url_retrieve
+from .utils import url_retrieve
 
 # %% ../notebooks/api/06_cassini_iss.ipynb 3
 base_url = URL("https://opus.pds-rings.seti.org/holdings")
@@ -39,24 +40,50 @@ opus_keys = [
 ]
 
 # %% ../notebooks/api/06_cassini_iss.ipynb 6
+def index_lookup():
+    """Map product file names to rows of the ISS index.
+
+    Both the full name (N1454725799_1) and the name without version suffix (N1454725799)
+    are keys, the latter pointing to the last listed version.
+    """
+    metrics.cache_access("ciss.lookup", "lookup" in cache)
+    if "lookup" not in cache:
+        if "index" not in cache:
+            # only download if missing, checking for updates needs web requests
+            cache["index"] = get_index("cassini.iss", "index", refresh=False)
+        index = cache["index"]
+        stems = index.FILE_NAME.str.strip().str.extract(r"([^/]+)\.\w+$", expand=False)
+        lookup = dict(zip(stems.str.split("_").str[0], index.index))
+        lookup.update(zip(stems, index.index))
+        cache["lookup"] = lookup
+    return cache["lookup"]
+
+
 class DataRetriever:
     def __init__(self, pid):  # PDS product_id, e.g. N1454725799
-        if not 'index' in cache:
-            cache['index'] = get_index("cassini.iss", "index")
-        index = cache['index']
-        self.meta = index[index.FILE_NAME.str.contains(pid)].squeeze()  # make it series
+        lookup = index_lookup()
+        try:
+            self.meta = cache["index"].loc[lookup[pid]]
+        except KeyError:
+            raise FileNotFoundError(f"{pid} not found in the ISS index.")
+
+    @property
+    def volume(self):
+        return self.meta.VOLUME_ID.strip()
 
     @property
     def vol_path(self):
-        return Path(self.meta.VOLUME_ID) / self.meta.FILE_SPECIFICATION_NAME
+        "Path of the image in the volumes. The index lists the path of its label."
+        spec = Path(self.meta.FILE_SPECIFICATION_NAME.strip())
+        return Path(self.volume) / spec.with_suffix(".IMG")
 
     @property
     def raw_fname(self):
-        return Path(self.meta.FILE_SPECIFICATION_NAME).name
-        
+        return self.vol_path.name
+
     @property
     def raw_data_url(self):
-        return raw_url / str(self.vol_path)
+        return raw_url / self.vol_path.as_posix()
 
     @property
     def raw_label_url(self):
@@ -64,34 +91,65 @@ class DataRetriever:
 
     @property
     def raw_prefix_fmt_url(self):
-        return raw_url / f"{self.meta.VOLUME_ID}/label/prefix2.fmt"
+        return raw_url / f"{self.volume}/label/prefix2.fmt"
 
     @property
     def raw_tlmtab_url(self):
-        return raw_url / f"{self.meta.VOLUME_ID}/label/tlmtab.fmt"
+        return raw_url / f"{self.volume}/label/tlmtab.fmt"
 
     @property
     def calib_fname(self):
-        return self.raw_fname.with_suffix("_CALIB.IMG")
-        
+        return f"{self.vol_path.stem}_CALIB.IMG"
+
     @property
     def calib_data_url(self):
-        return calib_url / str(self.vol_path.parent / f"{self.vol_path.stem}_CALIB.IMG")
+        return calib_url / (self.vol_path.parent / self.calib_fname).as_posix()
 
-# %% ../notebooks/api/06_cassini_iss.ipynb 15
+    @property
+    def calib_label_url(self):
+        return self.calib_data_url.with_suffix(".LBL")
+
+    @property
+    def urls(self):
+        "URLs in the layout of an OPUS files response."
+        return {
+            "coiss_raw": [
+                str(u)
+                for u in [
+                    self.raw_data_url,
+                    self.raw_label_url,
+                    self.raw_prefix_fmt_url,
+                    self.raw_tlmtab_url,
+                ]
+            ],
+            "coiss_calib": [str(self.calib_data_url), str(self.calib_label_url)],
+        }
+
+# %% ../notebooks/api/06_cassini_iss.ipynb 17
 class ISS:
 
     def __init__(self, pid):
         self.pid = pid
-        if have_internet():
+        self.id = pid  # PDS product id, also when the URLs come from OPUS
+        self.opus_id = None
+        try:
+            self.from_index(pid)
+        except FileNotFoundError:
             self.query_pid(pid)
-            
+
+    def from_index(self, pid):
+        "Construct the product URLs locally from the ISS index, without web requests."
+        self.dict = DataRetriever(pid).urls
+        self._set_attributes()
 
     def query_pid(self, pid):
         opus = OPUS()
         self.query_result = opus.query_image_id(pid)[0]
-        self.id = self.query_result[0]
+        self.opus_id = self.query_result[0]
         self.dict = self.query_result[1]
+        self._set_attributes()
+
+    def _set_attributes(self):
         for k, v in self.dict.items():
             if isinstance(v, list) and len(v) == 1:
                 setattr(self, k, v[0])
@@ -164,6 +222,6 @@ class ISS:
 
     def __repr__(self):
         s = f"Product ID:\n{self.id}\n\n"
-        for k, v in self.query_result[1].items():
+        for k, v in self.dict.items():
             s += f"Key: {k},\nValue(s):\n{v}\n\n"
         return s
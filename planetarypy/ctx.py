@@ -1,14 +1,25 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/api/03_ctx.ipynb.
 
 # %% auto 0
-__all__ = ['baseurl', 'storage_root', 'cache', 'get_edr_index', 'CTXEDR', 'CTX', 'CTXCollection', 'ctx_calib']
+__all__ = ['baseurl', 'storage_root', 'cache', 'calib_stages', 'telemetry_log', 'max_open_rasters', 'get_edr_index',
+           'get_edr_time_index', 'share_edr_index', 'attach_edr_index', 'CTXEDR', 'write_telemetry', 'read_telemetry',
+           'telemetry_report', 'block_chunks', 'open_raster', 'CTX', 'CTXCollection', 'ctx_calib']
 
 # %% ../notebooks/api/03_ctx.ipynb 3
+import json
+import os
+import socket
+import sys
+import time
 import warnings
+from collections import OrderedDict
+from datetime import datetime, timezone
 from itertools import repeat
 from multiprocessing import Pool
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import rasterio
 import rioxarray as rxr
 from tqdm.auto import tqdm
@@ -18,8 +29,11 @@ from yarl import URL
 import hvplot.xarray  # noqa
 from fastcore.basics import store_attr
 from fastcore.script import call_parse
+from . import metrics
 from .config import config
 from .pds.apps import get_index
+from .pds.indexes import Index
+from .pds.utils import SharedIndex
 from .utils import catch_isis_error, file_variations, url_retrieve
 
 try:
@@ -35,6 +49,11 @@ try:
 except KeyError:
     warnings.warn("kalasiris has a problem initializing ISIS")
 
+try:
+    import resource
+except ImportError:  # not on Windows
+    resource = None
+
 # %% ../notebooks/api/03_ctx.ipynb 4
 warnings.filterwarnings("ignore", category=rasterio.errors.NotGeoreferencedWarning)
 baseurl = URL(config.get_value("mro.ctx.datalevels.edr.url"))
@@ -45,17 +64,57 @@ cache = dict()
 
 # %% ../notebooks/api/03_ctx.ipynb 7
 def get_edr_index(refresh=False):
+    metrics.cache_access("ctx.edrindex", 'edrindex' in cache and not refresh)
     if 'edrindex' in cache and not refresh:
         return cache['edrindex']
     else:
-        edrindex = get_index("mro.ctx", "edr", refresh=refresh)
-        edrindex["short_pid"] = edrindex.PRODUCT_ID.map(lambda x: x[:15])
-        edrindex["month_col"] = edrindex.PRODUCT_ID.map(lambda x: x[:3])
-        edrindex.LINE_SAMPLES = edrindex.LINE_SAMPLES.astype(int)
+        cache.pop('edr_time_index', None)
+        cache.pop('edr_shared', None)
+        edrindex = _add_edr_columns(get_index("mro.ctx", "edr", refresh=refresh))
         cache['edrindex'] = edrindex
         return edrindex
 
-# %% ../notebooks/api/03_ctx.ipynb 9
+
+def _add_edr_columns(edrindex):
+    edrindex["short_pid"] = edrindex.PRODUCT_ID.str[:15]
+    edrindex["month_col"] = edrindex.PRODUCT_ID.str[:3]
+    edrindex.LINE_SAMPLES = edrindex.LINE_SAMPLES.astype(int)
+    return edrindex
+
+
+def get_edr_time_index():
+    "Sorted IMAGE_TIME of the EDR index, for time range queries, stored next to the index table."
+    metrics.cache_access("ctx.edr_time_index", 'edr_time_index' in cache)
+    if 'edr_time_index' not in cache:
+        # row positions match `get_edr_index`, both read the index in stored order
+        cache['edr_time_index'] = Index("mro.ctx.edr", check_update=False).time_index("IMAGE_TIME")
+    return cache['edr_time_index']
+
+
+def share_edr_index() -> SharedIndex:
+    """Publish the EDR index as memory-mapped file, for worker processes.
+
+    The Arrow copy of the index is written from the parquet data without loading it,
+    and only when the parquet data is newer, see `Index.arrow_cache`.
+    """
+    if 'edr_shared' not in cache:
+        cache['edr_shared'] = SharedIndex(Index("mro.ctx.edr", check_update=False).arrow_cache())
+    return cache['edr_shared']
+
+
+def attach_edr_index(
+    shared: SharedIndex,  # handle from `share_edr_index`
+):
+    """In a worker process, use the shared EDR index instead of loading it from parquet.
+
+    Forked workers inherit the index of the parent process, it is replaced as well,
+    once per process.
+    """
+    if cache.get('edr_attached') != (os.getpid(), shared.path):
+        cache['edrindex'] = _add_edr_columns(shared.attach())
+        cache['edr_attached'] = (os.getpid(), shared.path)
+
+# %% ../notebooks/api/03_ctx.ipynb 11
 class CTXEDR:
     """Manage access to EDR data"""
 
@@ -147,7 +206,131 @@ class CTXEDR:
     def __repr__(self):
         return self.__str__()
 
-# %% ../notebooks/api/03_ctx.ipynb 34
+# %% ../notebooks/api/03_ctx.ipynb 37
+# stages of `CTX.calib_pipeline`, with the path attribute of their output
+calib_stages = {
+    "isis_import": "cub_path",
+    "spice_init": "cub_path",
+    "calibrate": "cal_path",
+    "destripe": "cal_path",
+}
+telemetry_log = storage_root / "calib_telemetry.jsonl"
+
+
+def _usage() -> tuple:  # CPU seconds, peak RSS in MB
+    """CPU time of this process and its finished children, and the peak RSS of the largest child so far.
+
+    The peak RSS is a high-water mark over all children of the process, not a value per child,
+    so it only tells which stage (if any) raised it.
+    """
+    t = os.times()
+    cpu = t.user + t.system + t.children_user + t.children_system
+    if resource is None:
+        return cpu, None
+    # ru_maxrss is in kB on Linux and in bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return cpu, maxrss / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def write_telemetry(
+    records: list,  # Telemetry records, as returned by `CTX.calib_pipeline`
+    path: str = None,  # JSON lines or parquet (.parq/.parquet) file, default `telemetry_log`
+) -> Path:
+    "Append telemetry records to a log file."
+    path = Path(path or telemetry_log)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix in (".parq", ".parquet"):
+        df = pd.DataFrame(records)
+        if path.exists():
+            df = pd.concat([pd.read_parquet(path), df], ignore_index=True)
+        df.to_parquet(path)
+    else:
+        with open(path, "a") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+    return path
+
+
+def read_telemetry(
+    path: str = None,  # JSON lines or parquet (.parq/.parquet) file, default `telemetry_log`
+) -> pd.DataFrame:
+    "Read a telemetry log."
+    path = Path(path or telemetry_log)
+    if path.suffix in (".parq", ".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_json(path, lines=True, convert_dates=["start"])
+
+
+def telemetry_report(
+    telemetry,  # Telemetry records, as list or DataFrame, or the path of a telemetry log
+) -> pd.DataFrame:  # One row per stage
+    """Aggregate telemetry per stage: runs, failures, and the distribution of time and output size.
+
+    `children_peak_rss_mb` is left out, it is a running maximum over all ISIS runs of a process.
+    """
+    if isinstance(telemetry, (str, Path)):
+        df = read_telemetry(telemetry)
+    else:
+        df = pd.DataFrame(telemetry)
+    g = df.groupby("stage", sort=False)
+    report = pd.DataFrame(
+        {
+            "runs": g.size(),
+            "failed": g.status.apply(lambda status: (status != 0).sum()),
+            "wall_total_s": g.wall_s.sum(),
+            "wall_mean_s": g.wall_s.mean(),
+            "wall_p95_s": g.wall_s.quantile(0.95),
+            "wall_max_s": g.wall_s.max(),
+            "cpu_mean_s": g.cpu_s.mean(),
+            "output_mean_mb": g.output_bytes.mean() / 2**20,
+        }
+    )
+    # near 1 for CPU bound stages, near 0 for stages waiting on I/O or the network, like spiceinit
+    report["cpu_per_wall"] = report.cpu_mean_s / report.wall_mean_s
+    report["wall_share"] = report.wall_total_s / report.wall_total_s.sum()
+    return report
+
+# %% ../notebooks/api/03_ctx.ipynb 39
+max_open_rasters = 32  # number of opened rasters kept in `cache`
+
+
+def block_chunks(
+    path: str,  # Raster file readable by rasterio, e.g. EDR or ISIS cube
+    chunk_mb: float = 64,  # Approximate chunk size in MB
+) -> dict:  # Chunks for `rioxarray.open_rasterio`
+    "Chunks of whole lines, a multiple of the block height of the file."
+    with rasterio.open(path) as src:
+        block_lines = src.block_shapes[0][0]
+        line_bytes = src.width * np.dtype(src.dtypes[0]).itemsize
+        height = src.height
+    lines = max(1, int(chunk_mb * 2**20 / (line_bytes * block_lines))) * block_lines
+    return {"band": 1, "y": min(lines, height), "x": -1}
+
+
+def open_raster(
+    path: str,  # Raster file readable by rasterio, e.g. EDR or ISIS cube
+    masked: bool = False,  # Replace nodata values with NaN
+    chunk_mb: float = 64,  # Approximate chunk size in MB
+):  # xarray.DataArray with dask array, without band dimension
+    "Open the first band of a raster lazily, reusing an already opened one."
+    path = Path(path)
+    if not path.exists():
+        # Doing this by hand because rasterio doesn't throw exception when path is missing.
+        raise FileNotFoundError(f"{path} does not exist.")
+    key = (str(path.resolve()), path.stat().st_mtime_ns, masked)
+    rasters = cache.setdefault("rasters", OrderedDict())
+    metrics.cache_access("ctx.rasters", key in rasters)
+    if key in rasters:
+        rasters.move_to_end(key)
+        return rasters[key][1]
+    da = rxr.open_rasterio(path, masked=masked, chunks=block_chunks(path, chunk_mb))
+    # keep the opened array, only closing it releases the file
+    rasters[key] = (da, da.sel(band=1, drop=True).drop_vars("spatial_ref"))
+    while len(rasters) > max_open_rasters:
+        _, (oldest, _) = rasters.popitem(last=False)
+        oldest.close()
+    return rasters[key][1]
+
+# %% ../notebooks/api/03_ctx.ipynb 41
 class CTX:
     """Class to manage dealing with CTX data.
 
@@ -274,31 +457,63 @@ class CTX:
         "Return the index file content for the DATA_QUALITY_DESC flag."
         return self.meta.data_quality_desc
 
-    def calib_pipeline(self, overwrite=False) -> None:
+    def run_stage(
+        self,
+        name: str,  # Stage of the calibration pipeline, see `calib_stages`
+    ) -> dict:  # Telemetry record
+        "Run one stage of the calibration pipeline and measure it."
+        start = datetime.now(timezone.utc)
+        cpu0, _ = _usage()
+        t0 = time.perf_counter()
+        result = getattr(self, name)()  # ISIS errors are returned by `catch_isis_error`
+        wall = time.perf_counter() - t0
+        cpu1, max_rss = _usage()
+        failed = isinstance(result, ProcessError)
+        output = getattr(self, calib_stages[name])
+        return dict(
+            product_id=self.pid,
+            stage=name,
+            start=start.isoformat(),
+            wall_s=wall,
+            cpu_s=cpu1 - cpu0,
+            children_peak_rss_mb=max_rss,
+            output_bytes=output.stat().st_size if output.exists() else 0,
+            status=result.returncode if failed else 0,
+            stderr=result.stderr if failed else "",
+            host=socket.gethostname(),
+        )
+
+    def calib_pipeline(
+        self,
+        overwrite=False,
+        log: str = None,  # JSON lines or parquet file to append the telemetry records to
+    ) -> list:  # Telemetry records of the stages, empty if nothing was done
         "Execute the whole ISIS pipeline for CTX EDR data."
         if self.cal_path.exists() and not overwrite:
-            return
-        pbar = tqdm("isis_import spice_init calibrate destripe".split())
+            return []
+        records = []
+        pbar = tqdm(list(calib_stages))
         for name in pbar:
             pbar.set_description(name)
-            getattr(self, name)()
+            records.append(self.run_stage(name))
         pbar.set_description("Done.")
+        if log:
+            write_telemetry(records, log)
+        return records
 
     @property
     def edr_da(self):
-        """Read EDR into xr.DataArray. Drop superfluous band dimension.
+        """Read EDR lazily into xr.DataArray, see `open_raster`. Drop superfluous band dimension.
 
         If it was read before, use stored object for speed-up.
         'da' stands for data-array.
         """
         if not self.is_read:
             if not self.source_path.exists():
-                # Doing this by hand because rasterio doesn't throw exception when path is missing.
                 raise FileNotFoundError("EDR not downloaded yet.")
-            self._edr_da = rxr.open_rasterio(self.source_path).sel(band=1, drop=True)
-            self._edr_da.name = f"{self.short_pid} EDR"
+            self._edr_da = open_raster(self.source_path).rename(f"{self.short_pid} EDR")
             self.is_read = True
-        return self._edr_da.drop_vars("spatial_ref")
+        return self._edr_da
 
     @property
     def edr_shape(self):
@@ -306,7 +521,7 @@ class CTX:
 
     @property
     def cal_da(self):
-        """Read calibrated ISIS cube into xarray.DataArray using rioxarray.
+        """Read calibrated ISIS cube lazily into xarray.DataArray, see `open_raster`.
 
         Drop superfluous `band` dimension.
         If it was read before, use stored object for speed-up.
@@ -314,10 +529,9 @@ class CTX:
         """
         if not self.is_calib_read:
             path = self.cal_path if not self.use_preproc else self.preproc_cal_path
-            self._cal_da = rxr.open_rasterio(path, masked=True).sel(band=1, drop=True)
-            self._cal_da.name = f"{self.short_pid} calibrated"
-            self.is_calibd_read = True
-        return self._cal_da.drop_vars("spatial_ref")
+            self._cal_da = open_raster(path, masked=True).rename(f"{self.short_pid} calibrated")
+            self.is_calib_read = True
+        return self._cal_da
 
     @property
     def cal_shape(self):
@@ -367,7 +581,7 @@ class CTX:
     def __repr__(self):
         return self.__str__()
 
-# %% ../notebooks/api/03_ctx.ipynb 65
+# %% ../notebooks/api/03_ctx.ipynb 74
 class CTXCollection:
     """Class with several helpful methods to work with a set of CTX images.
 
@@ -402,6 +616,13 @@ class CTXCollection:
         vol = edrindex.query(f"PRODUCT_ID=='{pid}'").VOLUME_ID.iat[0]
         return cls.by_volume(vol, **kwargs)
 
+    @classmethod
+    def by_time(cls, t0, t1, **kwargs):
+        """Create a CTXCollection of the images taken between t0 and t1."""
+        edrindex = get_edr_index()
+        rows = get_edr_time_index().query(t0, t1)
+        return cls(edrindex.PRODUCT_ID.values[rows], edrindex=edrindex, **kwargs)
+
     def __init__(self, product_ids, full_width=False, filter_error=False, edrindex=None):
         self.product_ids = product_ids
         self.full_width = full_width  # i.e. LINE_SAMPLES==5056
@@ -448,27 +669,46 @@ class CTXCollection:
         self.urls = urls
         return urls
 
-    def _do_download(self, args):
-        pid, overwrite = args
+    # static, so that only the arguments and not the whole collection get pickled for the workers
+    @staticmethod
+    def _do_download(args):
+        pid, overwrite, shared = args
+        attach_edr_index(shared)
         ctx = CTX(pid)
         ctx.download(overwrite=overwrite)
 
     def download_collection(self, overwrite=False):
         "download the images in parallel using tqdm wrapper around concurrent.future"
         print("Downloading collection...")
-        args = zip(self.product_ids, repeat(overwrite))
+        args = zip(self.product_ids, repeat(overwrite), repeat(share_edr_index()))
         r = process_map(self._do_download, args, max_workers=6)
 
-    def _do_calib(self, args):
-        pid, overwrite = args
+    @staticmethod
+    def _do_calib(args):
+        pid, overwrite, shared = args
+        attach_edr_index(shared)
         ctx = CTX(pid)
-        ctx.calib_pipeline(overwrite=overwrite)
+        return ctx.calib_pipeline(overwrite=overwrite)
+
+    def calibrate_collection(
+        self,
+        overwrite=False,
+        log: str = telemetry_log,  # JSON lines or parquet file for the telemetry, None to skip
+    ) -> pd.DataFrame:  # Telemetry report per stage, see `telemetry_report`
+        """Calibrate all images in collection using tqdm wrapper around concurrent.future
 
-    def calibrate_collection(self, overwrite=False):
-        "Calibrate all images in collection using tqdm wrapper around concurrent.future"
+        The telemetry records of this run are kept in the `telemetry` attribute.
+        """
         print("Launching parallel calibration...")
-        args = zip(self.product_ids, repeat(overwrite))
-        process_map(self._do_calib, args, max_workers=6)
+        args = zip(self.product_ids, repeat(overwrite), repeat(share_edr_index()))
+        results = process_map(self._do_calib, args, max_workers=6)
+        records = [record for product in results for record in product]
+        self.telemetry = pd.DataFrame(records)
+        if not records:
+            return None
+        if log:
+            write_telemetry(records, log)
+        return telemetry_report(records)
 
     def edr_exist_check(self):
         "Check if all source_paths exists, i.e. all EDR images are available."
@@ -504,6 +744,13 @@ class CTXCollection:
         "Return the image observation times."
         return self.meta.IMAGE_TIME
 
+    def query_time(self, t0, t1):
+        "Constrain the product_ids to the images taken between t0 and t1."
+        rows = get_edr_time_index().query(t0, t1)
+        in_range = set(get_edr_index().PRODUCT_ID.values[rows])
+        self.product_ids = [pid for pid in self._product_ids if pid in in_range]
+        return self
+
     def get_corrupted(self):
         "Return the product_ids where the PDS index file has an 'ERROR' flag for the `DATA_QUALITY_DESC` field."
         return [pid for pid in self.pids if CTX(pid).data_quality == "ERROR"]
@@ -534,14 +781,15 @@ class CTXCollection:
     def __repr__(self):
         return self.__str__()
 
-# %% ../notebooks/api/03_ctx.ipynb 108
+# %% ../notebooks/api/03_ctx.ipynb 121
 @call_parse
 def ctx_calib(
         pid: str,  # CTX product_id
         source: str = "",  # path to where EDRs are stored if not from plpy
         proc_root: str = "",  # path to where processed data is to be stored
         overwrite: bool = False,  # overwrite processed data
+        telemetry: str = "",  # JSON lines or parquet file to append the stage telemetry to
 ):
     ctx = CTX(pid, source_dir=source, proc_root=proc_root)
-    ctx.calib_pipeline(overwrite=overwrite)
+    ctx.calib_pipeline(overwrite=overwrite, log=telemetry or None)
     print("Produced\n", ctx.cal_path)
@@ -1,3 +1,123 @@
-# AUTOGENERATED! DO NOT EDIT! File to edit: notebooks/07_database.ipynb (unless otherwise specified).
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/api/13_db.ipynb.
 
-__all__ = []
\ No newline at end of file
+# %% auto 0
+__all__ = ['logger', 'storage_root', 'cache', 'table_name', 'IndexDB', 'get_db', 'query']
+
+# %% ../notebooks/api/13_db.ipynb 4
+import logging
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+from fastcore.xtras import Path
+
+from .config import config
+from .pds.apps import list_all_indexes
+from .pds.indexes import Index
+
+logger = logging.getLogger(__name__)
+
+storage_root = Path(config.storage_root)
+
+# %% ../notebooks/api/13_db.ipynb 5
+def table_name(
+    key: str,  # Dotted index key, e.g. mro.ctx.edr
+) -> str:  # Name of the view, e.g. mro_ctx_edr
+    "Name of the SQL view for an index."
+    return key.replace("missions.", "").replace(".indexes.", ".").replace(".", "_")
+
+
+def _sql_string(path) -> str:
+    "`path` as quoted SQL string literal."
+    return "'" + str(path).replace("'", "''") + "'"
+
+# %% ../notebooks/api/13_db.ipynb 8
+class IndexDB:
+    """SQL access to all downloaded PDS indexes.
+
+    Only indexes that are already converted to parquet are registered, nothing is downloaded.
+    """
+
+    def __init__(
+        self,
+        database: str = ":memory:",  # DuckDB database file. Default: in memory, the views are cheap
+        threads: int = None,  # Number of threads for the scans. Default: all cores
+        memory_limit: str = None,  # e.g. "4GB", DuckDB spills to disk beyond that
+    ):
+        self.con = duckdb.connect(database)
+        if threads:
+            self.con.execute(f"SET threads = {int(threads)}")
+        if memory_limit:
+            self.con.execute(f"SET memory_limit = '{memory_limit}'")
+        self.tables = {}  # view name -> dotted index key
+        self.register_all()
+
+    def register(
+        self,
+        key: str,  # Dotted index key, e.g. mro.ctx.edr
+    ) -> str:  # Name of the view, None if the index is not downloaded
+        "Create or update the view of one index."
+        mission, instrument, index_name = [t for t in key.split(".") if t not in ("missions", "indexes")]
+        # don't create an Index object for indexes that were never downloaded, it creates folders
+        root = Path(config.storage_root)
+        if not (root / "missions" / mission / instrument / "indexes" / index_name).exists():
+            return None
+        index = Index(key, check_update=False)
+        if index.local_dataset_path.exists():
+            files = _sql_string(index.local_dataset_path / "**" / "*.parquet")
+            source = f"read_parquet({files}, hive_partitioning = true)"
+        elif index.local_parq_path.exists():
+            source = f"read_parquet({_sql_string(index.local_parq_path)})"
+        else:
+            return None
+        columns = [row[0] for row in self.con.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()]
+        # stored pandas index, not part of the PDS index
+        exclude = " EXCLUDE (__index_level_0__)" if "__index_level_0__" in columns else ""
+        name = table_name(key)
+        self.con.execute(f"CREATE OR REPLACE VIEW {name} AS SELECT *{exclude} FROM {source}")
+        self.tables[name] = key
+        return name
+
+    def register_all(self):
+        "Register all downloaded indexes."
+        for key in list_all_indexes():
+            try:
+                self.register(key)
+            except (IndexError, duckdb.Error) as e:
+                logger.warning("Could not register %s: %s", key, e)
+
+    def query(
+        self,
+        sql: str,  # SQL query, using the view names in `tables`
+        batch_size: int = 100_000,  # Number of rows per record batch
+    ) -> pa.RecordBatchReader:  # Streams the result in Arrow record batches
+        "Run a query, streaming its result."
+        return self.con.execute(sql).fetch_record_batch(batch_size)
+
+    def query_df(
+        self,
+        sql: str,  # SQL query, using the view names in `tables`
+    ) -> pd.DataFrame:
+        "Run a query and return the complete result as DataFrame."
+        return self.con.execute(sql).df()
+
+    def __repr__(self):
+        return f"IndexDB with tables: {', '.join(self.tables)}"
+
+# %% ../notebooks/api/13_db.ipynb 9
+cache = dict()
+
+
+def get_db() -> IndexDB:
+    "The shared `IndexDB`, created on first use."
+    if "db" not in cache:
+        cache["db"] = IndexDB()
+    return cache["db"]
+
+
+def query(
+    sql: str,  # SQL query, using the view names of `get_db().tables`
+    batch_size: int = 100_000,  # Number of rows per record batch
+) -> pa.RecordBatchReader:  # Streams the result in Arrow record batches
+    "Run a query on all downloaded indexes."
+    return get_db().query(sql, batch_size)
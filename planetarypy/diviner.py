@@ -1,25 +1,36 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/api/07_diviner.ipynb.
 
 # %% auto 0
-__all__ = ['hostname', 'headerstring', 'DataManager', 'parse_header_line', 'L1AHeader', 'read_l1a_data', 'get_data_path']
+__all__ = ['logger', 'hostname', 'cache_root', 'headerstring', 'DataManager', 'parse_header_line', 'L1AHeader', 'read_l1a_data',
+           'local_l1a_files', 'iter_l1a_data', 'get_data_path', 'l1a_tstrs', 'load_l1a_range']
 
 # %% ../notebooks/api/07_diviner.ipynb 3
+import logging
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Union
 
 from yarl import URL
 
 import hvplot.xarray  # noqa
+from dask import dataframe as dd
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv
 from .config import config
 from .utils import url_retrieve
 
 # %% ../notebooks/api/07_diviner.ipynb 4
+logger = logging.getLogger(__name__)
+
 hostname = socket.gethostname()
 if hostname.startswith("luna") and hostname.endswith("diviner.ucla.edu"):
     storage_root = Path("/q/marks/feidata/DIV:opsL1A/data")
 else:
     storage_root = config.storage_root / "missions/lro/diviner"
+# the parquet caches always go to the user's storage
+cache_root = config.storage_root / "missions/lro/diviner"
 
 # %% ../notebooks/api/07_diviner.ipynb 5
 class DataManager:
@@ -61,12 +72,44 @@ class DataManager:
         end = self.url.parts[-4:]
         return storage_root / Path(*end)
 
+    @property
+    def parquet_path(self):
+        "Columnar cache of the table."
+        end = self.url.parts[-4:]
+        return cache_root / Path(*end).with_suffix(".parquet")
+
+    @property
+    def parquet_is_current(self):
+        "If the columnar cache exists and is not older than the table, e.g. after a new download."
+        if not self.parquet_path.exists():
+            return False
+        if not self.local_path.exists():  # the table was removed after the conversion
+            return True
+        return self.parquet_path.stat().st_mtime >= self.local_path.stat().st_mtime
+
     def download(self, overwrite=False):
         if self.local_path.exists() and not overwrite:
             print("File exists. Use `overwrite=True` to get a fresh copy.")
             return
         self.local_path.parent.mkdir(parents=True, exist_ok=True)
-        url_retrieve(self.url, self.local_path)
+        # download next to the target, so that an interrupted download doesn't look complete
+        tmppath = self.local_path.with_suffix(".part")
+        url_retrieve(self.url, tmppath)
+        tmppath.replace(self.local_path)
+
+    def to_parquet(self):
+        "Convert the table once into the columnar cache, adding a `datetime` column."
+        df = read_l1a_data(self.local_path)
+        dt = pd.to_datetime(
+            df["date"] + " " + df["utc"], format="%d-%b-%Y %H:%M:%S.%f", errors="coerce"
+        )
+        df = pd.concat([df, dt.rename("datetime")], axis=1)
+        self.parquet_path.parent.mkdir(parents=True, exist_ok=True)
+        # like `download`, so that an interrupted conversion doesn't look complete
+        tmppath = self.parquet_path.with_name(self.parquet_path.name + ".part")
+        df.to_parquet(tmppath)
+        tmppath.replace(self.parquet_path)
+        return self.parquet_path
 
 # %% ../notebooks/api/07_diviner.ipynb 8
 headerstring = (
@@ -105,21 +148,146 @@ class L1AHeader:
     metadatacols = list(set(columns) - set(datacols))
     metadatacols.sort()
 
+    @classmethod
+    def select(
+        cls,
+        metadata: bool = True,  # Include the metadata columns
+        telescope: str = "ab",  # Telescopes to include: "a", "b" or "ab"
+        channels: list = None,  # Channel numbers, e.g. [3, 4]. Default: all of the telescopes
+        detectors: list = None,  # Detector numbers 1-21. Default: all
+    ) -> list:  # Column names in file order
+        "Select columns for `read_l1a_data`."
+        selected = []
+        for col in cls.columns:
+            if col not in cls.datacols:
+                if metadata:
+                    selected.append(col)
+            elif (
+                col[0] in telescope
+                and (channels is None or int(col[1]) in channels)
+                and (detectors is None or int(col[3:]) in detectors)
+            ):
+                selected.append(col)
+        return selected
 
-def read_l1a_data(fname, nrows=None):
-    df = pd.io.parsers.read_csv(
-        fname,
-        names=L1AHeader.columns,
-        na_values="-9999",
-        skiprows=8,
-        skipinitialspace=True,
+
+def _read_options(columns, skiprows):
+    return dict(
+        read_options=csv.ReadOptions(column_names=L1AHeader.columns, skip_rows=skiprows),
+        convert_options=csv.ConvertOptions(
+            include_columns=columns,
+            column_types={col: pa.float32() for col in columns if col in L1AHeader.datacols},
+        ),
     )
+
+
+def _clean_fields(df):
+    "Strip the padding of text fields and set -9999 to NaN, like `skipinitialspace` and `na_values` in pandas."
+    for col in df.columns:
+        if pd.api.types.is_string_dtype(df[col]):
+            df[col] = df[col].str.strip()
+        elif pd.api.types.is_numeric_dtype(df[col]) and (df[col] == -9999).any():
+            df[col] = df[col].where(df[col] != -9999)
     return df
-    return parse_times(df)
 
-# %% ../notebooks/api/07_diviner.ipynb 17
+
+def read_l1a_data(
+    fname: Union[str, Path],  # Path to a Diviner L1A EDR table
+    nrows: int = None,  # Only read the first `nrows` rows
+    columns: list = None,  # Columns to read, see `L1AHeader.select`. Default: all
+    skiprows: int = 8,  # Number of header lines
+) -> pd.DataFrame:
+    """Read a Diviner L1A EDR table.
+
+    Uses Arrow's multi-threaded csv reader, only converting the requested columns.
+    The detector columns are read as float32, with -9999 as NaN.
+    """
+    columns = L1AHeader.columns if columns is None else [col.lower() for col in columns]
+    options = _read_options(columns, skiprows)
+    if nrows is None:
+        table = csv.read_csv(fname, **options)
+    else:  # stream only the needed blocks
+        batches, n = [], 0
+        with csv.open_csv(fname, **options) as reader:
+            for batch in reader:
+                batches.append(batch)
+                n += batch.num_rows
+                if n >= nrows:
+                    break
+        table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, nrows)
+    return _clean_fields(table.to_pandas())
+
+
+def local_l1a_files(
+    month: str,  # Month as YYYYMM, or a day as YYYYMMDD
+) -> list:  # Sorted paths of the downloaded L1A EDR tables
+    "Find the downloaded L1A EDR tables of a month or day."
+    pattern = f"{month[:4]}/{month[:6]}/{month[:8] if len(month) > 6 else '*'}/*_edr.tab"
+    return sorted(Path(storage_root).glob(pattern))
+
+
+def iter_l1a_data(
+    source,  # Path to one table, list of paths, or a month as YYYYMM (or day as YYYYMMDD)
+    columns: list = None,  # Columns to read, see `L1AHeader.select`. Default: all
+    nrows: int = None,  # Only read the first `nrows` rows of each table
+):  # Iterator of (path, DataFrame) per table
+    "Read one or many L1A EDR tables, one at a time."
+    if isinstance(source, (list, tuple)):
+        fnames = source
+    elif Path(source).is_file():
+        fnames = [source]
+    else:
+        fnames = local_l1a_files(str(source))
+    for fname in fnames:
+        yield fname, read_l1a_data(fname, nrows=nrows, columns=columns)
+
+# %% ../notebooks/api/07_diviner.ipynb 23
 def get_data_path(tstr):
     dm = DataManager(tstr)
     if not dm.local_path.exists():
         dm.download()
     return dm.local_path
+
+# %% ../notebooks/api/07_diviner.ipynb 26
+def l1a_tstrs(
+    t0,  # Start time, anything `pd.Timestamp` understands
+    t1,  # End time
+) -> list:  # Hourly time strings of the form YYYYMMDDHH, as used by `DataManager`
+    "Time strings of all L1A EDR tables between t0 and t1."
+    hours = pd.date_range(pd.Timestamp(t0).floor("h"), pd.Timestamp(t1), freq="h")
+    return [f"{hour:%Y%m%d%H}" for hour in hours]
+
+
+def _cache_l1a(dm):
+    if not dm.local_path.exists():
+        try:
+            dm.download()
+        except ConnectionError as e:  # hours without data
+            logger.warning(str(e))
+            return None
+    return dm.to_parquet()
+
+
+def load_l1a_range(
+    t0,  # Start time, anything `pd.Timestamp` understands
+    t1,  # End time
+    columns: list = None,  # Columns to read, see `L1AHeader.select`. Default: all
+    max_workers: int = 8,  # Number of concurrent downloads and conversions
+) -> dd.DataFrame:  # Lazily concatenated tables, limited to t0 <= datetime <= t1
+    """Load all L1A EDR data between t0 and t1.
+
+    Missing tables are downloaded concurrently and converted to parquet once.
+    Tables that are newer than their parquet file, e.g. downloaded again, are converted again.
+    """
+    dms = [DataManager(tstr) for tstr in l1a_tstrs(t0, t1)]
+    todo = [dm for dm in dms if not dm.parquet_is_current]
+    if todo:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_cache_l1a, todo))
+    paths = [str(dm.parquet_path) for dm in dms if dm.parquet_path.exists()]
+    if not paths:
+        raise FileNotFoundError(f"No Diviner L1A data found between {t0} and {t1}.")
+    if columns is not None:
+        columns = [col.lower() for col in columns if col != "datetime"] + ["datetime"]
+    ddf = dd.read_parquet(paths, columns=columns)
+    return ddf[(ddf.datetime >= pd.Timestamp(t0)) & (ddf.datetime <= pd.Timestamp(t1))]
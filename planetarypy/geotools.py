@@ -1,13 +1,18 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/api/08_geotools.ipynb.
 
 # %% auto 0
-__all__ = ['calculate_image_azimuth', 'get_north_shifted_point', 'calculate_image_north_azimuth', 'get_sun_angles', 'debug_srs',
-           'shift_to_center', 'pixel_to_meter', 'Point', 'Window', 'ImgData']
+__all__ = ['srs_cache', 'BlockStats', 'calculate_image_azimuth', 'get_north_shifted_point', 'calculate_image_north_azimuth',
+           'get_sun_angles', 'debug_srs', 'shift_to_center', 'pixel_to_meter', 'get_sun_angles_batch', 'SRSCache',
+           'ThreadLocalSRSCache', 'Point', 'Window', 'mask_nodata', 'ImgData']
 
 # %% ../notebooks/api/08_geotools.ipynb 3
+import threading
+from collections import OrderedDict, namedtuple
+
 import matplotlib.cm as cm
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 from matplotlib.pyplot import figure, show
 from mpl_toolkits.axes_grid1.anchored_artists import AnchoredSizeBar
 
@@ -142,6 +147,173 @@ def pixel_to_meter(sample, line, geotransform, shift=False):
     return (x, y)
 
 # %% ../notebooks/api/08_geotools.ipynb 5
+def _sun_angles_chunk(args):
+    """Vectorized solar azimuth and incidence for arrays of surface points and times.
+
+    This replicates `Spicer.illum_angles.dsolar` for observer-less Spicers and measures
+    the azimuth in the local tangent plane, clockwise from north.
+    """
+    import spiceypy as spice
+
+    from planetarypy.spice.kernels import load_generic_kernels
+
+    target, body, ref_frame, corr, lons, lats, times = args
+    # rows without an observation time get NaN angles instead of failing the whole chunk
+    valid = ~pd.isna(times)
+    azimuth, incidence = np.full(len(times), np.nan), np.full(len(times), np.nan)
+    if not valid.any():
+        return azimuth, incidence
+    if spice.ktotal("all") == 0:  # fresh worker process without inherited kernels
+        load_generic_kernels()
+    _, (a, b, c) = spice.bodvrd(target, "RADII", 3)
+    lon, lat = np.radians(lons[valid]), np.radians(lats[valid])
+    # surface points on the reference ellipsoid, like `spice.srfrec`
+    u = np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+    radius = 1 / np.sqrt((u**2 / np.array([a, b, c]) ** 2).sum(axis=1))
+    spoints = u * radius[:, None]
+    # ellipsoid surface normals, like `spice.surfnm`
+    normals = spoints / np.array([a, b, c]) ** 2
+    normals /= np.linalg.norm(normals, axis=1)[:, None]
+    ets = np.atleast_1d(spice.str2et(list(times[valid])))
+    center_to_sun, _ = spice.spkpos("SUN", ets, ref_frame, corr, body)
+    sun_dirs = np.atleast_2d(center_to_sun) - spoints
+    sun_dirs /= np.linalg.norm(sun_dirs, axis=1)[:, None]
+    incidence[valid] = np.degrees(np.arccos(np.clip((sun_dirs * normals).sum(axis=1), -1, 1)))
+    # local east is perpendicular to the spin axis and the surface normal, also for triaxial bodies
+    east = np.cross([0.0, 0.0, 1.0], normals)
+    east_norm = np.linalg.norm(east, axis=1)
+    at_pole = east_norm < 1e-12
+    east[at_pole] = np.column_stack([-np.sin(lon), np.cos(lon), np.zeros_like(lon)])[at_pole]
+    east[~at_pole] /= east_norm[~at_pole, None]
+    north = np.cross(normals, east)
+    azimuth[valid] = np.degrees(np.arctan2((sun_dirs * east).sum(axis=1), (sun_dirs * north).sum(axis=1))) % 360
+    return azimuth, incidence
+
+
+def get_sun_angles_batch(
+    spicer,  # Spicer for the body of the images, e.g. MarsSpicer(). Its time and spoint are not used.
+    df: pd.DataFrame,  # Table with one row per image, e.g. a PDS index
+    lon_col: str = "CENTER_LONGITUDE",  # column with center longitudes [deg], HiRISE: IMAGE_CENTER_LONGITUDE
+    lat_col: str = "CENTER_LATITUDE",  # column with center latitudes [deg], HiRISE: IMAGE_CENTER_LATITUDE
+    time_col: str = "IMAGE_TIME",  # column with observation times (datetimes or strings SPICE can parse)
+    chunksize: int = 20_000,  # rows per worker task
+    max_workers: int = None,  # number of processes, default from `process_map`. 1 to run in this process.
+) -> pd.DataFrame:  # columns SOLAR_AZIMUTH and SOLAR_INCIDENCE [deg], with the index of `df`
+    """Calculate solar azimuth and incidence for the image centers of a whole table.
+
+    This is the batch version of `get_sun_angles`, meant for annotating complete index
+    catalogs. Instead of scalar SPICE calls per image, the geometry is calculated with
+    array operations for chunks of rows, which are distributed over several processes.
+
+    Note that without an image, the azimuth is geographic, i.e. measured clockwise from
+    local north, not in image coordinates as in `get_sun_angles`.
+    """
+    from tqdm.contrib.concurrent import process_map
+
+    times = df[time_col]
+    if pd.api.types.is_datetime64_any_dtype(times):
+        times = times.dt.strftime("%Y-%m-%dT%H:%M:%S.%f")
+    lons = df[lon_col].to_numpy(dtype="float64")
+    lats = df[lat_col].to_numpy(dtype="float64")
+    # missing times stay None, so that `_sun_angles_chunk` can mask them
+    times = times.astype(str).where(times.notna(), None).to_numpy()
+    args = [
+        (spicer.target, spicer.body, spicer.ref_frame, spicer.corr,
+         lons[i : i + chunksize], lats[i : i + chunksize], times[i : i + chunksize])
+        for i in range(0, len(df), chunksize)
+    ]
+    if max_workers == 1 or len(args) < 2:
+        results = [_sun_angles_chunk(arg) for arg in args]
+    else:
+        results = process_map(_sun_angles_chunk, args, max_workers=max_workers, desc="Solar geometry")
+    if not results:
+        return pd.DataFrame(columns=["SOLAR_AZIMUTH", "SOLAR_INCIDENCE"], index=df.index, dtype="float64")
+    return pd.DataFrame(
+        {
+            "SOLAR_AZIMUTH": np.concatenate([r[0] for r in results]),
+            "SOLAR_INCIDENCE": np.concatenate([r[1] for r in results]),
+        },
+        index=df.index,
+    )
+
+# %% ../notebooks/api/08_geotools.ipynb 9
+class SRSCache:
+    """Keyed cache for parsed spatial references and coordinate transformations.
+
+    Parsing a WKT projection string into an `osr.SpatialReference` and creating the
+    `osr.CoordinateTransformation` objects from it is much more expensive than
+    transforming a single point. This cache creates these objects once per projection
+    string (and inverse geotransforms once per geotransform) and re-uses them.
+
+    OSR objects are not thread-safe, so use `ThreadLocalSRSCache` if points are being
+    transformed from several threads.
+    Each kind of object is kept for at most `maxsize` keys, the least recently used
+    ones are dropped first.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 64,  # max number of cached objects per kind
+    ):
+        self.maxsize = maxsize
+        self.clear()
+
+    def clear(self):
+        "Drop all cached objects."
+        self._srs = OrderedDict()
+        self._transforms = OrderedDict()
+        self._inv_geotransforms = OrderedDict()
+
+    def _get(self, store, key, create):
+        try:
+            store.move_to_end(key)
+            return store[key]
+        except KeyError:
+            pass
+        value = store[key] = create()
+        if len(store) > self.maxsize:
+            store.popitem(last=False)
+        return value
+
+    def srs(
+        self,
+        projection: str,  # WKT projection string, e.g. from `dataset.GetProjection()`
+    ):  # osr.SpatialReference, corrected by `debug_srs`
+        "Get the parsed spatial reference for `projection`."
+        return self._get(self._srs, projection, lambda: debug_srs(projection))
+
+    def transformation(
+        self,
+        projection: str,  # WKT projection string
+        to_lonlat: bool = True,  # True: map coordinates -> lon/lat, False: lon/lat -> map coordinates
+    ):  # osr.CoordinateTransformation
+        "Get the forward or inverse coordinate transformation for `projection`."
+
+        def create():
+            srs = self.srs(projection)
+            if to_lonlat:
+                return osr.CoordinateTransformation(srs, srs.CloneGeogCS())
+            return osr.CoordinateTransformation(srs.CloneGeogCS(), srs)
+
+        return self._get(self._transforms, (projection, to_lonlat), create)
+
+    def inv_geotransform(
+        self,
+        geotransform,  # Geotransform in format as given by GDAL datasets.GetGeoTransform()
+    ):  # Inverse geotransform as calculated by `gdal.InvGeoTransform`
+        "Get the inverse of `geotransform`."
+        key = tuple(geotransform)
+        return self._get(self._inv_geotransforms, key, lambda: gdal.InvGeoTransform(key))
+
+
+class ThreadLocalSRSCache(SRSCache, threading.local):
+    "`SRSCache` that keeps a separate set of cached OSR objects for each thread."
+    pass
+
+
+srs_cache = ThreadLocalSRSCache()
+
+# %% ../notebooks/api/08_geotools.ipynb 14
 class Point:
     """Point class to manage pixel and map points and their transformations.
 
@@ -300,7 +472,7 @@ class Point:
         if (self.x is None) or (self.y is None):
             raise SomethingNotSetError((self.x, self.y), "Map coordinates not "
                                        "set for transformation.")
-        tInverse = gdal.InvGeoTransform(geotransform)
+        tInverse = srs_cache.inv_geotransform(geotransform)
         self.sample, self.line = gdal.ApplyGeoTransform(tInverse, self.x, self.y)
         return (self.sample, self.line)
 
@@ -319,8 +491,7 @@ class Point:
             projection = self.proj
         if projection is None:
             raise ProjectionNotSetError("lonlat_to_meter")
-        srs = debug_srs(projection)
-        ct = osr.CoordinateTransformation(srs, srs.CloneGeogCS())
+        ct = srs_cache.transformation(projection, to_lonlat=True)
         self.lon, self.lat, height = ct.TransformPoint(self.x, self.y)
         if self.lon < 0:
             self.lon = 360.0 - abs(self.lon)
@@ -331,8 +502,7 @@ class Point:
             projection = self.proj
         if projection is None:
             raise ProjectionNotSetError("lonlat_to_meter")
-        srs = debug_srs(projection)
-        ct = osr.CoordinateTransformation(srs.CloneGeogCS(), srs)
+        ct = srs_cache.transformation(projection, to_lonlat=False)
         # height not used so far!
         self.x, self.y, height = ct.TransformPoint(self.lon, self.lat)
         return (self.x, self.y)
@@ -340,7 +510,7 @@ class Point:
     def calculate_azimuth(self, p2, zero="right"):
         return calculate_image_azimuth(self, p2, zero=zero)
 
-# %% ../notebooks/api/08_geotools.ipynb 6
+# %% ../notebooks/api/08_geotools.ipynb 17
 class Window:
     """class to manage a window made of corner Points (objects of Point())
 
@@ -461,7 +631,30 @@ class Window:
             self.lr.pixel_to_lonlat(dataset.GetGeoTransform(), dataset.GetProjection())
             return [self.ul.lon, self.lr.lon, self.lr.lat, self.ul.lat]
 
-# %% ../notebooks/api/08_geotools.ipynb 7
+# %% ../notebooks/api/08_geotools.ipynb 18
+BlockStats = namedtuple("BlockStats", "min max mean std count")
+"""Statistics of a raster band, accumulated block by block.
+
+`count` is the number of valid (i.e. not nodata) pixels.
+"""
+
+
+def mask_nodata(
+    data: np.ndarray,  # raster data as read by GDAL
+    ndv=None,  # nodata value, NaN is supported
+) -> np.ma.MaskedArray:
+    """Mask the nodata values of `data` without copying it.
+
+    Only the boolean mask is newly allocated, the returned masked array shares its
+    data with `data`.
+    """
+    if ndv is None:
+        return np.ma.MaskedArray(data, copy=False)
+    if np.isnan(ndv):
+        return np.ma.masked_invalid(data, copy=False)
+    return np.ma.masked_equal(data, ndv, copy=False)
+
+# %% ../notebooks/api/08_geotools.ipynb 19
 class ImgData:
     """docstring for ImgData"""
 
@@ -482,7 +675,7 @@ class ImgData:
         band = getattr(self, band)
         data = band.ReadAsArray(*self.window.get_gdal_window())
         ndv = band.GetNoDataValue()
-        mdata = np.ma.masked_equal(data, ndv)
+        mdata = mask_nodata(data, ndv)
         self.data = data
         self.mdata = mdata
 
@@ -522,7 +715,7 @@ class ImgData:
         # if full res is smaller than maxdim, get everything
         if (maxdim > self.X) and (maxdim > self.Y):
             data = b.ReadAsArray()
-            mdata = np.ma.masked_equal(data, ndv)
+            mdata = mask_nodata(data, ndv)
         else:
             # Don't want to load the entire dataset for stats computation
             # This is maximum dimension for reduced resolution array
@@ -538,7 +731,7 @@ class ImgData:
 
             # The buf_size parameters determine the final array dimensions
             data = np.array(b.ReadAsArray(buf_xsize=ns, buf_ysize=nl))
-            mdata = np.ma.masked_equal(data, ndv)
+            mdata = mask_nodata(data, ndv)
         self.mdata = mdata
         self.data = data
         return mdata
@@ -569,6 +762,135 @@ class ImgData:
         self._read_data(band)
         return self.data
 
+    def block_windows(
+        self,
+        band="band1",
+        max_pixels=2**22,  # strip-organized rasters get several strips per window up to this size
+    ):
+        """Generate (xoff, yoff, xsize, ysize) windows aligned to the natural block size of `band`.
+
+        Reading along the storage blocks of the file means every block is decoded only once.
+        For files organized in strips (blocks as wide as the image), several strips are
+        combined into one window to avoid a read per image line.
+        """
+        bx, by = getattr(self, band).GetBlockSize()
+        if bx >= self.X:
+            by *= max(1, max_pixels // (bx * by))
+        for yoff in range(0, self.Y, by):
+            ysize = min(by, self.Y - yoff)
+            for xoff in range(0, self.X, bx):
+                yield xoff, yoff, min(bx, self.X - xoff), ysize
+
+    def iter_blocks(
+        self,
+        band="band1",
+        max_pixels=2**22,  # see `block_windows`
+    ):
+        """Iterate over `band` block by block, yielding (xoff, yoff, masked data).
+
+        Only one block is in memory at any time, so this works for rasters of any size.
+        The data is masked for the band's nodata value.
+        """
+        b = getattr(self, band)
+        ndv = b.GetNoDataValue()
+        for xoff, yoff, xsize, ysize in self.block_windows(band, max_pixels):
+            yield xoff, yoff, mask_nodata(b.ReadAsArray(xoff, yoff, xsize, ysize), ndv)
+
+    def block_stats(self, band="band1") -> BlockStats:
+        """Calculate min, max, mean, std and count of valid pixels of `band` in fixed memory.
+
+        Count, mean and sum of squared deviations of the blocks are merged pairwise
+        (Chan et al.), so the std stays precise for data with a large offset, like DN
+        or elevation rasters.
+        """
+        vmin, vmax = np.inf, -np.inf
+        count, mean, m2 = 0, 0.0, 0.0
+        for _, _, mdata in self.iter_blocks(band):
+            values = mdata.compressed().astype("float64")
+            n = values.size
+            if n == 0:
+                continue
+            vmin = min(vmin, mdata.min())
+            vmax = max(vmax, mdata.max())
+            block_mean = values.mean()
+            block_m2 = ((values - block_mean) ** 2).sum()
+            delta = block_mean - mean
+            total = count + n
+            mean += delta * n / total
+            m2 += block_m2 + delta**2 * count * n / total
+            count = total
+        if count == 0:
+            return BlockStats(np.nan, np.nan, np.nan, np.nan, 0)
+        return BlockStats(vmin, vmax, mean, np.sqrt(m2 / count), count)
+
+    def block_histogram(
+        self,
+        bins=256,  # number of bins
+        range=None,  # (min, max) of the histogram; by default from `block_stats`, requiring another pass
+        band="band1",
+    ):
+        """Calculate the histogram of valid pixels of `band` in fixed memory.
+
+        Returns the same (hist, bin_edges) tuple as `np.histogram`.
+        """
+        if range is None:
+            stats = self.block_stats(band)
+            range = (stats.min, stats.max)
+        hist = np.zeros(bins, dtype="int64")
+        for _, _, mdata in self.iter_blocks(band):
+            h, edges = np.histogram(mdata.compressed(), bins=bins, range=range)
+            hist += h
+        if hist.sum() == 0:
+            edges = np.histogram_bin_edges([], bins=bins, range=range)
+        return hist, edges
+
+    def iter_uint8_blocks(
+        self,
+        vmin=None,  # data value to map to the lowest output value, default: band minimum
+        vmax=None,  # data value to map to 255, default: band maximum
+        band="band1",
+    ):
+        """Iterate over `band` block-wise, linearly stretched to uint8.
+
+        If the band has a nodata value, valid data is stretched to 1..255 and nodata is set to 0.
+        """
+        if vmin is None or vmax is None:
+            stats = self.block_stats(band)
+            vmin = stats.min if vmin is None else vmin
+            vmax = stats.max if vmax is None else vmax
+        has_ndv = getattr(self, band).GetNoDataValue() is not None
+        low = 1 if has_ndv else 0
+        scale = (255 - low) / (vmax - vmin) if vmax > vmin else 0.0
+        for xoff, yoff, mdata in self.iter_blocks(band):
+            stretched = mdata.astype("float32")
+            stretched -= vmin
+            stretched *= scale
+            stretched += low
+            np.clip(stretched, low, 255, out=stretched)
+            yield xoff, yoff, stretched.filled(0).astype("uint8")
+
+    def write_uint8(
+        self,
+        outpath,  # path for the new file
+        vmin=None,  # see `iter_uint8_blocks`
+        vmax=None,  # see `iter_uint8_blocks`
+        band="band1",
+        driver="GTiff",  # GDAL driver name for the output
+    ):
+        "Write a uint8 stretched copy of `band` block by block, keeping the geo-referencing."
+        drv = gdal.GetDriverByName(driver)
+        options = ["TILED=YES", "COMPRESS=DEFLATE", "BIGTIFF=IF_SAFER"] if driver == "GTiff" else []
+        out = drv.Create(str(outpath), self.X, self.Y, 1, gdal.GDT_Byte, options=options)
+        out.SetGeoTransform(self.geotrans)
+        out.SetProjection(self.projection)
+        outband = out.GetRasterBand(1)
+        if getattr(self, band).GetNoDataValue() is not None:
+            outband.SetNoDataValue(0)
+        for xoff, yoff, data in self.iter_uint8_blocks(vmin, vmax, band):
+            outband.WriteArray(data, xoff, yoff)
+        out.FlushCache()
+        return outpath
+
     def window_coords_to_meter(self):
         self.window.ul.pixel_to_meter(self.geotrans)
         self.window.lr.pixel_to_meter(self.geotrans)
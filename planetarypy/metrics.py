@@ -0,0 +1,291 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/api/12_metrics.ipynb.
+
+# %% auto 0
+__all__ = ['default_buckets', 'descriptions', 'registry', 'Histogram', 'Registry', 'enable', 'disable', 'inc', 'observe', 'timer',
+           'cache_access', 'track_response', 'track_bytes', 'track_parse', 'snapshot', 'write', 'start_exporter']
+
+# %% ../notebooks/api/12_metrics.ipynb 4
+import bisect
+import itertools
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+
+# %% ../notebooks/api/12_metrics.ipynb 6
+# upper bounds of the default histogram buckets, in seconds
+default_buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+
+class Histogram:
+    "Counts of observed values per bucket, with their sum, like a Prometheus histogram."
+
+    def __init__(self, buckets=default_buckets):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # the last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list:  # (upper bound, count of values <= bound) pairs
+        return list(zip(self.buckets + (math.inf,), itertools.accumulate(self.counts)))
+
+
+class Registry:
+    """Counters and histograms of one process, keyed by metric name and labels.
+
+    Metrics are created on first use. `describe` adds help texts and histogram buckets.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        "Drop all recorded values."
+        with self.lock:
+            self.counters = {}
+            self.histograms = {}
+        self.help = dict(descriptions)
+        self.buckets = {}
+
+    def describe(
+        self,
+        name: str,  # Metric name
+        help: str,  # Help text of the exports
+        buckets: tuple = None,  # Upper bounds of the histogram buckets
+    ):
+        self.help[name] = help
+        if buckets is not None:
+            self.buckets[name] = buckets
+
+    def inc(self, name: str, value: float = 1, labels: dict = None):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: dict = None):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self.lock:
+            if key not in self.histograms:
+                self.histograms[key] = Histogram(self.buckets.get(name, default_buckets))
+            self.histograms[key].observe(value)
+
+    def snapshot(self) -> dict:
+        "All current values as JSON-serializable dict."
+        with self.lock:
+            counters = [dict(name=name, labels=dict(labels), value=value) for (name, labels), value in self.counters.items()]
+            histograms = [
+                dict(
+                    name=name,
+                    labels=dict(labels),
+                    count=h.count,
+                    sum=h.sum,
+                    buckets={str(bound): n for bound, n in h.cumulative()},
+                )
+                for (name, labels), h in self.histograms.items()
+            ]
+        return dict(time=time.time(), pid=os.getpid(), counters=counters, histograms=histograms)
+
+    def to_prometheus(self) -> str:
+        "All current values in the Prometheus text exposition format."
+        lines = []
+        with self.lock:
+            for kind, metrics in [("counter", self.counters), ("histogram", self.histograms)]:
+                for name in sorted({name for name, _ in metrics}):
+                    if name in self.help:
+                        lines.append(f"# HELP {name} {self.help[name]}")
+                    lines.append(f"# TYPE {name} {kind}")
+                    for (other, labels), value in sorted(metrics.items()):
+                        if other != name:
+                            continue
+                        if kind == "counter":
+                            lines.append(f"{name}{_labels(labels)} {_number(value)}")
+                            continue
+                        for bound, n in value.cumulative():
+                            le = "+Inf" if bound == math.inf else f"{bound:g}"
+                            lines.append(f"{name}_bucket{_labels(labels + (('le', le),))} {n}")
+                        lines.append(f"{name}_sum{_labels(labels)} {_number(value.sum)}")
+                        lines.append(f"{name}_count{_labels(labels)} {value.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(
+        self,
+        path: str,  # .json for a JSON snapshot, else Prometheus text, e.g. for the textfile collector
+    ) -> Path:
+        "Write all current values to `path`, replacing it atomically."
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = json.dumps(self.snapshot()) if path.suffix == ".json" else self.to_prometheus()
+        tmppath = path.with_name(path.name + ".tmp")
+        tmppath.write_text(text)
+        tmppath.replace(path)
+        return path
+
+
+def _number(value: float) -> str:
+    "Full precision, without exponent for whole numbers like byte counts."
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in labels)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+# %% ../notebooks/api/12_metrics.ipynb 7
+# metrics recorded by planetarypy
+descriptions = {
+    "planetarypy_http_requests_total": "HTTP requests by host and status code.",
+    "planetarypy_http_request_seconds": "Time until the HTTP response headers arrived, by host.",
+    "planetarypy_http_retries_total": "Retries of HTTP requests by host.",
+    "planetarypy_download_bytes_total": "Bytes downloaded by host.",
+    "planetarypy_index_load_seconds": "Time to load an index into a DataFrame, by index key and source.",
+    "planetarypy_cache_requests_total": "Cache lookups by cache and result (hit or miss).",
+    "planetarypy_parse_rows_total": "Rows parsed from PDS tables, by parser.",
+    "planetarypy_parse_bytes_total": "Bytes parsed from PDS tables, by parser.",
+    "planetarypy_parse_seconds": "Time to parse a PDS table, by parser.",
+}
+
+registry = Registry(enabled=os.getenv("PLANETARYPY_METRICS", "") not in ("", "0"))
+
+# %% ../notebooks/api/12_metrics.ipynb 9
+def enable():
+    "Start recording metrics in this process."
+    registry.enabled = True
+
+
+def disable():
+    "Stop recording metrics, the recorded values are kept."
+    registry.enabled = False
+
+
+def inc(
+    name: str,  # Counter name
+    value: float = 1,  # Amount to add
+    **labels,  # Label values, e.g. host="pds.nasa.gov"
+):
+    "Increase a counter, if metrics are enabled."
+    if registry.enabled:
+        registry.inc(name, value, labels)
+
+
+def observe(
+    name: str,  # Histogram name
+    value: float,  # Observed value
+    **labels,  # Label values, e.g. index="mro.ctx.edr"
+):
+    "Add a value to a histogram, if metrics are enabled."
+    if registry.enabled:
+        registry.observe(name, value, labels)
+
+
+@contextmanager
+def _timed(name, labels):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.observe(name, time.perf_counter() - t0, labels)
+
+
+_untimed = nullcontext()
+
+
+def timer(
+    name: str,  # Histogram name
+    **labels,  # Label values
+):
+    "Context manager adding its run time in seconds to a histogram, if metrics are enabled."
+    if not registry.enabled:
+        return _untimed
+    return _timed(name, labels)
+
+# %% ../notebooks/api/12_metrics.ipynb 12
+def cache_access(
+    cache: str,  # Name of the cache, e.g. ctx.edrindex
+    hit: bool,  # If the value was found in the cache
+):
+    "Count a cache hit or miss."
+    if registry.enabled:
+        registry.inc("planetarypy_cache_requests_total", 1, dict(cache=cache, result="hit" if hit else "miss"))
+
+
+def track_response(
+    response: requests.Response,
+    *args,  # ignored, so that this works as response hook of a `requests.Session`
+    **kwargs,
+) -> requests.Response:
+    "Count a HTTP request with its status, latency and retries."
+    if registry.enabled:
+        labels = dict(host=urlsplit(response.url).hostname or "")
+        registry.inc("planetarypy_http_requests_total", 1, dict(labels, status=str(response.status_code)))
+        registry.observe("planetarypy_http_request_seconds", response.elapsed.total_seconds(), labels)
+        # urllib3 keeps the history of retries of this request, if a `Retry` was configured
+        retries = getattr(getattr(response.raw, "retries", None), "history", ())
+        if retries:
+            registry.inc("planetarypy_http_retries_total", len(retries), labels)
+    return response
+
+
+def track_bytes(
+    url: str,  # URL the bytes came from
+    nbytes: int,  # Number of bytes downloaded
+):
+    "Count downloaded bytes per host."
+    if registry.enabled:
+        registry.inc("planetarypy_download_bytes_total", nbytes, dict(host=urlsplit(str(url)).hostname or ""))
+
+
+def track_parse(
+    parser: str,  # Name of the parser
+    rows: int,  # Number of parsed rows
+    nbytes: int,  # Number of parsed bytes
+    seconds: float,  # Time it took
+):
+    "Count rows and bytes of a parsed table and its parse time, for throughputs."
+    if registry.enabled:
+        labels = dict(parser=parser)
+        registry.inc("planetarypy_parse_rows_total", rows, labels)
+        registry.inc("planetarypy_parse_bytes_total", nbytes, labels)
+        registry.observe("planetarypy_parse_seconds", seconds, labels)
+
+# %% ../notebooks/api/12_metrics.ipynb 15
+def snapshot() -> dict:
+    "All current values of this process as JSON-serializable dict."
+    return registry.snapshot()
+
+
+def write(
+    path: str,  # .json for a JSON snapshot, else Prometheus text, e.g. for the textfile collector
+) -> Path:
+    "Write the current values to `path`, replacing it atomically."
+    return registry.write(path)
+
+
+def start_exporter(
+    path: str,  # File to write, see `write`
+    interval: float = 60,  # Seconds between writes
+) -> threading.Event:  # Set it to stop the exporter after a last write
+    "Write the metrics to `path` every `interval` seconds in a background thread, e.g. for long-running services."
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            registry.write(path)
+        registry.write(path)
+
+    threading.Thread(target=run, name="planetarypy-metrics", daemon=True).start()
+    return stop
@@ -1,10 +1,17 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../notebooks/api/02c_pds.apps.ipynb.
 
 # %% auto 0
-__all__ = ['find_indexes', 'get_index', 'find_instruments']
+__all__ = ['find_indexes', 'get_index', 'find_instruments', 'list_all_indexes', 'check_indexes', 'refresh_indexes',
+           'pds_index_refresh']
 
 # %% ../../notebooks/api/02c_pds.apps.ipynb 3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
+import requests
+from fastcore.script import call_parse
+from .. import metrics
 from ..config import config
 from .indexes import Index
 
@@ -23,8 +30,23 @@ def get_index(
         # Set to False for faster return time to avoid web scraping
         refresh: bool = True,  
         force: bool = False,  # switch off for faster return time.
+        # only download the new rows of cumulative indexes when refreshing
+        incremental: bool = False,
+        # store the index as partitioned parquet dataset. Default: keep the existing format
+        partitioned: bool = None,
+        filters: list = None,  # List of (column, op, value) tuples to select rows while reading
+        columns: list = None,  # Columns to read. Default: all
+        # (t0, t1) to only read rows in that range of `Index.time_column`, instead of using `filters`
+        time_range: tuple = None,
+        # memory-map an Arrow copy of the index instead of reading the parquet data, see `Index.read_arrow`.
+        # The columns then have `pd.ArrowDtype` dtypes, see `read_arrow_file`
+        mmap: bool = False,
 ) -> pd.DataFrame:  # The PDS index convert to pandas DataFrame
-    """Example: get_index("cassini.iss", "index")"""
+    """Example: get_index("cassini.iss", "index")
+
+    With `partitioned`, filters like `[("VOLUME_ID", ">=", "MROX_4000"), ("VOLUME_ID", "<", "MROX_5000")]`
+    only read the matching partitions.
+    """
     # I need to add the check_update switch to the constructor b/c of dynamic url setting that always
     # wants to go online to find the latest volume URL.
     if not index_name:
@@ -32,13 +54,28 @@ def get_index(
     else:
         index = Index(instr + ".indexes." + index_name, check_update=refresh)
     if not index.local_table_path.exists() or force:
-        index.download()
+        index.download(partitioned=partitioned)
     elif refresh and index.update_available:
-        index.download()
         print("An updated index is available. Downloading...")
-    if not index.local_parq_path.exists():
+        if incremental and index.is_cumulative:
+            index.download_increment()
+        else:
+            index.download(partitioned=partitioned)
+    if partitioned and not index.local_dataset_path.exists():
+        index.convert_to_parquet(partitioned=True)
+    elif partitioned is False and not index.local_parq_path.exists():
+        index.convert_to_parquet(partitioned=False)
+    elif not (index.local_parq_path.exists() or index.local_dataset_path.exists()):
         index.convert_to_parquet()
-    return index.parquet
+    t0 = time.perf_counter()
+    if time_range is not None:
+        source, df = "time_range", index.query_time(*time_range, columns=columns)
+    elif mmap:
+        source, df = "arrow", index.read_arrow(filters=filters, columns=columns)
+    else:
+        source, df = "parquet", index.read_parquet(filters=filters, columns=columns)
+    metrics.observe("planetarypy_index_load_seconds", time.perf_counter() - t0, index=index.key, source=source)
+    return df
 
 # %% ../../notebooks/api/02c_pds.apps.ipynb 14
 def find_instruments(
@@ -46,3 +83,100 @@ def find_instruments(
 ) -> list:  # List of configured instrument names
     "Find existing instruments for a mission."
     return config.list_instruments(mission)
+
+# %% ../../notebooks/api/02c_pds.apps.ipynb 18
+def list_all_indexes() -> list:  # List of dotted keys, e.g. cassini.iss.index
+    "List all indexes configured in the config file."
+    keys = []
+    for mission in config.missions:
+        for instrument in config.list_instruments(mission):
+            for index_name in config.list_indexes(f"{mission}.{instrument}"):
+                keys.append(f"{mission}.{instrument}.{index_name}")
+    return keys
+
+# %% ../../notebooks/api/02c_pds.apps.ipynb 20
+def _check_index(args):
+    key, session = args
+    row = dict(key=key, url="", local_timestamp=None, remote_timestamp=None, status="error", error="")
+    try:
+        # creating the Index already goes online for dynamic URLs (CTX, LROC)
+        index = Index(key)
+        row.update(url=str(index.url), local_timestamp=index.timestamp)
+        update = index.check_remote(session=session)
+    except Exception as e:
+        row["error"] = str(e)
+        return row, None
+    row["remote_timestamp"] = index._remote_timestamp
+    if not index.local_table_path.exists():
+        row["status"] = "missing"
+    else:
+        row["status"] = "stale" if update else "current"
+    return row, index
+
+
+def _check_all(keys, max_workers):
+    keys = list_all_indexes() if keys is None else keys
+    with requests.Session() as session:
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_check_index, [(key, session) for key in keys]))
+    report = pd.DataFrame([row for row, _ in results])
+    indexes = {row["key"]: index for row, index in results}
+    return report, indexes
+
+
+def check_indexes(
+    keys: list = None,  # Dotted index keys to check. Default: all configured indexes
+    max_workers: int = 8,  # Number of concurrent requests
+) -> pd.DataFrame:  # Report with status 'current', 'stale', 'missing' or 'error' per index
+    "Check indexes for updates concurrently."
+    return _check_all(keys, max_workers)[0]
+
+# %% ../../notebooks/api/02c_pds.apps.ipynb 21
+def refresh_indexes(
+    keys: list = None,  # Dotted index keys to check. Default: all configured indexes
+    download: bool = True,  # Switch to only report, without downloading
+    convert_to_parquet: bool = True,  # Convert downloaded indexes to parquet
+    max_workers: int = 8,  # Number of concurrent requests and downloads
+    incremental: bool = False,  # Only download and append the new rows of cumulative indexes
+) -> pd.DataFrame:  # Report as returned by `check_indexes`
+    """Check indexes for updates concurrently and download the stale and missing ones in parallel.
+
+    Conversion to parquet is done one index at a time afterwards, as it needs a lot of memory
+    for the big indexes. With `incremental`, the new rows of existing cumulative indexes are
+    appended to their parquet files or partitioned datasets right away, as those are small.
+    """
+    report, indexes = _check_all(keys, max_workers)
+    if not download:
+        return report
+    todo_keys = list(report.query("status in ['stale', 'missing']").key)
+    todo = [indexes[key] for key in todo_keys]
+
+    def _download(index):
+        converted = index.local_parq_path.exists() or index.local_dataset_path.exists()
+        if incremental and index.is_cumulative and converted:
+            index.download_increment(convert_to_parquet=convert_to_parquet)
+            return False  # parquet file or dataset is already up to date
+        index.download(convert_to_parquet=False)
+        return convert_to_parquet
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        to_convert = list(executor.map(_download, todo))
+    for index, convert in zip(todo, to_convert):
+        if convert:
+            index.convert_to_parquet()
+    report.loc[report.key.isin(todo_keys), "status"] = "refreshed"
+    return report
+
+# %% ../../notebooks/api/02c_pds.apps.ipynb 23
+@call_parse
+def pds_index_refresh(
+    download: bool = False,  # Download the stale and missing indexes
+    max_workers: int = 8,  # Number of concurrent requests and downloads
+    incremental: bool = False,  # Only download the new rows of cumulative indexes
+):
+    "Check all configured PDS indexes for updates and optionally download them."
+    report = refresh_indexes(download=download, max_workers=max_workers, incremental=incremental)
+    print(report[["key", "status", "local_timestamp", "remote_timestamp"]].to_string(index=False))
@@ -0,0 +1,363 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../notebooks/api/02h_pds.footprints.ipynb.
+
+# %% auto 0
+__all__ = ['corner_columns', 'find_corner_columns', 'unwrap_lons', 'polar_caps', 'footprint_boxes', 'polygons_intersect',
+           'FootprintIndex', 'footprint_path', 'get_footprint_index']
+
+# %% ../../notebooks/api/02h_pds.footprints.ipynb 4
+import math
+
+import numpy as np
+import pandas as pd
+from fastcore.xtras import Path
+
+from .indexes import Index
+
+# %% ../../notebooks/api/02h_pds.footprints.ipynb 5
+# footprint corners (lon, lat) in order around the footprint, as found in the index tables
+corner_columns = [
+    [
+        ("UPPER_LEFT_LONGITUDE", "UPPER_LEFT_LATITUDE"),
+        ("UPPER_RIGHT_LONGITUDE", "UPPER_RIGHT_LATITUDE"),
+        ("LOWER_RIGHT_LONGITUDE", "LOWER_RIGHT_LATITUDE"),
+        ("LOWER_LEFT_LONGITUDE", "LOWER_LEFT_LATITUDE"),
+    ],
+    [(f"CORNER{i}_LONGITUDE", f"CORNER{i}_LATITUDE") for i in range(1, 5)],
+    [
+        ("WESTERNMOST_LONGITUDE", "MINIMUM_LATITUDE"),
+        ("EASTERNMOST_LONGITUDE", "MINIMUM_LATITUDE"),
+        ("EASTERNMOST_LONGITUDE", "MAXIMUM_LATITUDE"),
+        ("WESTERNMOST_LONGITUDE", "MAXIMUM_LATITUDE"),
+    ],
+    # no footprint, only a point
+    [("CENTER_LONGITUDE", "CENTER_LATITUDE")],
+]
+
+
+def find_corner_columns(
+    columns: list,  # Column names of an index
+) -> list:  # List of (lon, lat) column name pairs
+    "Find the footprint columns of an index, preferring real corners over bounding boxes and centers."
+    for corners in corner_columns:
+        if all(lon in columns and lat in columns for lon, lat in corners):
+            return corners
+    raise ValueError("No footprint columns found.")
+
+# %% ../../notebooks/api/02h_pds.footprints.ipynb 6
+def unwrap_lons(
+    lons: np.ndarray,  # (n, k) longitudes of k corners of n footprints, in degrees
+) -> np.ndarray:  # (n, k) longitudes without jumps, starting in [0, 360)
+    "Make the corner longitudes continuous, so that footprints across the 0/360 meridian keep their shape."
+    lons = np.asarray(lons, dtype="float64")
+    steps = (np.diff(lons, axis=1) + 180) % 360 - 180
+    start = lons[:, :1] % 360
+    return np.hstack([start, start + np.cumsum(steps, axis=1)])
+
+
+def polar_caps(
+    lons: np.ndarray,  # (n, k) unwrapped corner longitudes
+    lats: np.ndarray,  # (n, k) corner latitudes
+) -> np.ndarray:  # 1 if the footprint contains the north pole, -1 for the south pole, else 0
+    "Footprints around a pole wind once around it, i.e. their longitudes add up to 360 degrees."
+    closing = (lons[:, 0] - lons[:, -1] + 180) % 360 - 180
+    winding = lons[:, -1] - lons[:, 0] + closing
+    return np.where(np.abs(winding) > 180, np.sign(lats.mean(axis=1)), 0).astype("int8")
+
+
+def footprint_boxes(
+    lons: np.ndarray,  # (n, k) corner longitudes in degrees
+    lats: np.ndarray,  # (n, k) corner latitudes in degrees
+) -> tuple:  # (boxes, rows): (m, 4) lon_min, lat_min, lon_max, lat_max boxes and their footprint row
+    """Bounding boxes of footprints in [0, 360] longitude.
+
+    Footprints across the 0/360 meridian are split into two boxes,
+    footprints around a pole get a box over all longitudes up to the pole.
+    """
+    lons = unwrap_lons(lons)
+    lats = np.asarray(lats, dtype="float64")
+    caps = polar_caps(lons, lats)
+    boxes = np.column_stack([lons.min(axis=1), lats.min(axis=1), lons.max(axis=1), lats.max(axis=1)])
+    boxes[caps != 0, 0] = 0
+    boxes[caps != 0, 2] = 360
+    boxes[caps == 1, 3] = 90
+    boxes[caps == -1, 1] = -90
+    rows = np.arange(len(boxes))
+    wraps = boxes[:, 2] > 360
+    wrapped = boxes[wraps].copy()
+    boxes[wraps, 2] = 360
+    wrapped[:, 0] = 0
+    wrapped[:, 2] -= 360
+    return np.vstack([boxes, wrapped]), np.concatenate([rows, rows[wraps]])
+
+# %% ../../notebooks/api/02h_pds.footprints.ipynb 11
+def _to_plane(lons, lats, ref_lon, polar):
+    "Project to a plane for the exact tests: unwrapped lon/lat, or polar coordinates near a pole."
+    lons = ref_lon + (np.asarray(lons) - ref_lon + 180) % 360 - 180
+    lats = np.asarray(lats, dtype="float64")
+    if not polar:
+        return np.column_stack([lons, lats])
+    r = 90 - polar * lats
+    return np.column_stack([r * np.cos(np.radians(lons)), r * np.sin(np.radians(lons))])
+
+
+def _points_in_polygon(points, polygon):
+    "Ray casting, for (m, 2) points and a (k, 2) polygon."
+    x, y = points[:, :1], points[:, 1:]
+    x0, y0 = polygon[:, 0], polygon[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing = ((y0 > y) != (y1 > y)) & (x < (x1 - x0) * (y - y0) / (y1 - y0) + x0)
+    return crossing.sum(axis=1) % 2 == 1
+
+
+def _edges_cross(a, b):
+    "If any edge of polygon `a` crosses any edge of polygon `b`."
+    p, r = a, np.roll(a, -1, axis=0) - a
+    q, s = b, np.roll(b, -1, axis=0) - b
+    rxs = r[:, None, 0] * s[None, :, 1] - r[:, None, 1] * s[None, :, 0]
+    qp = q[None, :, :] - p[:, None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (qp[..., 0] * s[None, :, 1] - qp[..., 1] * s[None, :, 0]) / rxs
+        u = (qp[..., 0] * r[:, None, 1] - qp[..., 1] * r[:, None, 0]) / rxs
+    return bool(np.any((rxs != 0) & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)))
+
+
+def polygons_intersect(
+    a: np.ndarray,  # (k, 2) polygon in the plane
+    b: np.ndarray,  # (l, 2) polygon in the plane
+) -> bool:
+    "Exact intersection test of two polygons in the plane."
+    return bool(
+        _points_in_polygon(a, b).any() or _points_in_polygon(b, a).any() or _edges_cross(a, b)
+    )
+
+# %% ../../notebooks/api/02h_pds.footprints.ipynb 13
+class FootprintIndex:
+    """Spatial index over the footprints of an index table.
+
+    The bounding boxes of the footprints are packed into a static R-tree with the
+    Sort-Tile-Recursive (STR) algorithm: boxes are sorted into vertical slices by longitude,
+    each slice is sorted by latitude, and groups of `capacity` neighbouring boxes form the nodes
+    of the next level.
+    Query boxes are compared to one tree level at a time, so only the branches that can hold
+    a match are visited. The candidates are then tested exactly against the footprint polygons.
+
+    Query results are row positions in the table the index was built from.
+    """
+
+    def __init__(
+        self,
+        lons: np.ndarray,  # (n, k) corner longitudes in degrees, or (n,) center longitudes
+        lats: np.ndarray,  # (n, k) corner latitudes in degrees, or (n,) center latitudes
+        capacity: int = 16,  # Number of children per tree node
+    ):
+        lons = np.asarray(lons, dtype="float64")
+        lats = np.asarray(lats, dtype="float64")
+        self.lons = lons if lons.ndim == 2 else lons[:, None]
+        self.lats = lats if lats.ndim == 2 else lats[:, None]
+        self.capacity = capacity
+        self.metadata = {}
+        valid = ~(np.isnan(self.lons).any(axis=1) | np.isnan(self.lats).any(axis=1))
+        boxes, rows = footprint_boxes(self.lons[valid], self.lats[valid])
+        rows = np.flatnonzero(valid)[rows]
+        self.caps = np.zeros(len(self.lons), dtype="int8")
+        self.caps[valid] = polar_caps(unwrap_lons(self.lons[valid]), self.lats[valid])
+        order = self._str_order(boxes)
+        self.rows = rows[order]
+        self._build_levels(boxes[order])
+
+    def _str_order(self, boxes):
+        if not len(boxes):  # empty table or no valid footprints, the tree stays empty
+            return np.arange(0)
+        n_nodes = math.ceil(len(boxes) / self.capacity)
+        slice_size = math.ceil(math.sqrt(n_nodes)) * self.capacity
+        x = (boxes[:, 0] + boxes[:, 2]) / 2
+        y = (boxes[:, 1] + boxes[:, 3]) / 2
+        by_x = np.argsort(x, kind="stable")
+        slices = [by_x[i : i + slice_size] for i in range(0, len(by_x), slice_size)]
+        return np.concatenate([s[np.argsort(y[s], kind="stable")] for s in slices] or [by_x])
+
+    def _build_levels(self, boxes):
+        self.levels = [boxes]
+        while len(self.levels[-1]) > self.capacity:
+            level = self.levels[-1]
+            starts = np.arange(0, len(level), self.capacity)
+            self.levels.append(
+                np.column_stack(
+                    [
+                        np.minimum.reduceat(level[:, 0], starts),
+                        np.minimum.reduceat(level[:, 1], starts),
+                        np.maximum.reduceat(level[:, 2], starts),
+                        np.maximum.reduceat(level[:, 3], starts),
+                    ]
+                )
+            )
+
+    def _candidates(self, box):
+        "Footprint rows with a bounding box intersecting `box` (lon_min, lat_min, lon_max, lat_max)."
+        lon_min, lat_min, lon_max, lat_max = box
+        nodes = np.arange(len(self.levels[-1]))
+        for i in range(len(self.levels) - 1, -1, -1):
+            level = self.levels[i][nodes]
+            hit = (
+                (level[:, 0] <= lon_max)
+                & (level[:, 2] >= lon_min)
+                & (level[:, 1] <= lat_max)
+                & (level[:, 3] >= lat_min)
+            )
+            nodes = nodes[hit]
+            if i:
+                nodes = (nodes[:, None] * self.capacity + np.arange(self.capacity)).ravel()
+                nodes = nodes[nodes < len(self.levels[i - 1])]
+        return np.unique(self.rows[nodes])
+
+    def _polar(self, row):
+        "Use polar coordinates for footprints around or close to a pole."
+        if self.caps[row]:
+            return int(self.caps[row])
+        lats = self.lats[row]
+        return int(np.sign(lats.mean())) if np.abs(lats).max() > 80 else 0
+
+    def query_point(
+        self,
+        lon: float,  # Longitude in degrees, east positive, in [-180, 360]
+        lat: float,  # Latitude in degrees
+        exact: bool = True,  # Test the footprint polygons, not just their bounding boxes
+    ) -> np.ndarray:  # Row positions of the footprints containing the point
+        "Find all footprints containing a point."
+        lon = lon % 360
+        rows = self._candidates((lon, lat, lon, lat))
+        if not exact or self.lons.shape[1] < 3:  # center points only
+            return rows
+        hits = []
+        for row in rows:
+            ref_lon, polar = self.lons[row][0], self._polar(row)
+            polygon = _to_plane(self.lons[row], self.lats[row], ref_lon, polar)
+            if _points_in_polygon(_to_plane([lon], [lat], ref_lon, polar), polygon)[0]:
+                hits.append(row)
+        return np.array(hits, dtype="int64")
+
+    def query_polygon(
+        self,
+        lons: list,  # Longitudes of the polygon corners, spanning less than 180 degrees
+        lats: list,  # Latitudes of the polygon corners
+        exact: bool = True,  # Test the footprint polygons, not just their bounding boxes
+    ) -> np.ndarray:  # Row positions of the footprints intersecting the polygon
+        "Find all footprints intersecting a polygon."
+        lons = np.asarray(lons, dtype="float64")[None, :]
+        lats = np.asarray(lats, dtype="float64")[None, :]
+        boxes, _ = footprint_boxes(lons, lats)
+        rows = np.unique(np.concatenate([self._candidates(box) for box in boxes]))
+        if not exact:
+            return rows
+        ref_lon = unwrap_lons(lons)[0, 0]
+        query_cap = polar_caps(unwrap_lons(lons), lats)[0]
+        hits = []
+        for row in rows:
+            polar = query_cap or self._polar(row)
+            polygon = _to_plane(self.lons[row], self.lats[row], ref_lon, polar)
+            query = _to_plane(lons[0], lats[0], ref_lon, polar)
+            if polygons_intersect(polygon, query):
+                hits.append(row)
+        return np.array(hits, dtype="int64")
+
+    def query_bbox(
+        self,
+        lon_min: float,  # Western boundary in degrees, can be larger than `lon_max` across 0/360
+        lat_min: float,  # Southern boundary in degrees
+        lon_max: float,  # Eastern boundary in degrees
+        lat_max: float,  # Northern boundary in degrees
+        exact: bool = True,  # Test the footprint polygons, not just their bounding boxes
+    ) -> np.ndarray:  # Row positions of the footprints intersecting the box
+        "Find all footprints intersecting a longitude/latitude box."
+        lon_min, lon_max = lon_min % 360, lon_max % 360
+        if lon_max <= lon_min:
+            lon_max += 360
+        # corners on the long edges, to keep them on their latitude in the polar planes
+        edge = np.linspace(lon_min, lon_max, 5)
+        lons = np.concatenate([edge, edge[::-1]])
+        lats = np.concatenate([np.full(5, lat_min), np.full(5, lat_max)])
+        return self.query_polygon(lons, lats, exact=exact)
+
+    def save(
+        self,
+        path: str,  # Path to the .npz file
+        **metadata,  # Additional arrays to store, e.g. product ids
+    ):
+        "Store the footprints and the packed leaves of the tree."
+        np.savez(
+            path,
+            lons=self.lons,
+            lats=self.lats,
+            caps=self.caps,
+            boxes=self.levels[0],
+            rows=self.rows,
+            capacity=self.capacity,
+            **metadata,
+        )
+
+    @classmethod
+    def load(
+        cls,
+        path: str,  # Path to the .npz file
+    ):
+        "Load a stored index. Only the upper tree levels are rebuilt."
+        data = np.load(path, allow_pickle=False)
+        self = cls.__new__(cls)
+        self.lons, self.lats, self.caps = data["lons"], data["lats"], data["caps"]
+        self.rows, self.capacity = data["rows"], int(data["capacity"])
+        self._build_levels(data["boxes"])
+        self.metadata = {k: data[k] for k in data.files if k not in cls._stored}
+        return self
+
+    _stored = ["lons", "lats", "caps", "boxes", "rows", "capacity"]
+
+    @classmethod
+    def from_df(
+        cls,
+        df: pd.DataFrame,  # Index table with footprint columns, see `corner_columns`
+        capacity: int = 16,  # Number of children per tree node
+    ):
+        "Build the spatial index from the footprint columns of an index table."
+        corners = find_corner_columns(df.columns)
+        lons = df[[lon for lon, _ in corners]].to_numpy(dtype="float64", na_value=np.nan)
+        lats = df[[lat for _, lat in corners]].to_numpy(dtype="float64", na_value=np.nan)
+        return cls(lons, lats, capacity=capacity)
+
+    def __len__(self):
+        return len(self.lons)
+
+    def __repr__(self):
+        return f"FootprintIndex of {len(self)} footprints, {len(self.levels)} tree levels"
+
+# %% ../../notebooks/api/02h_pds.footprints.ipynb 21
+def footprint_path(
+    index: Index,
+) -> Path:  # Path of the stored spatial index, next to the index table
+    return index.local_table_path.with_suffix(".footprints.npz")
+
+
+def get_footprint_index(
+    index: Index,  # Downloaded index with footprint columns, e.g. `Index("mro.ctx.edr")`
+    id_column: str = "PRODUCT_ID",  # Column to store, so that query results can be looked up
+    rebuild: bool = False,  # Build the spatial index even if a stored one is up to date
+) -> FootprintIndex:
+    """Load the stored spatial index of a PDS index, building it first if needed.
+
+    The stored index is rebuilt when the index table changed since.
+    The ids of the footprints are available as `metadata["ids"]`.
+    """
+    path = footprint_path(index)
+    mtime = index.local_table_path.stat().st_mtime
+    if path.exists() and not rebuild:
+        fpindex = FootprintIndex.load(path)
+        if fpindex.metadata.get("table_mtime") == mtime:
+            return fpindex
+    df = index.read_parquet()
+    fpindex = FootprintIndex.from_df(df)
+    metadata = dict(table_mtime=mtime)
+    if id_column in df.columns:
+        metadata["ids"] = df[id_column].to_numpy(dtype="str")
+    fpindex.save(path, **metadata)
+    fpindex.metadata = metadata
+    return fpindex
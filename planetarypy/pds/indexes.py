@@ -1,35 +1,74 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../notebooks/api/02a_pds.indexes.ipynb.
 
 # %% auto 0
-__all__ = ['logger', 'storage_root', 'dynamic_urls', 'Index']
+__all__ = ['logger', 'storage_root', 'config_lock', 'dynamic_urls', 'partitionings', 'time_columns', 'Index']
 
 # %% ../../notebooks/api/02a_pds.indexes.ipynb 3
 import logging
+import shutil
+import threading
 from datetime import datetime
 from urllib.parse import urlsplit, urlunsplit
 from urllib.request import URLError
-from dask import dataframe as dd
 import tomlkit as toml
 from dateutil import parser
 from dateutil.parser import ParserError
 from yarl import URL
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import requests
 from fastcore.basics import patch  # better monkeypatcher
 from fastcore.xtras import Path  # improved pathlib.Path
-from .. import utils
+from .. import metrics, utils
 from ..config import config
 from .ctx_index import CTXIndex
 from .lroc_index import LROCIndex
-from .utils import IndexLabel, fix_hirise_edrcumindex, convert_times
+from planetarypy.pds.utils import (
+    IndexLabel,
+    KeyIndex,
+    Partitioning,
+    TabReader,
+    TimeIndex,
+    append_to_parquet,
+    convert_times,
+    fix_hirise_edrcumindex,
+    parquet_to_arrow,
+    parquet_to_dataset,
+    read_arrow_file,
+    read_dataset,
+    read_parquet_rows,
+    tab_to_parquet,
+    write_dataset,
+)
 
 logger = logging.getLogger(__name__)
 
 storage_root = Path(config.storage_root)
 
+# config writes out the whole file on every change, guard it when indexes are handled in threads
+config_lock = threading.Lock()
+
 # %% ../../notebooks/api/02a_pds.indexes.ipynb 4
 dynamic_urls = {"mro.ctx": CTXIndex, "lro.lroc": LROCIndex}
 
+# how to partition the parquet datasets of the big indexes, per instrument
+partitionings = {
+    "mro.ctx": Partitioning("VOLUME_ID"),
+    "lro.lroc": Partitioning("VOLUME_ID"),
+    "mro.hirise": Partitioning(
+        "ORBIT_RANGE", "ORBIT_NUMBER", lambda orbits: orbits // 1000 * 1000, pa.int64()
+    ),
+    "lro.diviner": Partitioning(
+        "YEAR", "START_TIME", lambda times: pd.to_datetime(times).dt.year, pa.int64()
+    ),
+}
+
+# preferred time columns for time range queries, otherwise the first column with TIME in its name
+time_columns = ["START_TIME", "IMAGE_TIME", "IMAGE_MID_TIME", "OBSERVATION_TIME"]
+
 # %% ../../notebooks/api/02a_pds.indexes.ipynb 7
 class Index:
     """Index manager class.
@@ -47,6 +86,7 @@ class Index:
         self.check_update = check_update
 
         self.set_url(url)
+        self.etag = (config.get_value(self.key) or {}).get("etag", "")
         try:
             self.timestamp = parser.parse(config.get_value(self.key)["timestamp"])
         except (toml.exceptions.NonExistentKey, ParserError):
@@ -58,6 +98,7 @@ class Index:
             else:
                 self.timestamp = None
         self._remote_timestamp = None
+        self._remote_etag = None
 
     def set_url(self, url):  # URL to index.
         """Set URL from having it dynamically determined (for non-static index URLs)."""
@@ -133,7 +174,8 @@ class Index:
 
     @property
     def local_dir(self):
-        p = storage_root / str(self.key).replace(".", "/")
+        # from the config, so that a changed storage root (e.g. for tests) is picked up
+        p = Path(config.storage_root) / str(self.key).replace(".", "/")
         p.mkdir(parents=True, exist_ok=True)
         return p
 
@@ -149,13 +191,43 @@ class Index:
     def local_parq_path(self):
         return self.local_table_path.with_suffix(".parq")
 
+    @property
+    def local_dataset_path(self):
+        "Folder of the partitioned parquet dataset."
+        return self.local_table_path.with_suffix(".parts")
+
+    @property
+    def local_arrow_path(self):
+        "Uncompressed Arrow IPC copy of the parquet data, for memory-mapping."
+        return self.local_table_path.with_suffix(".arrow")
+
+    @property
+    def partitioning(self):
+        return partitionings.get(self.instrument_key)
+
     @property
     def parquet(self):
-        return pd.read_parquet(self.local_parq_path)
+        return self.read_parquet()
+
+    def read_parquet(
+        self,
+        filters: list = None,  # List of (column, op, value) tuples, combined with AND
+        columns: list = None,  # Columns to read. Default: all
+    ) -> pd.DataFrame:
+        """Read the index, preferring the partitioned dataset if it exists.
+
+        With a partitioned dataset, only the partitions that can match `filters` are read.
+        """
+        if self.local_dataset_path.exists():
+            return read_dataset(self.local_dataset_path, self.partitioning, filters, columns)
+        return pd.read_parquet(self.local_parq_path, filters=filters, columns=columns)
 
     def update_timestamp(self):
         # Note: the config object writes itself out after setting any value
-        config.set_value(f"{self.key}.timestamp", self.isotimestamp)
+        with config_lock:
+            config.set_value(f"{self.key}.timestamp", self.isotimestamp)
+            if self.etag:
+                config.set_value(f"{self.key}.etag", self.etag)
 
     @property
     def label(self):
@@ -165,12 +237,37 @@ class Index:
         df = self.label.read_index_data(do_convert_times=do_convert_times)
         return df
 
-    def convert_to_parquet(self):
-        print("Reading index to memory for conversion to parquet. Will take up lots of memory for a bit.")
-        df = self.read_index_data()
-        df = df.convert_dtypes()
-        print("Storing into parquet.")
-        df.to_parquet(self.local_parq_path)
+    def convert_to_parquet(
+        self,
+        # Store as partitioned dataset, see `partitionings`. Default: keep the existing format
+        partitioned: bool = None,
+        # Processes for parsing the table, see `tab_to_parquet`. 1 to parse in this process.
+        max_workers: int = None,
+    ):
+        if partitioned is None:
+            partitioned = self.local_dataset_path.exists()
+        if partitioned and self.partitioning is None:
+            raise ValueError(f"No partitioning defined for {self.instrument_key}.")
+        print("Converting index to parquet.")
+        # smaller row groups, so that reading rows by position only touches a part of the file
+        tab_to_parquet(
+            self.local_table_path, self.label, self.local_parq_path, max_workers=max_workers
+        )
+        columns = pq.read_schema(self.local_parq_path).names
+        if partitioned and not self.partitioning.available(columns):
+            # e.g. the HiRISE DTM index has no ORBIT_NUMBER
+            logger.warning(
+                "%s can't be partitioned by %s, keeping one parquet file.",
+                self.key,
+                self.partitioning,
+            )
+            partitioned = False
+        # only keep one format, so that they can't go out of sync
+        if partitioned:
+            parquet_to_dataset(self.local_parq_path, self.local_dataset_path, self.partitioning)
+            self.local_parq_path.unlink(missing_ok=True)
+        elif self.local_dataset_path.exists():
+            shutil.rmtree(self.local_dataset_path)
         print("Finished. Enjoy your freshly baked PDS Index. :")
 
     def __str__(self):
@@ -204,6 +301,7 @@ def parse_key(
 def download(
     self:Index,  # the Index object defined in this module
     convert_to_parquet:bool=True,  # set to False if you just want download the files
+    partitioned:bool=None,  # store as partitioned dataset. Default: keep the existing format
 ):
     """Wrapping URLs for downloading PDS indices and their label files."""
     # check timestamp
@@ -222,9 +320,11 @@ def download(
     #     )
     #     self.local_table_path.with_name("temp.tab").rename(self.local_table_path)
     self.timestamp = self.remote_timestamp
+    if self._remote_etag:
+        self.etag = self._remote_etag
     self.update_timestamp()
     if convert_to_parquet:
-        self.convert_to_parquet()
+        self.convert_to_parquet(partitioned=partitioned)
 
 # %% ../../notebooks/api/02a_pds.indexes.ipynb 10
 @patch(as_prop=True)
@@ -234,3 +334,247 @@ def update_available(
     if not self.timestamp:
         return True  # never downloaded
     return True if self.remote_timestamp > self.timestamp else False
+
+# %% ../../notebooks/api/02a_pds.indexes.ipynb 11
+@patch
+def check_remote(
+    self: Index,
+    session: requests.Session = None,  # re-use connections, e.g. when checking many indexes
+    timeout: float = 10,  # seconds to wait for the server
+) -> bool:  # True if the remote index is newer than the local one
+    """Check for an update with one conditional HEAD request.
+
+    The stored timestamp and ETag are sent as `If-Modified-Since` and `If-None-Match`
+    headers, so that the server can answer `304 Not Modified` for unchanged indexes.
+    The remote timestamp and ETag are kept, so a following `download` does not need to
+    ask the server again.
+    """
+    if not self.timestamp:
+        headers = {}
+    else:
+        headers = {"If-Modified-Since": utils.format_http_date(self.timestamp)}
+    if self.etag:
+        headers["If-None-Match"] = self.etag
+    http = requests if session is None else session
+    r = http.head(str(self.url), headers=headers, allow_redirects=True, timeout=timeout)
+    metrics.track_response(r)
+    if r.status_code == 304:
+        return False
+    r.raise_for_status()
+    if "last-modified" in r.headers:
+        self._remote_timestamp = utils.parse_http_date(r.headers["last-modified"])
+    self._remote_etag = r.headers.get("etag")
+    if not self.timestamp:
+        return True  # never downloaded
+    if self.etag and self._remote_etag:
+        return self._remote_etag != self.etag
+    if self._remote_timestamp:
+        return self._remote_timestamp > self.timestamp
+    logger.warning("Server provides neither ETag nor Last-Modified for %s.", self.url)
+    return False
+
+# %% ../../notebooks/api/02a_pds.indexes.ipynb 12
+@patch(as_prop=True)
+def is_cumulative(
+        self: Index) -> bool:  # Boolean indicating if new releases only append rows
+    "Property indicating if the index is cumulative, like the CTX, LROC and HiRISE cumindex files."
+    return "cum" in self.label_filename.name.lower()
+
+# %% ../../notebooks/api/02a_pds.indexes.ipynb 13
+@patch
+def download_increment(
+    self: Index,
+    convert_to_parquet: bool = True,  # append the new rows to the parquet file
+    chunksize: int = 2**20,  # bytes per chunk when streaming the new rows
+    timeout: float = 30,  # seconds to wait for the server
+) -> int:  # Number of new rows
+    """Update a cumulative index by downloading only the rows added since the last download.
+
+    The last local record is requested again together with the new tail of the remote table
+    via a HTTP Range request, to make sure that the local table still is the start of the remote one.
+    Only the new rows are parsed, with the same parser as the full conversion, and appended
+    to the parquet file or dataset.
+    If the check fails or the server does not support Range requests, the full index is downloaded.
+    """
+    if not (self.is_cumulative and self.local_table_path.exists() and self.local_label_path.exists()):
+        return self._download_all(convert_to_parquet)
+    record_bytes = self.label.record_bytes
+    local_size = self.local_table_path.stat().st_size
+    if not local_size or local_size % record_bytes:
+        logger.warning("%s is not aligned to records.", self.local_table_path)
+        return self._download_all(convert_to_parquet)
+    with self.local_table_path.open("rb") as f:
+        f.seek(local_size - record_bytes)
+        last_record = f.read()
+    tailpath = self.local_table_path.with_suffix(".tail")
+    headers = {"Range": f"bytes={local_size - record_bytes}-"}
+    logger.info("Downloading new rows of %s.", self.table_url)
+    with requests.get(self.table_url, headers=headers, stream=True, timeout=timeout) as r:
+        metrics.track_response(r)
+        if r.status_code != 206:  # server ignored the range or the remote table is shorter
+            logger.info("No partial content from %s (status %i).", self.table_url, r.status_code)
+            return self._download_all(convert_to_parquet)
+        overlap = b""
+        with tailpath.open("wb") as f:
+            for chunk in r.iter_content(chunksize):
+                if len(overlap) < record_bytes:
+                    n = record_bytes - len(overlap)
+                    overlap += chunk[:n]
+                    chunk = chunk[n:]
+                    if len(overlap) == record_bytes and overlap != last_record:
+                        break
+                f.write(chunk)
+        metrics.track_bytes(self.table_url, len(overlap) + tailpath.stat().st_size)
+        if "last-modified" in r.headers:
+            self._remote_timestamp = utils.parse_http_date(r.headers["last-modified"])
+    if overlap != last_record:
+        tailpath.unlink()
+        logger.warning("Local %s does not match the remote table.", self.table_filename)
+        return self._download_all(convert_to_parquet)
+    # the new label has the updated row count
+    utils.url_retrieve(self.url, self.local_label_path)
+    n_new = tailpath.stat().st_size // record_bytes
+    if n_new and convert_to_parquet:
+        tailparq = tab_to_parquet(tailpath, self.label, tailpath.with_suffix(".tail.parq"), max_workers=1)
+        df = pd.read_parquet(tailparq)
+        tailparq.unlink()
+        if self.local_dataset_path.exists():
+            write_dataset(df, self.local_dataset_path, self.partitioning, append=True)
+        elif self.local_parq_path.exists():
+            append_to_parquet(self.local_parq_path, df)
+    with self.local_table_path.open("ab") as table, tailpath.open("rb") as tail:
+        shutil.copyfileobj(tail, table)
+    tailpath.unlink()
+    print(f"Appended {n_new} new rows to {self.local_table_path}")
+    self.timestamp = self.remote_timestamp
+    if self._remote_etag:
+        self.etag = self._remote_etag
+    self.update_timestamp()
+    if convert_to_parquet and not (self.local_parq_path.exists() or self.local_dataset_path.exists()):
+        self.convert_to_parquet()
+    return n_new
+
+
+@patch
+def _download_all(self: Index, convert_to_parquet):
+    print("Downloading the full index.")
+    self.download(convert_to_parquet=convert_to_parquet)
+    return self.label.rows
+
+# %% ../../notebooks/api/02a_pds.indexes.ipynb 14
+@patch(as_prop=True)
+def time_column(
+        self: Index) -> str:  # Name of the default time column for time range queries
+    "Property with the time column to use for `query_time`, see `time_columns`."
+    if self.local_dataset_path.exists():
+        schema = ds.dataset(self.local_dataset_path, format="parquet", partitioning="hive").schema
+    else:
+        schema = pq.read_schema(self.local_parq_path)
+    candidates = [f.name for f in schema if pa.types.is_timestamp(f.type) and "TIME" in f.name]
+    for column in time_columns + candidates:
+        if column in candidates:
+            return column
+    raise ValueError(f"No time column found in {self.key}.")
+
+
+@patch
+def time_index(
+    self: Index,
+    column: str = None,  # Time column. Default: `time_column`
+    rebuild: bool = False,  # Build the time index even if a stored one is up to date
+) -> TimeIndex:
+    """Load the stored time index of `column`, building it first if needed.
+
+    The time index is stored next to the index table and rebuilt when the table changes.
+    """
+    column = column or self.time_column
+    path = self.local_table_path.with_suffix(f".{column}.npz")
+    mtime = self.local_table_path.stat().st_mtime
+    if path.exists() and not rebuild:
+        tindex = TimeIndex.load(path)
+        if tindex.metadata.get("table_mtime") == mtime:
+            return tindex
+    tindex = TimeIndex(self.read_parquet(columns=[column])[column])
+    tindex.save(path, table_mtime=mtime)
+    return tindex
+
+
+@patch
+def query_time(
+    self: Index,
+    t0,  # Start time, anything `pd.Timestamp` understands
+    t1,  # End time, included
+    column: str = None,  # Time column. Default: `time_column`
+    columns: list = None,  # Columns to read. Default: all
+) -> pd.DataFrame:  # Rows with t0 <= column <= t1, sorted by time
+    """Read the rows within a time range.
+
+    For parquet files, the rows are found in the sorted time index and only the row groups
+    holding them are read. Partitioned datasets are filtered while reading instead.
+    """
+    column = column or self.time_column
+    if not self.local_dataset_path.exists():
+        rows = self.time_index(column).query(t0, t1)
+        return read_parquet_rows(self.local_parq_path, rows, columns)
+    filters = [(column, ">=", pd.Timestamp(t0)), (column, "<=", pd.Timestamp(t1))]
+    df = self.read_parquet(filters=filters, columns=columns)
+    return df.sort_values(column) if column in df.columns else df
+
+# %% ../../notebooks/api/02a_pds.indexes.ipynb 16
+@patch
+def key_index(
+    self: Index,
+    column: str = "PRODUCT_ID",  # Key column
+    rebuild: bool = False,  # Build the key index even if a stored one is up to date
+) -> KeyIndex:
+    "Load the stored key index of `column`, building it from the TAB file if needed."
+    path = self.local_table_path.with_suffix(f".{column}.keys.npz")
+    mtime = self.local_table_path.stat().st_mtime
+    if path.exists() and not rebuild:
+        kindex = KeyIndex.load(path)
+        if kindex.metadata.get("table_mtime") == mtime:
+            return kindex
+    with TabReader(self.label, self.local_table_path) as reader:
+        kindex = KeyIndex(reader.column_bytes(column))
+    kindex.save(path, table_mtime=mtime)
+    return kindex
+
+
+@patch
+def lookup(
+    self: Index,
+    key: str,  # Value of the key column, e.g. a product id
+    column: str = "PRODUCT_ID",  # Key column
+) -> pd.DataFrame:  # Matching rows, labeled by row number
+    "Find rows by key in the TAB file, decoding only the matching records."
+    rows = self.key_index(column).query(key)
+    with TabReader(self.label, self.local_table_path) as reader:
+        return reader.take(rows)
+
+# %% ../../notebooks/api/02a_pds.indexes.ipynb 18
+@patch
+def arrow_cache(
+    self: Index,
+    rebuild: bool = False,  # Write the Arrow file even if it is up to date
+) -> Path:
+    "Path to the Arrow IPC copy of the parquet data, writing it first if needed."
+    if self.local_dataset_path.exists():
+        source, partitioning = self.local_dataset_path, self.partitioning
+        mtime = max(p.stat().st_mtime for p in source.rglob("*.parquet"))
+    else:
+        source, partitioning = self.local_parq_path, None
+        mtime = source.stat().st_mtime
+    path = self.local_arrow_path
+    if rebuild or not path.exists() or path.stat().st_mtime < mtime:
+        parquet_to_arrow(source, path, partitioning)
+    return path
+
+
+@patch
+def read_arrow(
+    self: Index,
+    filters: list = None,  # List of (column, op, value) tuples, combined with AND
+    columns: list = None,  # Columns to read. Default: all
+) -> pd.DataFrame:
+    "Memory-map the index, see `read_arrow_file`."
+    return read_arrow_file(self.arrow_cache(), filters=filters, columns=columns)
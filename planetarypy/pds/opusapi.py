@@ -1,25 +1,64 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../notebooks/api/02d_pds.opusapi.ipynb.
 
 # %% auto 0
-__all__ = ['base_url', 'metadata_url', 'image_url', 'dic', 'OPUSImageURL', 'OPUSObsID', 'OPUS']
+__all__ = ['base_url', 'metadata_url', 'image_url', 'cache_root', 'cache', 'dic', 'get_session', 'OPUSImageURL', 'OPUSObsID',
+           'OPUS']
 
 # %% ../../notebooks/api/02d_pds.opusapi.ipynb 2
+import hashlib
+import json
 from pathlib import Path
 from urllib.parse import urlencode, urlparse
 from urllib.request import unquote, urlretrieve
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from IPython.display import HTML, display
 
 import pandas as pd
 
+from .. import metrics
+from ..config import config
+
 base_url = "https://opus.pds-rings.seti.org/opus/api"
 metadata_url = base_url + "/metadata"
 image_url = base_url + "/image/"
 
+# persistent cache of OPUS responses, so that repeated queries stay local
+cache_root = config.storage_root / "opus_cache"
+
+cache = dict()
+
+
+def get_session():
+    "Pooled HTTP session shared by all OPUS clients, with retries on transient errors."
+    if "session" not in cache:
+        session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.hooks["response"].append(metrics.track_response)
+        cache["session"] = session
+    return cache["session"]
+
 dic = {"raw_data": "coiss_raw", "calibrated_data": "coiss_calib"}
 
 
+def _matches(
+    image_id: str,  # image id as used for `OPUS.query_image_id`
+    opusid: str,  # key of a files.json response, e.g. co-iss-n1454725799
+    files: dict,  # product type -> list of URLs, the value of that key
+) -> bool:
+    "Whether a files.json entry belongs to `image_id`, by its opusid or a product file name."
+    image_id = image_id.lower()
+    if opusid.lower().split("-", 2)[-1] == image_id:
+        return True
+    stems = {Path(urlparse(url).path).stem.lower() for urls in files.values() for url in urls}
+    return image_id in stems
+
+
 class OPUSImageURL(object):
     """Manage URLS from the OPUS response."""
 
@@ -101,13 +140,26 @@ class OPUSObsID(object):
 class OPUS(object):
     """Manage OPUS API requests.
 
-
+    Result sets are paged through automatically, and the JSON responses are
+    cached on disk in `cache_root`, keyed by the normalized query.
+    For testing, `base_url` can point to a local stand-in server.
     """
 
-    def __init__(self, silent=False):
+    def __init__(
+        self,
+        silent=False,
+        base_url=base_url,  # OPUS API root
+        page_size=1000,  # number of observations per request when paging
+        use_cache=True,  # re-use stored responses for identical queries
+        cache_root=cache_root,  # folder of the stored responses
+    ):
         self.silent = silent
+        self.base_url = base_url
+        self.page_size = page_size
+        self.use_cache = use_cache
+        self.cache_root = Path(cache_root)
 
-    def query_image_id(self, image_id):
+    def query_image_id(self, image_id, use_cache=None):
         """Query OPUS via the image_id.
 
         This is a query using the 'primaryfilespec' field of the OPUS database.
@@ -123,10 +175,113 @@ class OPUS(object):
         `.pyciss.yaml` (the config file),
         """
         myquery = {"primaryfilespec": image_id}
-        self.create_files_request(myquery, fmt="json")
-        self.unpack_json_response()
+        data = self.fetch("files", myquery, use_cache=use_cache)
+        self.unpack_json_response(data)
         return self.obsids
 
+    def query_image_ids(
+        self,
+        image_ids: list,  # image ids as used for `query_image_id`
+        batch_size=50,  # number of ids combined into one request
+        use_cache=None,  # overrides the instance setting
+    ) -> dict:
+        """Query OPUS for many image_ids with few requests.
+
+        Ids that are not in the response cache are combined into comma-separated
+        `primaryfilespec` queries. The results are distributed back to the ids by
+        opusid or product file name (and stored in the cache as if each id had been
+        queried alone).
+        Returns a dict of image_id -> list of (opusid, files) tuples.
+        """
+        use_cache = self.use_cache if use_cache is None else use_cache
+        results = {}
+        missing = []
+        for image_id in image_ids:
+            cached = self._read_cache("files", {"primaryfilespec": image_id}) if use_cache else None
+            if cached is None:
+                missing.append(image_id)
+            else:
+                results[image_id] = list(cached.items())
+        for i in range(0, len(missing), batch_size):
+            batch = missing[i : i + batch_size]
+            data = self.fetch("files", {"primaryfilespec": ",".join(batch)}, use_cache=False)
+            for image_id in batch:
+                found = {
+                    opusid: files
+                    for opusid, files in data.items()
+                    if _matches(image_id, opusid, files)
+                }
+                if found and use_cache:
+                    self._write_cache("files", {"primaryfilespec": image_id}, found)
+                results[image_id] = list(found.items())
+        return results
+
+    def url_for(self, kind, size="thumb", fmt="json"):
+        "api/data.[fmt], api/images/[size].[fmt] api/files.[fmt]"
+        if kind == "images":
+            return "{}/images/{}.{}".format(self.base_url, size, fmt)
+        return "{}/{}.{}".format(self.base_url, kind, fmt)
+
+    @staticmethod
+    def cache_key(kind, query):
+        "Normalized form of a query: key case and order don't matter."
+        normalized = sorted((str(k).lower(), str(v).strip()) for k, v in query.items())
+        digest = hashlib.sha1(json.dumps([kind, normalized]).encode()).hexdigest()
+        return f"{kind}_{digest}"
+
+    def _read_cache(self, kind, query):
+        path = self.cache_root / f"{self.cache_key(kind, query)}.json"
+        metrics.cache_access("opus.responses", path.exists())
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    def _write_cache(self, kind, query, data):
+        path = self.cache_root / f"{self.cache_key(kind, query)}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmppath = path.with_suffix(".part")
+        tmppath.write_text(json.dumps(data))
+        tmppath.replace(path)
+
+    def fetch(
+        self,
+        kind,  # one of 'data', 'files'
+        query: dict,  # OPUS search parameters, without paging
+        use_cache=None,  # overrides the instance setting
+    ):
+        """Get the complete `data` part of an OPUS JSON response.
+
+        Pages of `page_size` observations are requested until a short page arrives.
+        Dictionaries (files.json) are merged, lists (data.json) concatenated.
+        Empty results (OPUS answers those with code 500) are not cached.
+        """
+        use_cache = self.use_cache if use_cache is None else use_cache
+        if use_cache:
+            cached = self._read_cache(kind, query)
+            if cached is not None:
+                return cached
+        data = None
+        startobs = 1
+        while True:
+            params = dict(query, startobs=startobs, limit=self.page_size)
+            self.create_request_with_query(kind, params, fmt="json")
+            if self.r.status_code == 500:
+                break
+            self.r.raise_for_status()
+            page = self.response
+            if data is None:
+                data = page
+            elif isinstance(data, dict):
+                data.update(page)
+            else:
+                data.extend(page)
+            if len(page) < self.page_size:
+                break
+            startobs += self.page_size
+        if data and use_cache:
+            self._write_cache(kind, query, data)
+        return data if data is not None else {}
+
     def create_request_with_query(self, kind, query, size="thumb", fmt="json"):
         """api/data.[fmt], api/images/[size].[fmt] api/files.[fmt]
 
@@ -134,12 +289,8 @@ class OPUS(object):
 
 
         """
-        if kind == "data" or kind == "files":
-            url = "{}/{}.{}".format(base_url, kind, fmt)
-        elif kind == "images":
-            url = "{}/images/{}.{}".format(base_url, size, fmt)
-        self.url = url
-        self.r = requests.get(url, params=unquote(urlencode(query)))
+        self.url = self.url_for(kind, size=size, fmt=fmt)
+        self.r = get_session().get(self.url, params=unquote(urlencode(query)))
 
     def create_files_request(self, query, fmt="json"):
         self.create_request_with_query("files", query, fmt=fmt)
@@ -148,9 +299,9 @@ class OPUS(object):
         self.create_request_with_query("images", query, size=size, fmt=fmt)
 
     def get_volume_id(self, ring_obsid):
-        url = "{}/{}.json".format(metadata_url, ring_obsid)
+        url = "{}/metadata/{}.json".format(self.base_url, ring_obsid)
         query = {"cols": "volumeidlist"}
-        r = requests.get(url, params=unquote(urlencode(query)))
+        r = get_session().get(url, params=unquote(urlencode(query)))
         return r.json()[0]["volume_id_list"]
 
     # def create_data_request(self, query, fmt='json'):
@@ -162,21 +313,14 @@ class OPUS(object):
     def response(self):
         return self.r.json()["data"]
 
-    def unpack_json_response(self):
-        if self.r.status_code == 500:
-            if not self.silent:
-                print("No data found.")
-            self.obsids = []
-            return
-        obsids = []
-        for obsid_data in self.response.items():
-            obsids.append(obsid_data)
-        self.obsids = obsids
+    def unpack_json_response(self, data=None):
+        data = self.response if data is None else data
+        self.obsids = list(data.items())
         if not self.silent:
-            print("Found {} obsids.".format(len(obsids)))
-            if len(obsids) == 1000:
-                print("List is 1000 entries long, which is the pre-set limit, hence"
-                      " the real number of results might be longe.")
+            if self.obsids:
+                print("Found {} obsids.".format(len(self.obsids)))
+            else:
+                print("No data found.")
 
     def get_radial_res_query(self, res1, res2):
         myquery = dict(
@@ -184,7 +328,6 @@ class OPUS(object):
             instrumentid="Cassini+ISS",
             projectedradialresolution1=res1,
             projectedradialresolution2=res2,
-            limit=1000,
         )
         return myquery
 
@@ -221,13 +364,11 @@ class OPUS(object):
         myquery = self._get_time_query(t1, t2)
         if target is not None:
             myquery["target"] = target
-        self.create_files_request(myquery, fmt="json")
-        self.unpack_json_response()
+        self.unpack_json_response(self.fetch("files", myquery))
 
     def get_between_resolutions(self, res1="", res2="0.5"):
         myquery = self.get_radial_res_query(res1, res2)
-        self.create_files_request(myquery, fmt="json")
-        self.unpack_json_response()
+        self.unpack_json_response(self.fetch("files", myquery))
 
     def show_images(self, size="small"):
         """Shows preview images using the Jupyter notebook HTML display.
@@ -0,0 +1,783 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../notebooks/api/02i_pds.synthetic.ipynb.
+
+# %% auto 0
+__all__ = ['Layout', 'ctx_edr', 'hirise_edr', 'hirise_rdr', 'lroc_edr', 'iss_index', 'uvis_index', 'layouts', 'uniform', 'pick',
+           'pds_times', 'corners', 'mro_orbits', 'ctx_edr_values', 'hirise_observations', 'hirise_common',
+           'orbit_folder', 'hirise_edr_values', 'hirise_rdr_values', 'lroc_edr_values', 'iss_index_values',
+           'uvis_index_values', 'layout_values', 'index_label', 'write_index', 'ctx_img_label', 'write_ctx_img',
+           'write_ctx_edrs', 'RangeRequestHandler', 'PDSServer', 'temporary_storage']
+
+# %% ../../notebooks/api/02i_pds.synthetic.ipynb 4
+import email.utils
+import os
+import re
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+from fastcore.xtras import Path
+
+# %% ../../notebooks/api/02i_pds.synthetic.ipynb 6
+# irrational steps of the low-discrepancy sequences below, one per stream of values
+_steps = np.sqrt([2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]) % 1
+
+
+def uniform(
+    rows: np.ndarray,  # Row numbers
+    stream: int = 0,  # Number of the value stream, use different ones for independent columns
+    low: float = 0.0,
+    high: float = 1.0,
+) -> np.ndarray:
+    """Deterministic pseudo-random values in [low, high) for row numbers.
+
+    The value of a row only depends on its row number, so tables can be written in chunks
+    and single rows, e.g. the product id of row 654321, can be computed without the table.
+    """
+    rows = np.asarray(rows, dtype="float64")
+    return low + (high - low) * ((rows + 1) * _steps[stream % len(_steps)] % 1)
+
+
+def pick(
+    rows: np.ndarray,  # Row numbers
+    options: list,  # Values to pick from
+    stream: int = 0,  # Number of the value stream
+) -> list:
+    "Pick one of `options` per row."
+    return np.asarray(options)[(uniform(rows, stream) * len(options)).astype(int)].tolist()
+
+
+def pds_times(
+    times: np.ndarray,  # datetime64 values
+    doy: bool = False,  # Use day of year instead of month and day, like the Cassini indexes
+) -> list:
+    "Format times like the PDS index tables do, with milliseconds."
+    iso = np.datetime_as_string(times.astype("datetime64[ms]"), unit="ms").tolist()
+    if not doy:
+        return iso
+    return [f"{t[:4]}-{d:03d}{t[10:]}" for t, d in zip(iso, _doys(times))]
+
+
+def _doys(times):
+    days = times.astype("datetime64[D]")
+    return ((days - days.astype("datetime64[Y]")).astype(int) + 1).tolist()
+
+
+def corners(
+    lats: np.ndarray,  # Center latitudes
+    lons: np.ndarray,  # Center longitudes
+    height: float,  # Footprint height in degrees of latitude
+    width: float,  # Footprint width in degrees of longitude at the equator
+) -> dict:
+    "Corner coordinates of north-up footprints around the centers, named like in the CTX and LROC indexes."
+    dlat = height / 2
+    dlon = width / 2 / np.maximum(np.cos(np.radians(lats)), 0.05)
+    top, bottom = np.clip(lats + dlat, -90, 90), np.clip(lats - dlat, -90, 90)
+    left, right = (lons - dlon) % 360, (lons + dlon) % 360
+    d = {}
+    for vert, vlats in [("UPPER", top), ("LOWER", bottom)]:
+        for horiz, hlons in [("LEFT", left), ("RIGHT", right)]:
+            d[f"{vert}_{horiz}_LATITUDE"] = vlats
+            d[f"{vert}_{horiz}_LONGITUDE"] = hlons
+    return d
+
+# %% ../../notebooks/api/02i_pds.synthetic.ipynb 9
+# columns are (name, data type, bytes, format spec of the values)
+Layout = namedtuple("Layout", "fname columns values")
+
+_mro_start = np.datetime64("2006-03-24T04:00:00", "ms")
+_mro_orbit = np.timedelta64(112 * 60_000, "ms")
+
+
+def mro_orbits(
+    rows: np.ndarray,  # Row numbers
+    per_orbit: int,  # Observations per orbit
+) -> tuple:  # orbit numbers and observation times
+    "MRO orbits and observation times, in the order of the cumulative indexes."
+    rows = np.asarray(rows)
+    orbits = rows // per_orbit + 1
+    times = _mro_start + orbits * _mro_orbit + (rows % per_orbit) * (_mro_orbit // per_orbit)
+    return orbits, times
+
+
+def ctx_edr_values(rows):
+    rows = np.asarray(rows)
+    orbits, times = mro_orbits(rows, 10)
+    lats, lons = uniform(rows, 0, -89, 89), uniform(rows, 1, 0, 360)
+    summing = np.where(uniform(rows, 2) < 0.8, 1, 2)
+    phases = np.array(list("PBDFGJ"))[orbits // 20_000 % 6]
+    # the 4 digits after the orbit are unique within an orbit
+    codes = (lats + 90).astype(int) * 10 + rows % 10
+    pids = [
+        f"{p}{o // 1000 % 99 + 1:02d}_{o:06d}_{c:04d}_XI_{abs(la):02.0f}{'N' if la >= 0 else 'S'}{lo:03.0f}W"
+        for p, o, c, la, lo in zip(phases.tolist(), orbits.tolist(), codes.tolist(), lats.tolist(), lons.tolist())
+    ]
+    volumes = [f"MROX_{v:04d}" for v in (orbits // 500 + 1).tolist()]
+    sclk = (times - np.datetime64("1980-01-06", "ms")).astype("int64")
+    return dict(
+        VOLUME_ID=volumes,
+        FILE_SPECIFICATION_NAME=[f"DATA/{pid}.IMG" for pid in pids],
+        ORIGINAL_PRODUCT_ID=[f"4A_04_{o:06X}{r % 100:02d}" for o, r in zip(orbits.tolist(), rows.tolist())],
+        PRODUCT_ID=pids,
+        IMAGE_TIME=pds_times(times),
+        SPACECRAFT_CLOCK_START_COUNT=[f"{s // 1000:010d}:{s % 1000 * 256 // 1000:03d}" for s in sclk.tolist()],
+        INSTRUMENT_ID=["CTX"] * len(rows),
+        INSTRUMENT_MODE_ID=np.where(summing == 1, "NIFL", "SUM2").tolist(),
+        LINE_SAMPLES=(5056 // summing).tolist(),
+        LINES=(uniform(rows, 3, 1, 52) * 1024 // summing).astype(int).tolist(),
+        SPATIAL_SUMMING=summing.tolist(),
+        SCALED_PIXEL_WIDTH=(uniform(rows, 4, 5.5, 6.5) * summing).tolist(),
+        EMISSION_ANGLE=uniform(rows, 5, 0, 30).tolist(),
+        INCIDENCE_ANGLE=uniform(rows, 6, 20, 90).tolist(),
+        PHASE_ANGLE=uniform(rows, 7, 20, 110).tolist(),
+        CENTER_LATITUDE=lats.tolist(),
+        CENTER_LONGITUDE=lons.tolist(),
+        **{k: v.tolist() for k, v in corners(lats, lons, 0.5, 0.5).items()},
+        MISSION_PHASE_NAME=np.where(orbits < 11_000, "PSP", "ESP").tolist(),
+        TARGET_NAME=["MARS"] * len(rows),
+        ORBIT_NUMBER=orbits.tolist(),
+        DATA_QUALITY_DESC=np.where(rows % 1000 == 999, "ERROR", "OK").tolist(),
+    )
+
+
+ctx_edr = Layout(
+    "CUMINDEX",
+    [
+        ("VOLUME_ID", "CHARACTER", 9, ""),
+        ("FILE_SPECIFICATION_NAME", "CHARACTER", 35, ""),
+        ("ORIGINAL_PRODUCT_ID", "CHARACTER", 14, ""),
+        ("PRODUCT_ID", "CHARACTER", 26, ""),
+        ("IMAGE_TIME", "TIME", 23, ""),
+        ("SPACECRAFT_CLOCK_START_COUNT", "CHARACTER", 16, ""),
+        ("INSTRUMENT_ID", "CHARACTER", 3, ""),
+        ("INSTRUMENT_MODE_ID", "CHARACTER", 4, ""),
+        ("LINE_SAMPLES", "ASCII_INTEGER", 5, "d"),
+        ("LINES", "ASCII_INTEGER", 6, "d"),
+        ("SPATIAL_SUMMING", "ASCII_INTEGER", 1, "d"),
+        ("SCALED_PIXEL_WIDTH", "ASCII_REAL", 6, ".2f"),
+        ("EMISSION_ANGLE", "ASCII_REAL", 6, ".2f"),
+        ("INCIDENCE_ANGLE", "ASCII_REAL", 6, ".2f"),
+        ("PHASE_ANGLE", "ASCII_REAL", 6, ".2f"),
+        ("CENTER_LATITUDE", "ASCII_REAL", 7, ".3f"),
+        ("CENTER_LONGITUDE", "ASCII_REAL", 7, ".3f"),
+        ("UPPER_LEFT_LATITUDE", "ASCII_REAL", 7, ".3f"),
+        ("UPPER_LEFT_LONGITUDE", "ASCII_REAL", 7, ".3f"),
+        ("UPPER_RIGHT_LATITUDE", "ASCII_REAL", 7, ".3f"),
+        ("UPPER_RIGHT_LONGITUDE", "ASCII_REAL", 7, ".3f"),
+        ("LOWER_LEFT_LATITUDE", "ASCII_REAL", 7, ".3f"),
+        ("LOWER_LEFT_LONGITUDE", "ASCII_REAL", 7, ".3f"),
+        ("LOWER_RIGHT_LATITUDE", "ASCII_REAL", 7, ".3f"),
+        ("LOWER_RIGHT_LONGITUDE", "ASCII_REAL", 7, ".3f"),
+        ("MISSION_PHASE_NAME", "CHARACTER", 3, ""),
+        ("TARGET_NAME", "CHARACTER", 4, ""),
+        ("ORBIT_NUMBER", "ASCII_INTEGER", 6, "d"),
+        ("DATA_QUALITY_DESC", "CHARACTER", 5, ""),
+    ],
+    ctx_edr_values,
+)
+
+# %% ../../notebooks/api/02i_pds.synthetic.ipynb 10
+def hirise_observations(rows, per_orbit):
+    "Observation ids, orbits and times of HiRISE observations, `per_orbit` rows per orbit."
+    rows = np.asarray(rows)
+    orbits, times = mro_orbits(rows, per_orbit)
+    lats, lons = uniform(rows // per_orbit, 0, -89, 89), uniform(rows // per_orbit, 1, 0, 360)
+    phases = np.where(orbits < 11_000, "PSP", "ESP")
+    obsids = [
+        f"{p}_{o:06d}_{int((la + 90) * 20) // 10 * 5:04d}"
+        for p, o, la in zip(phases.tolist(), orbits.tolist(), lats.tolist())
+    ]
+    return obsids, orbits, times, lats, lons, phases
+
+
+def hirise_common(rows, obsids, orbits, times, phases, pids, specs):
+    n = len(rows)
+    return dict(
+        VOLUME_ID=[f"MROHR_{v:04d}" for v in (orbits // 1000 + 1).tolist()],
+        FILE_NAME_SPECIFICATION=specs,
+        INSTRUMENT_HOST_ID=["MRO"] * n,
+        INSTRUMENT_ID=["HIRISE"] * n,
+        OBSERVATION_ID=obsids,
+        PRODUCT_ID=pids,
+        PRODUCT_VERSION_ID=["1.0"] * n,
+        TARGET_NAME=["MARS"] * n,
+        ORBIT_NUMBER=orbits.tolist(),
+        MISSION_PHASE_NAME=np.where(
+            phases == "PSP", "PRIMARY SCIENCE PHASE", "EXTENDED SCIENCE PHASE"
+        ).tolist(),
+        START_TIME=pds_times(times),
+        STOP_TIME=pds_times(times + np.timedelta64(6_000, "ms")),
+    )
+
+
+def orbit_folder(obsid):
+    "Folder of 100 orbits in the HiRISE archive, e.g. ORB_001300_001399"
+    orbit = int(obsid[4:10]) // 100 * 100
+    return f"{obsid[:3]}/ORB_{orbit:06d}_{orbit + 99:06d}/{obsid}"
+
+
+# 14 CCD channel pairs per observation
+_ccds = [
+    f"{color}{i}_{channel}"
+    for i, color in enumerate(["RED"] * 10 + ["IR"] * 2 + ["BG"] * 2)
+    for channel in (0, 1)
+]
+
+
+def hirise_edr_values(rows):
+    rows = np.asarray(rows)
+    obsids, orbits, times, lats, lons, phases = hirise_observations(rows, len(_ccds))
+    ccds = [_ccds[i] for i in (rows % len(_ccds)).tolist()]
+    pids = [f"{o}_{c}" for o, c in zip(obsids, ccds)]
+    specs = [f"EDR/{orbit_folder(o)}/{pid}.IMG" for o, pid in zip(obsids, pids)]
+    d = hirise_common(rows, obsids, orbits, times, phases, pids, specs)
+    binning = np.array([1, 2, 4])[(uniform(rows // len(_ccds), 2) * 3).astype(int)]
+    d.update(
+        CCD_NAME=[c.split("_")[0] for c in ccds],
+        CHANNEL_NUMBER=[int(c[-1]) for c in ccds],
+        BINNING=binning.tolist(),
+        IMAGE_LINES=(uniform(rows // len(_ccds), 3, 2, 40) * 1000 // binning).astype(int).tolist(),
+        LINE_SAMPLES=(1024 // binning).tolist(),
+        EMISSION_ANGLE=uniform(rows // len(_ccds), 5, 0, 30).tolist(),
+        INCIDENCE_ANGLE=uniform(rows // len(_ccds), 6, 20, 90).tolist(),
+        CENTER_LATITUDE=lats.tolist(),
+        CENTER_LONGITUDE=lons.tolist(),
+    )
+    return d
+
+
+hirise_edr = Layout(
+    "EDRCUMINDEX",
+    [
+        ("VOLUME_ID", "CHARACTER", 10, ""),
+        ("FILE_NAME_SPECIFICATION", "CHARACTER", 70, ""),
+        ("INSTRUMENT_HOST_ID", "CHARACTER", 3, ""),
+        ("INSTRUMENT_ID", "CHARACTER", 6, ""),
+        ("OBSERVATION_ID", "CHARACTER", 15, ""),
+        ("PRODUCT_ID", "CHARACTER", 23, ""),
+        ("PRODUCT_VERSION_ID", "CHARACTER", 3, ""),
+        ("TARGET_NAME", "CHARACTER", 4, ""),
+        ("ORBIT_NUMBER", "ASCII_INTEGER", 6, "d"),
+        ("MISSION_PHASE_NAME", "CHARACTER", 22, ""),
+        ("START_TIME", "TIME", 23, ""),
+        ("STOP_TIME", "TIME", 23, ""),
+        ("CCD_NAME", "CHARACTER", 4, ""),
+        ("CHANNEL_NUMBER", "ASCII_INTEGER", 1, "d"),
+        ("BINNING", "ASCII_INTEGER", 1, "d"),
+        ("IMAGE_LINES", "ASCII_INTEGER", 6, "d"),
+        ("LINE_SAMPLES", "ASCII_INTEGER", 4, "d"),
+        ("EMISSION_ANGLE", "ASCII_REAL", 6, ".2f"),
+        ("INCIDENCE_ANGLE", "ASCII_REAL", 6, ".2f"),
+        ("CENTER_LATITUDE", "ASCII_REAL", 7, ".3f"),
+        ("CENTER_LONGITUDE", "ASCII_REAL", 7, ".3f"),
+    ],
+    hirise_edr_values,
+)
+
+
+def hirise_rdr_values(rows):
+    rows = np.asarray(rows)
+    obsids, orbits, times, lats, lons, phases = hirise_observations(rows, 2)
+    kinds = np.where(rows % 2 == 0, "RED", "COLOR").tolist()
+    pids = [f"{o}_{k}" for o, k in zip(obsids, kinds)]
+    specs = [f"RDR/{orbit_folder(o)}/{pid}.JP2" for o, pid in zip(obsids, pids)]
+    d = hirise_common(rows, obsids, orbits, times, phases, pids, specs)
+    polar = np.abs(lats) > 65
+    d.update(
+        MAP_PROJECTION_TYPE=np.where(polar, "POLAR STEREOGRAPHIC", "EQUIRECTANGULAR").tolist(),
+        MAP_SCALE=np.where(uniform(rows // 2, 2) < 0.7, 0.25, 0.5).tolist(),
+        CENTER_LATITUDE=lats.tolist(),
+        CENTER_LONGITUDE=lons.tolist(),
+    )
+    # the RDR footprints are the map corners, numbered clockwise
+    c = corners(lats, lons, 0.1, np.where(rows % 2 == 0, 0.1, 0.02))
+    for i, corner in enumerate(["UPPER_LEFT", "UPPER_RIGHT", "LOWER_RIGHT", "LOWER_LEFT"], 1):
+        d[f"CORNER{i}_LATITUDE"] = c[f"{corner}_LATITUDE"].tolist()
+        d[f"CORNER{i}_LONGITUDE"] = c[f"{corner}_LONGITUDE"].tolist()
+    return d
+
+
+hirise_rdr = Layout(
+    "RDRCUMINDEX",
+    hirise_edr.columns[:12]
+    + [
+        ("MAP_PROJECTION_TYPE", "CHARACTER", 19, ""),
+        ("MAP_SCALE", "ASCII_REAL", 5, ".2f"),
+        ("CENTER_LATITUDE", "ASCII_REAL", 7, ".3f"),
+        ("CENTER_LONGITUDE", "ASCII_REAL", 7, ".3f"),
+    ]
+    + [
+        (f"CORNER{i}_{coord}", "ASCII_REAL", 7, ".3f")
+        for i in range(1, 5)
+        for coord in ["LATITUDE", "LONGITUDE"]
+    ],
+    hirise_rdr_values,
+)
+
+# %% ../../notebooks/api/02i_pds.synthetic.ipynb 11
+_lro_start = np.datetime64("2009-07-13T00:00:00", "ms")
+
+
+def lroc_edr_values(rows):
+    rows = np.asarray(rows)
+    # one NAC pair per LRO orbit of 113 minutes
+    pairs = rows // 2
+    times = _lro_start + pairs * np.timedelta64(113 * 60_000, "ms")
+    sclk = (times - np.datetime64("2001-01-01", "ms")).astype("int64") // 1000
+    sides = np.where(rows % 2 == 0, "L", "R").tolist()
+    pids = [f"M{s:09d}{side}E" for s, side in zip(sclk.tolist(), sides)]
+    days = [t[:4] + f"{d:03d}" for t, d in zip(pds_times(times), _doys(times))]
+    lats, lons = uniform(pairs, 0, -89, 89), uniform(pairs, 1, 0, 360)
+    lons = lons + np.where(rows % 2 == 0, -0.03, 0.03)
+    return dict(
+        VOLUME_ID=[f"LROLRC_{v:04d}" for v in (pairs // 2000 + 1).tolist()],
+        FILE_SPECIFICATION_NAME=[f"DATA/SCI/{d}/NAC/{pid}.IMG" for d, pid in zip(days, pids)],
+        ORIGINAL_PRODUCT_ID=[f"nac{side.lower()}{s:08x}" for s, side in zip(sclk.tolist(), sides)],
+        PRODUCT_ID=pids,
+        MISSION_PHASE_NAME=np.where(
+            times < np.datetime64("2010-09-15"), "NOMINAL MISSION", "SCIENCE MISSION"
+        ).tolist(),
+        TARGET_NAME=["MOON"] * len(rows),
+        ORBIT_NUMBER=(pairs + 200).tolist(),
+        START_TIME=pds_times(times),
+        STOP_TIME=pds_times(times + np.timedelta64(25_000, "ms")),
+        IMAGE_LINES=(uniform(pairs, 3, 5, 52) * 1024).astype(int).tolist(),
+        LINE_SAMPLES=[5064] * len(rows),
+        EMISSION_ANGLE=uniform(pairs, 5, 0, 10).tolist(),
+        INCIDENCE_ANGLE=uniform(pairs, 6, 20, 90).tolist(),
+        PHASE_ANGLE=uniform(pairs, 7, 20, 90).tolist(),
+        CENTER_LATITUDE=lats.tolist(),
+        CENTER_LONGITUDE=(lons % 360).tolist(),
+        **{k: v.tolist() for k, v in corners(lats, lons % 360, 0.8, 0.05).items()},
+    )
+
+
+lroc_edr = Layout(
+    "CUMINDEX",
+    [
+        ("VOLUME_ID", "CHARACTER", 11, ""),
+        ("FILE_SPECIFICATION_NAME", "CHARACTER", 39, ""),
+        ("ORIGINAL_PRODUCT_ID", "CHARACTER", 12, ""),
+        ("PRODUCT_ID", "CHARACTER", 12, ""),
+        ("MISSION_PHASE_NAME", "CHARACTER", 15, ""),
+        ("TARGET_NAME", "CHARACTER", 4, ""),
+        ("ORBIT_NUMBER", "ASCII_INTEGER", 6, "d"),
+        ("START_TIME", "TIME", 23, ""),
+        ("STOP_TIME", "TIME", 23, ""),
+        ("IMAGE_LINES", "ASCII_INTEGER", 5, "d"),
+        ("LINE_SAMPLES", "ASCII_INTEGER", 4, "d"),
+        ("EMISSION_ANGLE", "ASCII_REAL", 6, ".2f"),
+        ("INCIDENCE_ANGLE", "ASCII_REAL", 6, ".2f"),
+        ("PHASE_ANGLE", "ASCII_REAL", 6, ".2f"),
+        ("CENTER_LATITUDE", "ASCII_REAL", 7, ".3f"),
+        ("CENTER_LONGITUDE", "ASCII_REAL", 7, ".3f"),
+        ("UPPER_LEFT_LATITUDE", "ASCII_REAL", 7, ".3f"),
+        ("UPPER_LEFT_LONGITUDE", "ASCII_REAL", 7, ".3f"),
+        ("UPPER_RIGHT_LATITUDE", "ASCII_REAL", 7, ".3f"),
+        ("UPPER_RIGHT_LONGITUDE", "ASCII_REAL", 7, ".3f"),
+        ("LOWER_LEFT_LATITUDE", "ASCII_REAL", 7, ".3f"),
+        ("LOWER_LEFT_LONGITUDE", "ASCII_REAL", 7, ".3f"),
+        ("LOWER_RIGHT_LATITUDE", "ASCII_REAL", 7, ".3f"),
+        ("LOWER_RIGHT_LONGITUDE", "ASCII_REAL", 7, ".3f"),
+    ],
+    lroc_edr_values,
+)
+
+_cassini_start = np.datetime64("2004-01-01T00:00:00", "ms")
+_cassini_targets = ["SATURN", "TITAN", "ENCELADUS", "RINGS", "RHEA", "DIONE", "IAPETUS", "SKY"]
+
+
+def iss_index_values(rows):
+    rows = np.asarray(rows)
+    times = _cassini_start + rows * np.timedelta64(97_000, "ms")
+    # the Cassini clock counts seconds since 1958
+    sclk = (times - np.datetime64("1958-01-01", "ms")).astype("int64") // 1000
+    cams = np.where(uniform(rows, 2) < 0.7, "N", "W").tolist()
+    fnames = [f"{c}{s:010d}_1" for c, s in zip(cams, sclk.tolist())]
+    # data folders span 20000 clock seconds, as in the COISS_2xxx volumes
+    folders = [f"{s // 20_000 * 20_000:010d}_{s // 20_000 * 20_000 + 19_999:010d}" for s in sclk.tolist()]
+    return dict(
+        VOLUME_ID=[f"COISS_{v:04d}" for v in (rows // 4000 + 2001).tolist()],
+        FILE_SPECIFICATION_NAME=[f"data/{d}/{f}.LBL" for d, f in zip(folders, fnames)],
+        FILE_NAME=[f"{f}.IMG" for f in fnames],
+        INSTRUMENT_ID=[f"ISS{c}A" for c in cams],
+        START_TIME=pds_times(times, doy=True),
+        STOP_TIME=pds_times(times + np.timedelta64(1_000, "ms"), doy=True),
+        SPACECRAFT_CLOCK_START_COUNT=[f"1/{s}.118" for s in sclk.tolist()],
+        TARGET_NAME=pick(rows, _cassini_targets, 3),
+        FILTER_NAME=pick(rows, ["CL1,CL2", "CL1,GRN", "RED,CL2", "BL1,CL2", "MT2,CB2"], 4),
+        INSTRUMENT_MODE_ID=pick(rows, ["FULL", "SUM2", "SUM4"], 5),
+        EXPOSURE_DURATION=uniform(rows, 6, 5, 12000).tolist(),
+    )
+
+
+iss_index = Layout(
+    "index",
+    [
+        ("VOLUME_ID", "CHARACTER", 10, ""),
+        ("FILE_SPECIFICATION_NAME", "CHARACTER", 45, ""),
+        ("FILE_NAME", "CHARACTER", 17, ""),
+        ("INSTRUMENT_ID", "CHARACTER", 5, ""),
+        ("START_TIME", "TIME", 21, ""),
+        ("STOP_TIME", "TIME", 21, ""),
+        ("SPACECRAFT_CLOCK_START_COUNT", "CHARACTER", 16, ""),
+        ("TARGET_NAME", "CHARACTER", 9, ""),
+        ("FILTER_NAME", "CHARACTER", 7, ""),
+        ("INSTRUMENT_MODE_ID", "CHARACTER", 4, ""),
+        ("EXPOSURE_DURATION", "ASCII_REAL", 9, ".3f"),
+    ],
+    iss_index_values,
+)
+
+
+def uvis_index_values(rows):
+    rows = np.asarray(rows)
+    channels = pick(rows, ["EUV", "FUV", "HSP", "HDAC"], 2)
+    times = (_cassini_start + rows * np.timedelta64(11 * 60_000, "ms")).astype("datetime64[m]")
+    stamps = [f"{t[:4]}_{d:03d}_{t[11:13]}_{t[14:16]}" for t, d in zip(pds_times(times), _doys(times))]
+    pids = [f"{c}{s}" for c, s in zip(channels, stamps)]
+    durations = np.array([60, 120, 240, 480])[(uniform(rows, 3) * 4).astype(int)]
+    return dict(
+        # one volume per quarter year
+        VOLUME_ID=[f"COUVIS_{v:04d}" for v in (times.astype("datetime64[M]").astype(int) // 3 - 135).tolist()],
+        FILE_SPECIFICATION_NAME=[f"DATA/D{s[:8]}/{pid}.LBL" for s, pid in zip(stamps, pids)],
+        PRODUCT_ID=pids,
+        START_TIME=pds_times(times, doy=True),
+        STOP_TIME=pds_times(times + np.timedelta64(10, "m"), doy=True),
+        TARGET_NAME=pick(rows, _cassini_targets, 4),
+        INTEGRATION_DURATION=durations.tolist(),
+        SLIT_STATE=pick(rows, ["LOW_RESOLUTION", "HIGH_RESOLUTION", "OCCULTATION"], 5),
+    )
+
+
+uvis_index = Layout(
+    "INDEX",
+    [
+        ("VOLUME_ID", "CHARACTER", 11, ""),
+        ("FILE_SPECIFICATION_NAME", "CHARACTER", 37, ""),
+        ("PRODUCT_ID", "CHARACTER", 18, ""),
+        ("START_TIME", "TIME", 21, ""),
+        ("STOP_TIME", "TIME", 21, ""),
+        ("TARGET_NAME", "CHARACTER", 9, ""),
+        ("INTEGRATION_DURATION", "ASCII_REAL", 7, ".1f"),
+        ("SLIT_STATE", "CHARACTER", 15, ""),
+    ],
+    uvis_index_values,
+)
+
+# synthetic layouts by index key of the config file
+layouts = {
+    "mro.ctx.edr": ctx_edr,
+    "mro.hirise.edr": hirise_edr,
+    "mro.hirise.rdr": hirise_rdr,
+    "lro.lroc.edr": lroc_edr,
+    "cassini.iss.index": iss_index,
+    "cassini.uvis.index": uvis_index,
+}
+
+
+def layout_values(
+    key: str,  # Index key, e.g. mro.ctx.edr, see `layouts`
+    rows,  # Row numbers, e.g. a range
+) -> dict:  # Column name to list of values
+    "Values of the synthetic index `key` at `rows`, without writing the table."
+    return layouts[key].values(np.asarray(rows))
+
+# %% ../../notebooks/api/02i_pds.synthetic.ipynb 14
+def _field(name, data_type, nbytes, fmt):
+    if data_type == "CHARACTER":
+        return f'"{{:<{nbytes}.{nbytes}}}"'
+    if fmt:
+        return f"{{:>{nbytes}{fmt}}}"
+    return f"{{:<{nbytes}.{nbytes}}}"
+
+
+def index_label(
+    layout: Layout,
+    rows: int,  # Number of rows of the table
+    tabname: str,  # File name of the table
+) -> str:  # PDS3 label text
+    "PDS3 label of a synthetic index table, with quoted CHARACTER columns as in the PDS cumindexes."
+    # fields are separated by commas, records end with CR LF
+    record_bytes = sum(nbytes + 2 * (data_type == "CHARACTER") + 1 for _, data_type, nbytes, _ in layout.columns) + 1
+    lines = [
+        "PDS_VERSION_ID = PDS3",
+        "RECORD_TYPE = FIXED_LENGTH",
+        f"RECORD_BYTES = {record_bytes}",
+        f"FILE_RECORDS = {rows}",
+        f'^INDEX_TABLE = "{tabname}"',
+        "OBJECT = INDEX_TABLE",
+        "  INTERCHANGE_FORMAT = ASCII",
+        f"  ROWS = {rows}",
+        f"  ROW_BYTES = {record_bytes}",
+        f"  COLUMNS = {len(layout.columns)}",
+    ]
+    start = 1
+    for name, data_type, nbytes, _ in layout.columns:
+        quoted = data_type == "CHARACTER"
+        lines += [
+            "  OBJECT = COLUMN",
+            f"    NAME = {name}",
+            f"    DATA_TYPE = {data_type}",
+            f"    START_BYTE = {start + quoted}",
+            f"    BYTES = {nbytes}",
+            "  END_OBJECT = COLUMN",
+        ]
+        start += nbytes + 2 * quoted + 1
+    lines += ["END_OBJECT = INDEX_TABLE", "END", ""]
+    return "\r\n".join(lines)
+
+
+def write_index(
+    key: str,  # Index key, e.g. mro.ctx.edr, see `layouts`
+    folder: str,  # Where to write label and table
+    rows: int,  # Number of rows
+    chunk_rows: int = 100_000,  # Rows computed at once, limits the memory use
+) -> tuple:  # Paths of label and table
+    """Write a synthetic PDS3 index label and fixed-length table with `rows` records.
+
+    Column names, types and value formats follow the real index of `key`, so that the index
+    readers work on them the same way, but the values are made up.
+    """
+    layout = layouts[key]
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    lblpath, tabpath = folder / f"{layout.fname}.LBL", folder / f"{layout.fname}.TAB"
+    label = index_label(layout, rows, tabpath.name)
+    record_bytes = int(re.search(r"RECORD_BYTES = (\d+)", label).group(1))
+    record = ",".join(_field(*col) for col in layout.columns) + "\r\n"
+    names = [col[0] for col in layout.columns]
+    with open(tabpath, "w", newline="") as f:
+        for start in range(0, rows, chunk_rows):
+            values = layout.values(np.arange(start, min(start + chunk_rows, rows)))
+            text = "".join(record.format(*row) for row in zip(*[values[name] for name in names]))
+            if len(text) != record_bytes * len(values[names[0]]):
+                raise ValueError(f"Values of {key} exceed their column widths.")
+            f.write(text)
+    lblpath.write_bytes(label.encode())
+    return lblpath, tabpath
+
+# %% ../../notebooks/api/02i_pds.synthetic.ipynb 17
+def ctx_img_label(
+    meta: dict,  # One row of CTX index values, see `layout_values`
+    lines: int,  # Number of image lines
+) -> str:  # Attached label, padded to full records
+    "Attached PDS3 label of a CTX EDR image."
+    samples = meta["LINE_SAMPLES"]
+    label_records = 1
+    while True:
+        text = "\r\n".join(
+            [
+                "PDS_VERSION_ID = PDS3",
+                f'FILE_NAME = "{meta["PRODUCT_ID"]}.IMG"',
+                "RECORD_TYPE = FIXED_LENGTH",
+                f"RECORD_BYTES = {samples}",
+                f"FILE_RECORDS = {label_records + lines}",
+                f"LABEL_RECORDS = {label_records}",
+                f"^IMAGE = {label_records + 1}",
+                "SPACECRAFT_NAME = MARS_RECONNAISSANCE_ORBITER",
+                'INSTRUMENT_NAME = "CONTEXT CAMERA"',
+                "INSTRUMENT_ID = CTX",
+                f'VOLUME_ID = "{meta["VOLUME_ID"]}"',
+                f'PRODUCT_ID = "{meta["PRODUCT_ID"]}"',
+                f'ORIGINAL_PRODUCT_ID = "{meta["ORIGINAL_PRODUCT_ID"]}"',
+                f"IMAGE_TIME = {meta['IMAGE_TIME']}",
+                f'SPACECRAFT_CLOCK_START_COUNT = "{meta["SPACECRAFT_CLOCK_START_COUNT"]}"',
+                f"ORBIT_NUMBER = {meta['ORBIT_NUMBER']}",
+                "TARGET_NAME = MARS",
+                f"SPATIAL_SUMMING = {meta['SPATIAL_SUMMING']}",
+                f"LINE_EXPOSURE_DURATION = {1.877 * meta['SPATIAL_SUMMING']:.3f} <MSEC>",
+                "OBJECT = IMAGE",
+                f"  LINES = {lines}",
+                f"  LINE_SAMPLES = {samples}",
+                "  LINE_PREFIX_BYTES = 0",
+                "  LINE_SUFFIX_BYTES = 0",
+                "  SAMPLE_TYPE = UNSIGNED_INTEGER",
+                "  SAMPLE_BITS = 8",
+                '  SAMPLE_BIT_MODE_ID = "SQROOT"',
+                "END_OBJECT = IMAGE",
+                "END",
+                "",
+            ]
+        )
+        # the image starts at a record boundary
+        if len(text) <= label_records * samples:
+            return text.ljust(label_records * samples)
+        label_records = -(-len(text) // samples)
+
+
+def write_ctx_img(
+    path: str,  # Where to write the IMG file
+    row: int = 0,  # Row of the synthetic CTX index to take the metadata from
+    lines: int = 1024,  # Number of image lines, real ones have 7000 to 52000
+    block_lines: int = 1024,  # Lines computed at once, limits the memory use
+) -> Path:
+    """Write a synthetic CTX EDR: attached PDS3 label and 8-bit image of smooth terrain and noise.
+
+    Label and size match the row of the synthetic CTX index, so collections of these can be
+    downloaded and read like real EDRs, just without the ISIS calibration.
+    """
+    meta = {k: v[0] for k, v in layout_values("mro.ctx.edr", [row]).items()}
+    samples = meta["LINE_SAMPLES"]
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(row)
+    x = np.arange(samples)
+    with open(path, "wb") as f:
+        f.write(ctx_img_label(meta, lines).encode())
+        for start in range(0, lines, block_lines):
+            y = np.arange(start, min(start + block_lines, lines))[:, None]
+            terrain = 110 + 40 * np.sin(x / 97 + row) * np.cos(y / 131) + 15 * np.sin((x + y) / 23)
+            noise = rng.normal(0, 6, terrain.shape)
+            f.write(np.clip(terrain + noise, 0, 255).astype("uint8").tobytes())
+    return path
+
+
+def write_ctx_edrs(
+    root: str,  # Root of the archive tree, the EDR data URL of CTX points here
+    rows,  # Rows of the synthetic CTX index to write EDRs for
+    lines: int = 1024,  # Number of image lines per EDR
+) -> list:  # Paths of the written files
+    "Write synthetic CTX EDRs in the layout of the PDS archive: <volume>/data/<product_id>.IMG"
+    values = layout_values("mro.ctx.edr", rows)
+    return [
+        write_ctx_img(Path(root) / vol.lower() / "data" / f"{pid}.IMG", row, lines)
+        for row, vol, pid in zip(rows, values["VOLUME_ID"], values["PRODUCT_ID"])
+    ]
+
+# %% ../../notebooks/api/02i_pds.synthetic.ipynb 20
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """Serve files like the PDS servers do, with Last-Modified, ETag and single byte range support.
+
+    Conditional requests with If-Modified-Since or If-None-Match are answered with `304 Not Modified`.
+    """
+
+    def log_message(self, *args):
+        pass
+
+    def send_head(self):
+        self.remaining = None
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            return super().send_head()
+        stat = os.stat(path)
+        size = stat.st_size
+        etag = f'"{stat.st_mtime_ns:x}-{size:x}"'
+        if self.not_modified(stat, etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return None
+        start, end = 0, size - 1
+        status = HTTPStatus.OK
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", self.headers.get("Range", "").strip())
+        if match and any(match.groups()):
+            first, last = match.groups()
+            if first:
+                start, end = int(first), min(int(last), size - 1) if last else size - 1
+            else:  # suffix range, the last n bytes
+                start = max(size - int(last), 0)
+            if start > end:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+            status = HTTPStatus.PARTIAL_CONTENT
+        f = open(path, "rb")
+        f.seek(start)
+        self.remaining = end - start + 1
+        self.send_response(status)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Length", str(self.remaining))
+        self.send_header("Last-Modified", self.date_time_string(stat.st_mtime))
+        self.send_header("ETag", etag)
+        self.send_header("Accept-Ranges", "bytes")
+        if status == HTTPStatus.PARTIAL_CONTENT:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        return f
+
+    def not_modified(self, stat, etag):
+        if "If-None-Match" in self.headers:
+            return etag in self.headers["If-None-Match"]
+        if "If-Modified-Since" in self.headers and "Range" not in self.headers:
+            try:
+                since = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+            except (TypeError, ValueError):
+                return False
+            return int(stat.st_mtime) <= since.timestamp()
+        return False
+
+    def copyfile(self, source, outputfile):
+        # only send the requested range
+        remaining = self.remaining
+        if remaining is None:
+            return super().copyfile(source, outputfile)
+        while remaining > 0:
+            chunk = source.read(min(remaining, 64 * 1024))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            remaining -= len(chunk)
+
+
+class PDSServer:
+    """Serve a folder like a PDS archive, on a free localhost port in a background thread.
+
+    Use it as a context manager or call `stop` when done.
+    """
+
+    def __init__(
+        self,
+        root: str,  # Folder to serve, e.g. the output of `write_index` and `write_ctx_edrs`
+        port: int = 0,  # 0 picks a free port
+    ):
+        handler = partial(RangeRequestHandler, directory=str(root))
+        self.httpd = ThreadingHTTPServer(("localhost", port), handler)
+        self.url = f"http://localhost:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+# %% ../../notebooks/api/02i_pds.synthetic.ipynb 23
+@contextmanager
+def temporary_storage(
+    root: str,  # Folder for the index files and the config file
+):
+    """Let the shared `config` use a fresh config file with `root` as storage root.
+
+    Downloads, conversions, timestamps and ETags then end up in `root` instead of the user's
+    data folder and config file. The previous settings are restored afterwards.
+    """
+    from importlib.resources import files
+
+    import tomlkit as toml
+
+    from planetarypy.config import config
+
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    tomldoc = toml.loads(files("planetarypy.data").joinpath(config.fname).read_text())
+    tomldoc["storage_root"] = str(root)
+    path = root / config.fname
+    path.write_text(toml.dumps(tomldoc))
+    saved = config.path, config.tomldoc, config.storage_root
+    config.path = path
+    config._read_config()
+    try:
+        yield config
+    finally:
+        config.path, config.tomldoc, config.storage_root = saved
@@ -1,23 +1,43 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../notebooks/api/02f_pds.utils.ipynb.
 
 # %% auto 0
-__all__ = ['IndexLabel', 'convert_times', 'index_to_df', 'PVLColumn', 'decode_line', 'find_mixed_type_cols',
-           'fix_hirise_edrcumindex']
+__all__ = ['IndexLabel', 'convert_times', 'index_to_df', 'record_ranges', 'tab_to_parquet', 'append_to_parquet', 'Partitioning',
+           'write_dataset', 'parquet_to_dataset', 'read_dataset', 'TimeIndex', 'read_parquet_rows', 'parquet_to_arrow',
+           'read_arrow_file', 'SharedIndex', 'PVLColumn', 'decode_line', 'TabReader', 'KeyIndex',
+           'find_mixed_type_cols', 'fix_hirise_edrcumindex']
 
 # %% ../../notebooks/api/02f_pds.utils.ipynb 3
+import io
+import json
+import mmap
+import os
+import shutil
+import time
 import warnings
+from functools import cached_property
+from datetime import datetime
 from typing import Union
 
+import numpy as np
 import pandas as pd
 import pvl
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from fastcore.utils import Path
 from tqdm.auto import tqdm
+from tqdm.contrib.concurrent import process_map
 
-from .. import utils
+from .. import metrics, utils
 
 # %% ../../notebooks/api/02f_pds.utils.ipynb 4
 class IndexLabel:
-    "Support working with label files of PDS Index tables."
+    """Support working with label files of PDS Index tables.
+
+    The label is compiled once into a compact `schema` (table layout and column specs),
+    which is stored as JSON sidecar next to the label. As long as the label file is unchanged,
+    later instances read the sidecar and don't parse the PVL at all.
+    """
 
     def __init__(
         self,
@@ -27,10 +47,62 @@ class IndexLabel:
         labelpath: Union[str, Path],
     ):
         self.path = Path(labelpath)
-        "search for table name pointer and store key and fpath."
-        tuple = [i for i in self.pvl_lbl if i[0].startswith("^")][0]
-        self.tablename = tuple[0][1:]
-        self.index_name = tuple[1]
+        self.schema = self.load_schema()
+        if self.schema is None:
+            self.schema = self.compile_schema()
+            self.save_schema()
+        self.tablename = self.schema["tablename"]
+        self.index_name = self.schema["index_name"]
+
+    @property
+    def schema_path(self):
+        return self.path.with_suffix(".schema.json")
+
+    def compile_schema(self) -> dict:
+        "Extract everything needed to read the table from the PVL label."
+        # search for table name pointer and store key and fpath.
+        key, value = [i for i in self.pvl_lbl if i[0].startswith("^")][0]
+        table = self.pvl_lbl[key[1:]]
+        columns = []
+        for col in table.getlist("COLUMN"):
+            pvlcol = PVLColumn(col)
+            colspecs = pvlcol.colspecs if pvlcol.items is not None else [pvlcol.colspecs]
+            columns.append(
+                dict(
+                    name=pvlcol.name,
+                    data_type=col.get("DATA_TYPE"),
+                    start=pvlcol.start,
+                    bytes=col["BYTES"],
+                    items=pvlcol.items,
+                    names=pvlcol.name_as_list,
+                    colspecs=[list(spec) for spec in colspecs],
+                )
+            )
+        return dict(
+            label_mtime=self.path.stat().st_mtime,
+            tablename=key[1:],
+            index_name=value,
+            record_bytes=self.pvl_lbl.get("RECORD_BYTES") or table["ROW_BYTES"],
+            rows=table["ROWS"],
+            columns=columns,
+        )
+
+    def load_schema(self):
+        "Schema from the sidecar, if it was compiled from the current label file."
+        try:
+            schema = json.loads(self.schema_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if schema.get("label_mtime") != self.path.stat().st_mtime:
+            return None
+        return schema
+
+    def save_schema(self):
+        try:
+            self.schema_path.write_text(json.dumps(self.schema, indent=1))
+        except OSError:
+            # read-only data folders just don't get the speed-up
+            pass
 
     @property
     def index_path(self):
@@ -42,14 +114,24 @@ class IndexLabel:
             warnings.warn("`index_path` still doesn't exist.")
         return p
 
-    @property
+    @cached_property
     def pvl_lbl(self):
+        "The full PVL label, only parsed when needed."
         return pvl.load(str(self.path))
 
     @property
     def table(self):
         return self.pvl_lbl[self.tablename]
 
+    @property
+    def record_bytes(self):
+        "Length of one row in the table file, including the line terminator."
+        return self.schema["record_bytes"]
+
+    @property
+    def rows(self):
+        return self.schema["rows"]
+
     @property
     def pvl_columns(self):
         return self.table.getlist("COLUMN")
@@ -65,41 +147,39 @@ class IndexLabel:
         The label file for the PDS indices describes the content
         of the index files.
         """
-        colnames = []
-        for col in self.pvl_columns:
-            colnames.extend(PVLColumn(col).name_as_list)
-        return colnames
+        return [name for col in self.schema["columns"] for name in col["names"]]
 
     @property
     def colspecs(self):
-        colspecs = []
-        columns = self.table.getlist("COLUMN")
-        for column in columns:
-            pvlcol = PVLColumn(column)
-            if pvlcol.items is None:
-                colspecs.append(pvlcol.colspecs)
-            else:
-                colspecs.extend(pvlcol.colspecs)
-        return colspecs
+        return [tuple(spec) for col in self.schema["columns"] for spec in col["colspecs"]]
 
     def read_index_data(self, do_convert_times=True):
         return index_to_df(self.index_path, self, do_convert_times=do_convert_times)
 
-# %% ../../notebooks/api/02f_pds.utils.ipynb 5
-def convert_times(df):
+# %% ../../notebooks/api/02f_pds.utils.ipynb 7
+def convert_times(
+    df,
+    verbose=True,  # print a note about the conversion
+):
     for column in [col for col in df.columns if "TIME" in col]:
         if column in ["LOCAL_TIME", "DWELL_TIME"]:
             continue
+        # detect the format once per column, day-of-year times are parsed vectorized
+        values = df[column].dropna()
+        if len(values) and utils.is_nasa_time(values.iloc[0]):
+            df[column] = utils.parse_nasa_times(df[column])
+            continue
         try:
             df[column] = pd.to_datetime(df[column])
         except ValueError:
             df[column] = pd.to_datetime(
                 df[column], format=utils.nasa_dt_format_with_ms, errors="coerce"
             )
-    print("Convert time strings to datetime objects.")
+    if verbose:
+        print("Convert time strings to datetime objects.")
     return df
 
-# %% ../../notebooks/api/02f_pds.utils.ipynb 6
+# %% ../../notebooks/api/02f_pds.utils.ipynb 8
 def index_to_df(
     # Path to the index TAB file
     indexpath: Union[str, Path],
@@ -115,6 +195,7 @@ def index_to_df(
     this reader should work for all PDS TAB files.
     """
     indexpath = Path(indexpath)
+    t0 = time.perf_counter()
     # get n_lines fast for progress bar
     with open(indexpath, "rb") as f:  # courtesy of https://stackoverflow.com/a/1019572
         num_lines = sum(1 for _ in f)
@@ -133,9 +214,459 @@ def index_to_df(
     )
     if do_convert_times:
         df = convert_times(df)
+    metrics.track_parse("index_to_df", len(df), indexpath.stat().st_size, time.perf_counter() - t0)
     return df
 
-# %% ../../notebooks/api/02f_pds.utils.ipynb 7
+# %% ../../notebooks/api/02f_pds.utils.ipynb 10
+def record_ranges(
+    path: Union[str, Path],  # Path to a fixed-length TAB file
+    record_bytes: int,  # Bytes per record, including the line terminator
+    n_ranges: int,  # Number of ranges wanted
+) -> list:  # (start, stop) byte offsets, each holding whole records
+    n_records = Path(path).stat().st_size // record_bytes
+    bounds = np.linspace(0, n_records, min(n_ranges, n_records) + 1).astype("int64")
+    return [(int(a) * record_bytes, int(b) * record_bytes) for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def _records_aligned(
+    path: Union[str, Path],  # Path to a TAB file
+    record_bytes: int,  # Bytes per record, including the line terminator
+    ranges: list,  # (start, stop) byte offsets from `record_ranges`
+) -> bool:
+    "Whether the table really has fixed-length records, so that `ranges` start at record boundaries."
+    size = Path(path).stat().st_size
+    if size % record_bytes:
+        return False
+    # every range, and the file, must end with a line terminator
+    ends = [start for start, _ in ranges if start > 0] + ([size] if size else [])
+    with open(path, "rb") as f:
+        for end in ends:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                return False
+    return True
+
+
+def _parse_tab_range(args):
+    "Parse one byte range of a TAB file into a parquet fragment, returning its schema."
+    tabpath, colnames, start, stop, outpath, do_convert_times = args
+    with open(tabpath, "rb") as f:
+        f.seek(start)
+        data = f.read(stop - start)
+    df = pd.read_csv(io.BytesIO(data), header=None, names=colnames)
+    if do_convert_times:
+        df = convert_times(df, verbose=False)
+    table = pa.Table.from_pandas(df.convert_dtypes(), preserve_index=False)
+    pq.write_table(table, outpath)
+    return table.schema
+
+
+def _common_type(types):
+    "Arrow type that all fragments of one column can be cast to."
+    types = [t for t in types if not pa.types.is_null(t)]
+    if not types:
+        return pa.large_string()
+    if all(t == types[0] for t in types):
+        return types[0]
+    if all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in types):
+        return pa.float64()
+    if all(pa.types.is_timestamp(t) and t.tz == types[0].tz for t in types):
+        return pa.timestamp("ns", tz=types[0].tz)
+    return pa.large_string()
+
+
+def _pandas_dtype(t):
+    if pa.types.is_integer(t):
+        return "Int64"
+    if pa.types.is_floating(t):
+        return "Float64"
+    if pa.types.is_boolean(t):
+        return "boolean"
+    if pa.types.is_timestamp(t):
+        return pd.DatetimeTZDtype(t.unit, t.tz) if t.tz else f"datetime64[{t.unit}]"
+    return "string"
+
+
+def tab_to_parquet(
+    tabpath: Union[str, Path],  # Path to the index TAB file
+    label: IndexLabel,  # Label of the table
+    outpath: Union[str, Path],  # Path of the parquet file to write
+    max_workers: int = None,  # Number of processes, default from `process_map`. 1 to run in this process.
+    records_per_range: int = 200_000,  # Records parsed by one worker task
+    do_convert_times=True,  # Convert columns with "TIME" in name to datetime
+    row_group_size: int = 100_000,  # Rows per row group of the merged file
+) -> Path:
+    """Convert a TAB file to parquet, parsing record-aligned byte ranges in parallel.
+
+    Tables whose records don't have the label's fixed length are read with `index_to_df`
+    instead. Columns whose type differs between fragments (e.g. integers in one, floats or
+    empty values in another) are cast to a common type when merging.
+    """
+    tabpath, outpath = Path(tabpath), Path(outpath)
+    t0 = time.perf_counter()
+    n_records = tabpath.stat().st_size // label.record_bytes
+    ranges = record_ranges(tabpath, label.record_bytes, max(1, -(-n_records // records_per_range)))
+    if not _records_aligned(tabpath, label.record_bytes, ranges):
+        warnings.warn(f"{tabpath.name} doesn't have records of {label.record_bytes} bytes, reading it serially.")
+        df = index_to_df(tabpath, label, do_convert_times=do_convert_times)
+        table = pa.Table.from_pandas(df.convert_dtypes(), preserve_index=False)
+        tmppath = outpath.with_name(outpath.name + ".tmp")
+        pq.write_table(table, tmppath, row_group_size=row_group_size)
+        tmppath.replace(outpath)
+        return outpath
+    fragdir = outpath.with_name(outpath.name + ".fragments")
+    shutil.rmtree(fragdir, ignore_errors=True)
+    fragdir.mkdir(parents=True)
+    args = [
+        (tabpath, label.colnames, start, stop, fragdir / f"part-{i:05d}.parquet", do_convert_times)
+        for i, (start, stop) in enumerate(ranges)
+    ]
+    try:
+        if max_workers == 1 or len(args) < 2:
+            schemas = [_parse_tab_range(arg) for arg in args]
+        else:
+            schemas = process_map(
+                _parse_tab_range, args, max_workers=max_workers, desc="Parsing index", chunksize=1
+            )
+        fields = [
+            pa.field(name, _common_type([s.field(name).type for s in schemas])) for name in label.colnames
+        ]
+        empty = pd.DataFrame({f.name: pd.Series(dtype=_pandas_dtype(f.type)) for f in fields})
+        metadata = pa.Schema.from_pandas(empty, preserve_index=False).metadata
+        schema = pa.schema(fields, metadata=metadata)
+        tmppath = outpath.with_name(outpath.name + ".tmp")
+        with pq.ParquetWriter(tmppath, schema) as writer:
+            for arg in args:
+                table = pq.read_table(arg[4]).cast(schema)
+                writer.write_table(table, row_group_size=row_group_size)
+        tmppath.replace(outpath)
+    finally:
+        shutil.rmtree(fragdir, ignore_errors=True)
+    metrics.track_parse("tab_to_parquet", n_records, tabpath.stat().st_size, time.perf_counter() - t0)
+    return outpath
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 14
+def append_to_parquet(
+    path: Union[str, Path],  # Path to an existing parquet file
+    df: pd.DataFrame,  # New rows with the same columns as the stored ones
+):
+    """Append `df` as a new row group to an existing parquet file.
+
+    Parquet files can't be extended in place, so the existing row groups are copied
+    one at a time into a new file that then replaces the old one.
+    That way, the existing data is neither parsed again nor completely held in memory.
+    A stored integer index is continued after the existing rows.
+    """
+    path = Path(path)
+    pf = pq.ParquetFile(path)
+    schema = pf.schema_arrow
+    n_rows = pf.metadata.num_rows
+    new_index = pa.array(range(n_rows, n_rows + len(df)), type=pa.int64())
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for name in (schema.pandas_metadata or {}).get("index_columns", []):
+        if isinstance(name, str):  # index stored as column, range indexes are only metadata
+            table = table.append_column(name, new_index.cast(schema.field(name).type))
+    table = table.select(schema.names).cast(schema)
+    tmppath = path.with_name(path.name + ".tmp")
+    with pq.ParquetWriter(tmppath, schema) as writer:
+        for i in range(pf.num_row_groups):
+            writer.write_table(pf.read_row_group(i))
+        writer.write_table(table)
+    tmppath.replace(path)
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 15
+class Partitioning:
+    """Hive partitioning of an index table by one column.
+
+    The partition column is either an existing column, like VOLUME_ID, or derived from a
+    `source` column with a monotonic `func`, like the year of START_TIME.
+    Filters on the source column are translated into filters on the partition column,
+    so that they skip whole partitions as well.
+    """
+
+    def __init__(
+        self,
+        column: str,  # Name of the partition column
+        source: str = None,  # Column the partition column is derived from
+        func=None,  # Monotonic function mapping a Series of `source` values to partition keys
+        dtype: pa.DataType = pa.string(),  # Arrow type of the partition keys
+    ):
+        self.column = column
+        self.source = source
+        self.func = func
+        self.dtype = dtype
+
+    @property
+    def hive(self):
+        return ds.partitioning(pa.schema([(self.column, self.dtype)]), flavor="hive")
+
+    def available(
+        self,
+        columns: list,  # Column names of a table
+    ) -> bool:
+        "Whether the partition column is one of `columns` or can be derived from them."
+        return (self.column if self.func is None else self.source) in columns
+
+    def add_column(self, df):
+        "Add the derived partition column to `df`, if needed."
+        if self.func is None:
+            return df
+        if self.source not in df.columns:
+            raise ValueError(f"Partitioning by {self.column} needs the column {self.source}.")
+        return df.assign(**{self.column: self.func(df[self.source])})
+
+    def keys(self, values):
+        return self.func(pd.Series(values)).tolist()
+
+    def prune(
+        self,
+        filters: list,  # List of (column, op, value) tuples, combined with AND
+    ) -> list:  # Additional filters on the partition column
+        "Translate filters on the source column into filters on the partition column."
+        if self.func is None:
+            return []
+        ops = {">": ">=", ">=": ">=", "<": "<=", "<=": "<=", "==": "==", "=": "=="}
+        pruning = []
+        for column, op, value in filters:
+            if column != self.source:
+                continue
+            if op == "in":
+                pruning.append((self.column, "in", sorted(set(self.keys(value)))))
+            elif op in ops:
+                pruning.append((self.column, ops[op], self.keys([value])[0]))
+        return pruning
+
+    def __repr__(self):
+        s = f"Partitioning({self.column!r}"
+        return s + (f" from {self.source!r})" if self.source else ")")
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 16
+def write_dataset(
+    df: pd.DataFrame,  # Index data
+    path: Union[str, Path],  # Folder of the dataset
+    partitioning: Partitioning,
+    append: bool = False,  # Add new files to an existing dataset instead of replacing it
+):
+    """Store `df` as a hive-partitioned parquet dataset, one folder per partition key.
+
+    Appending only adds new files to the affected partitions.
+    """
+    path = Path(path)
+    if path.exists() and not append:
+        shutil.rmtree(path)
+    table = pa.Table.from_pandas(partitioning.add_column(df), preserve_index=False)
+    _write_partitions(table, path, partitioning)
+
+
+def _write_partitions(data, path, partitioning, schema=None):
+    ds.write_dataset(
+        data,
+        path,
+        schema=schema,
+        format="parquet",
+        partitioning=partitioning.hive,
+        # unique file names per write, so that appends never overwrite existing files
+        basename_template=f"part-{datetime.now():%Y%m%dT%H%M%S%f}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_partitions=100_000,
+    )
+
+
+def parquet_to_dataset(
+    source: Union[str, Path],  # Parquet file, e.g. written by `tab_to_parquet`
+    path: Union[str, Path],  # Folder of the dataset
+    partitioning: Partitioning,
+    batch_size: int = 100_000,  # Rows held in memory at a time
+):
+    """Store a parquet file as hive-partitioned dataset, one record batch at a time.
+
+    Unlike `write_dataset`, the table is never completely loaded, so this works for the
+    big indexes as well.
+    """
+    path = Path(path)
+    if path.exists():
+        shutil.rmtree(path)
+    pf = pq.ParquetFile(source)
+    schema = pf.schema_arrow
+    if partitioning.func is not None:
+        schema = schema.append(pa.field(partitioning.column, partitioning.dtype))
+
+    def batches():
+        for batch in pf.iter_batches(batch_size):
+            columns = batch.columns
+            if partitioning.func is not None:
+                keys = partitioning.keys(batch.column(partitioning.source).to_pandas())
+                columns = columns + [pa.array(keys, type=partitioning.dtype, from_pandas=True)]
+            yield pa.RecordBatch.from_arrays(columns, schema=schema)
+
+    _write_partitions(batches(), path, partitioning, schema)
+
+
+def read_dataset(
+    path: Union[str, Path],  # Folder of the dataset
+    partitioning: Partitioning,
+    filters: list = None,  # List of (column, op, value) tuples, combined with AND
+    columns: list = None,  # Columns to read. Default: all
+) -> pd.DataFrame:
+    """Read a partitioned index dataset, only touching the partitions that can match `filters`.
+
+    Rows are returned ordered by partition.
+    """
+    filters = list(filters or [])
+    filters += partitioning.prune(filters)
+    dataset = ds.dataset(path, format="parquet", partitioning=partitioning.hive)
+    expression = pq.filters_to_expression(filters) if filters else None
+    df = dataset.to_table(columns=columns, filter=expression).to_pandas()
+    # partition columns end up last, restore the original order
+    order = [col["name"] for col in (dataset.schema.pandas_metadata or {}).get("columns", [])]
+    return df[[col for col in order if col in df.columns] + [col for col in df.columns if col not in order]]
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 19
+class TimeIndex:
+    """Sorted times of one column of an index table.
+
+    Time ranges are found by binary search, returning the row positions in time order.
+    Rows without a valid time are left out.
+    """
+
+    def __init__(
+        self,
+        times: pd.Series,  # Times of all rows, in table order
+    ):
+        times = pd.to_datetime(pd.Series(times)).to_numpy(dtype="datetime64[ns]")
+        rows = np.flatnonzero(~np.isnat(times))
+        order = np.argsort(times[rows], kind="stable")
+        self.times = times[rows][order]
+        self.rows = rows[order]
+        self.metadata = {}
+
+    def query(
+        self,
+        t0,  # Start time, anything `pd.Timestamp` understands
+        t1,  # End time, included
+    ) -> np.ndarray:  # Row positions, sorted by time
+        start = np.searchsorted(self.times, pd.Timestamp(t0).to_datetime64(), side="left")
+        stop = np.searchsorted(self.times, pd.Timestamp(t1).to_datetime64(), side="right")
+        return self.rows[start:stop]
+
+    def save(self, path, **metadata):
+        np.savez(path, times=self.times.view("int64"), rows=self.rows, **metadata)
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path, allow_pickle=False)
+        self = cls.__new__(cls)
+        self.times = data["times"].view("datetime64[ns]")
+        self.rows = data["rows"]
+        self.metadata = {k: data[k] for k in data.files if k not in ["times", "rows"]}
+        return self
+
+    def __len__(self):
+        return len(self.times)
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 20
+def read_parquet_rows(
+    path: Union[str, Path],  # Path to a parquet file
+    rows: np.ndarray,  # Row positions to read, in the order they should be returned
+    columns: list = None,  # Columns to read. Default: all
+) -> pd.DataFrame:
+    """Read rows by position, only touching the row groups that hold them.
+
+    Like `TabReader.take`, the row positions become the index of the result.
+    """
+    pf = pq.ParquetFile(path)
+    if not len(rows):
+        df = pf.schema_arrow.empty_table().select(columns or pf.schema_arrow.names).to_pandas()
+        df.index = pd.Index([], dtype="int64")
+        return df
+    sizes = [pf.metadata.row_group(i).num_rows for i in range(pf.num_row_groups)]
+    starts = np.cumsum([0] + sizes)
+    rows = np.asarray(rows, dtype="int64")
+    groups_of_rows = np.searchsorted(starts, rows, side="right") - 1
+    groups = np.unique(groups_of_rows)
+    # position of each needed row group in the table of only the needed row groups
+    offsets = np.zeros(len(sizes), dtype="int64")
+    offsets[groups] = np.cumsum([0] + [sizes[g] for g in groups[:-1]])
+    table = pf.read_row_groups(groups, columns=columns)
+    df = table.take(offsets[groups_of_rows] + rows - starts[groups_of_rows]).to_pandas()
+    df.index = rows
+    return df
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 24
+def parquet_to_arrow(
+    source: Union[str, Path],  # Parquet file or partitioned dataset folder
+    arrow_path: Union[str, Path],  # Path of the Arrow IPC file to write
+    partitioning: "Partitioning" = None,  # Partitioning of a dataset folder
+) -> Path:
+    "Write an uncompressed Arrow IPC copy of parquet data, one record batch at a time."
+    arrow_path = Path(arrow_path)
+    dataset = ds.dataset(
+        source, format="parquet", partitioning=partitioning.hive if partitioning else None
+    )
+    tmppath = arrow_path.with_name(arrow_path.name + ".tmp")
+    with pa.OSFile(str(tmppath), "wb") as sink:
+        with pa.ipc.new_file(sink, dataset.schema) as writer:
+            for batch in dataset.to_batches():
+                writer.write_batch(batch)
+    tmppath.replace(arrow_path)
+    return arrow_path
+
+
+def read_arrow_file(
+    path: Union[str, Path],  # Arrow IPC file
+    filters: list = None,  # List of (column, op, value) tuples, combined with AND
+    columns: list = None,  # Columns to read. Default: all
+) -> pd.DataFrame:
+    """Memory-map an Arrow IPC file into a DataFrame.
+
+    Columns are backed by the mapped Arrow buffers (`pd.ArrowDtype`), so nothing is copied
+    unless `filters` select a subset of the rows. The values are the same as from the parquet
+    data, but the dtypes differ, e.g. `int64[pyarrow]` instead of `Int64` or
+    `timestamp[ns][pyarrow]` instead of `datetime64[ns]`; `astype` converts (and copies) them.
+    """
+    table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+    if filters:
+        table = table.filter(pq.filters_to_expression(filters))
+    if columns is not None:
+        table = table.select(columns)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 25
+class SharedIndex:
+    """Handle to a DataFrame published as memory-mapped Arrow IPC file.
+
+    The handle only holds the path, so it pickles to worker processes for free.
+    Workers `attach` to the file instead of loading their own copy of the data,
+    and all processes on the host share its pages through the OS page cache.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    @classmethod
+    def publish(
+        cls,
+        df: pd.DataFrame,  # Data to share
+        path: Union[str, Path],  # Arrow IPC file to write
+    ) -> "SharedIndex":
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(df)
+        tmppath = path.with_name(path.name + f".{os.getpid()}.tmp")
+        with pa.OSFile(str(tmppath), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        tmppath.replace(path)
+        return cls(path)
+
+    def attach(self) -> pd.DataFrame:
+        "Memory-map the shared data, see `read_arrow_file`."
+        return read_arrow_file(self.path)
+
+    def __repr__(self):
+        return f"SharedIndex({str(self.path)!r})"
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 26
 class PVLColumn:
     "Manages just one of the columns in a table that is described via PVL."
 
@@ -201,20 +732,155 @@ class PVLColumn:
     def __repr__(self):
         return self.pvlobj.__repr__()
 
-# %% ../../notebooks/api/02f_pds.utils.ipynb 8
+# %% ../../notebooks/api/02f_pds.utils.ipynb 27
 def decode_line(
     linedata: str,  # One line of a .tab data file
     labelpath: Union[
-        str, Path
-    ],  # Path to the appropriate label that describes the data.
+        str, Path, IndexLabel
+    ],  # Path to the appropriate label that describes the data, or the label itself.
 ):
     "Decode one line of tabbed data with the appropriate label file."
-    label = IndexLabel(labelpath)
-    for column in label.pvl_columns:
-        pvlcol = PVLColumn(column)
-        print(pvlcol.name, pvlcol.decode(linedata))
+    label = labelpath if isinstance(labelpath, IndexLabel) else IndexLabel(labelpath)
+    for column in label.schema["columns"]:
+        values = [linedata[start:stop] for start, stop in column["colspecs"]]
+        print(column["name"], values[0] if column["items"] is None else values)
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 29
+class TabReader:
+    "Random access to the rows of a fixed-length PDS TAB file."
+
+    def __init__(
+        self,
+        label: Union[str, Path, IndexLabel],  # Label of the table, or path to it
+        tabpath: Union[str, Path] = None,  # Path to the table. Default: `label.index_path`
+    ):
+        self.label = label if isinstance(label, IndexLabel) else IndexLabel(label)
+        self.path = Path(tabpath) if tabpath is not None else self.label.index_path
+        self.record_bytes = self.label.record_bytes
+        self.columns = self.label.schema["columns"]
+        with open(self.path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        # from the file size, as incremental downloads append rows the label doesn't know of
+        return len(self.mm) // self.record_bytes
+
+    def record(self, n: int) -> bytes:
+        if n < 0:
+            n += len(self)
+        if not 0 <= n < len(self):
+            raise IndexError(f"Row {n} out of range for table with {len(self)} rows.")
+        return self.mm[n * self.record_bytes : (n + 1) * self.record_bytes]
+
+    @staticmethod
+    def _convert(value: bytes, data_type: str):
+        value = value.decode("ascii", errors="replace").strip().strip('"').strip()
+        if not value:
+            return None
+        try:
+            if data_type == "ASCII_INTEGER":
+                return int(value)
+            if data_type == "ASCII_REAL":
+                return float(value)
+        except ValueError:
+            pass
+        return value
+
+    def decode(self, record: bytes) -> dict:
+        "Decode one record into a dict of column name -> value."
+        result = {}
+        for col in self.columns:
+            values = [self._convert(record[start:stop], col["data_type"]) for start, stop in col["colspecs"]]
+            result.update(zip(col["names"], values))
+        return result
+
+    def row(self, n: int) -> pd.Series:
+        "Row number `n`, 0-based."
+        return pd.Series(self.decode(self.record(n)), name=n)
+
+    def rows(
+        self,
+        start: int,  # first row, 0-based
+        stop: int,  # row after the last, like `range`
+    ) -> pd.DataFrame:
+        return self.take(range(*slice(start, stop).indices(len(self))))
+
+    def take(
+        self,
+        rows,  # Row numbers, in the order they should be returned
+    ) -> pd.DataFrame:
+        rows = list(rows)
+        return pd.DataFrame(
+            [self.decode(self.record(n)) for n in rows], index=rows, columns=self.label.colnames
+        )
+
+    def column_bytes(self, name: str) -> np.ndarray:
+        "Raw bytes of one column for all rows, read column-wise from the memory map."
+        col = next(c for c in self.columns if c["name"] == name)
+        start, stop = col["colspecs"][0]
+        records = np.frombuffer(self.mm, dtype="u1", count=len(self) * self.record_bytes)
+        values = records.reshape(-1, self.record_bytes)[:, start:stop]
+        # always a copy, a view would keep the memory map from closing
+        return values.copy().view(f"S{stop - start}").ravel()
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.take(range(*key.indices(len(self))))
+        return self.row(key)
+
+    def close(self):
+        self.mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 30
+class KeyIndex:
+    """Sorted values of a key column (e.g. PRODUCT_ID) of a TAB file, for binary search.
+
+    Keys are compared stripped of padding and quotes.
+    """
+
+    def __init__(
+        self,
+        keys: np.ndarray,  # Byte string keys of all rows, in table order
+    ):
+        # like `TabReader._convert`: padding around and inside the quotes
+        keys = np.char.strip(np.char.strip(np.char.strip(np.asarray(keys, dtype="S")), b'"'))
+        self.rows = np.argsort(keys, kind="stable")
+        self.keys = keys[self.rows]
+        self.metadata = {}
 
-# %% ../../notebooks/api/02f_pds.utils.ipynb 9
+    def query(
+        self,
+        key: str,  # Value to look up
+    ) -> np.ndarray:  # Row positions with this key, in table order
+        key = key.encode() if isinstance(key, str) else key
+        # normalized like the stored keys, so that padded or quoted values from a table match
+        key = key.strip().strip(b'"').strip()
+        start = np.searchsorted(self.keys, key, side="left")
+        stop = np.searchsorted(self.keys, key, side="right")
+        return self.rows[start:stop]
+
+    def save(self, path, **metadata):
+        np.savez(path, keys=self.keys, rows=self.rows, **metadata)
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path, allow_pickle=False)
+        self = cls.__new__(cls)
+        self.keys = data["keys"]
+        self.rows = data["rows"]
+        self.metadata = {k: data[k] for k in data.files if k not in ["keys", "rows"]}
+        return self
+
+    def __len__(self):
+        return len(self.keys)
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 33
 def find_mixed_type_cols(
     # Dataframe to be searched for mixed data-types
     df: pd.DataFrame,
@@ -237,7 +903,7 @@ def find_mixed_type_cols(
             df[col].fillna("UNKNOWN", inplace=True)
     return result
 
-# %% ../../notebooks/api/02f_pds.utils.ipynb 10
+# %% ../../notebooks/api/02f_pds.utils.ipynb 34
 def fix_hirise_edrcumindex(
     infname: Union[str, Path],  # Path to broken EDRCUMINDEX.TAB
     outfname: Union[str, Path],  # Path where to store the fixed TAB file
@@ -2,26 +2,33 @@
 
 # %% auto 0
 __all__ = ['logger', 'nasa_date_format', 'nasa_dt_format', 'nasa_dt_format_with_ms', 'iso_date_format', 'iso_dt_format',
-           'iso_dt_format_with_ms', 'nasa_time_to_datetime', 'nasa_time_to_iso', 'iso_to_nasa_time',
-           'iso_to_nasa_datetime', 'replace_all_nasa_times', 'parse_http_date', 'get_remote_timestamp',
-           'check_url_exists', 'url_retrieve', 'have_internet', 'height_from_shadow', 'get_gdal_center_coords',
-           'file_variations', 'catch_isis_error']
+           'iso_dt_format_with_ms', 'nasa_time_regex', 'nasa_time_to_datetime', 'nasa_time_to_iso', 'iso_to_nasa_time',
+           'iso_to_nasa_datetime', 'is_nasa_time', 'parse_nasa_times', 'replace_all_nasa_times', 'parse_http_date',
+           'format_http_date', 'get_remote_timestamp', 'check_url_exists', 'url_retrieve', 'have_internet',
+           'height_from_shadow', 'get_gdal_center_coords', 'file_variations', 'catch_isis_error']
 
 # %% ../notebooks/api/01_utils.ipynb 3
 import datetime as dt
 import email.utils as eut
 import http.client as httplib
 import logging
+import re
+from functools import wraps
 from math import radians, tan
 from pathlib import Path
 from typing import Tuple, Union
 from urllib.request import urlopen
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import requests
 from requests.auth import HTTPBasicAuth
 from tqdm.auto import tqdm
 
+from . import metrics
+
 try:
     from osgeo import gdal
 except ImportError:
@@ -138,6 +145,57 @@ def iso_to_nasa_datetime(
     return date.strftime(target_format)
 
 # %% ../notebooks/api/01_utils.ipynb 28
+nasa_time_regex = r"^\d{4}-\d{3}(T\d{2}:\d{2}(:\d{2}(\.\d*)?)?)?Z?$"
+
+
+def is_nasa_time(
+    value,  # Value to check, e.g. the first value of a column
+) -> bool:
+    "Check if `value` is a NASA time string of the form YYYY-jjj[THH:MM[:SS[.fff]]]."
+    return isinstance(value, str) and re.match(nasa_time_regex, value.strip()) is not None
+
+
+def _int_field(times, start, stop):
+    part = pc.utf8_slice_codeunits(times, start, stop)
+    part = pc.if_else(pc.equal(pc.utf8_length(part), 0), "0", part)
+    return pc.cast(part, pa.int64()).to_numpy()
+
+
+def parse_nasa_times(
+    times,  # NASA time strings, as pd.Series, np.ndarray, list or pa.Array
+):  # datetime64[ns] values, as pd.Series if `times` is one
+    """Vectorized conversion of YYYY-jjj[THH:MM[:SS[.fff]]] strings to datetimes.
+
+    Missing and invalid values become NaT.
+    """
+    series = times if isinstance(times, pd.Series) else None
+    if isinstance(times, pa.ChunkedArray):
+        times = times.combine_chunks()
+    elif not isinstance(times, pa.Array):
+        times = pa.array(np.asarray(times, dtype=object), type=pa.string(), from_pandas=True)
+    times = pc.utf8_rtrim(pc.utf8_trim_whitespace(times), "Z")
+    valid = pc.fill_null(pc.match_substring_regex(times, nasa_time_regex), False).to_numpy(
+        zero_copy_only=False
+    )
+    times = pc.if_else(valid, times, "1970-001")
+    years = _int_field(times, 0, 4)
+    doys = _int_field(times, 5, 8)
+    hours = _int_field(times, 9, 11)
+    minutes = _int_field(times, 12, 14)
+    seconds = _int_field(times, 15, 17)
+    fraction = pc.utf8_rpad(pc.utf8_slice_codeunits(times, 18, 27), width=9, padding="0")
+    nanoseconds = pc.cast(fraction, pa.int64()).to_numpy()
+    leap = ((years % 4 == 0) & (years % 100 != 0)) | (years % 400 == 0)
+    valid &= (doys >= 1) & (doys <= 365 + leap) & (hours < 24) & (minutes < 60) & (seconds <= 60)
+    days = (years - 1970).astype("datetime64[Y]").astype("datetime64[D]") + (doys - 1)
+    offsets = ((hours * 60 + minutes) * 60 + seconds) * 10**9 + nanoseconds
+    result = days.astype("datetime64[ns]") + offsets.astype("timedelta64[ns]")
+    result[~valid] = np.datetime64("NaT")
+    if series is not None:
+        return pd.Series(result, index=series.index, name=series.name)
+    return result
+
+# %% ../notebooks/api/01_utils.ipynb 33
 def replace_all_nasa_times(
     df: pd.DataFrame,  # DataFrame with NASA time columns
 ):
@@ -148,10 +206,11 @@ def replace_all_nasa_times(
     This will be done for all columns with the word TIME in the column name.
     """
     for col in [col for col in df.columns if "TIME" in col]:
-        if "T" in df[col].iloc[0]:
-            df[col] = pd.to_datetime(df[col].map(nasa_time_to_iso))
+        values = df[col].dropna()
+        if len(values) and is_nasa_time(values.iloc[0]) and "T" in values.iloc[0]:
+            df[col] = parse_nasa_times(df[col])
 
-# %% ../notebooks/api/01_utils.ipynb 30
+# %% ../notebooks/api/01_utils.ipynb 35
 def parse_http_date(
     text: str,  # datestring from urllib.request
 ) -> dt.datetime:  # dt.datetime object from given datetime string
@@ -159,6 +218,15 @@ def parse_http_date(
     return dt.datetime(*eut.parsedate(text)[:6])
 
 
+def format_http_date(
+    time: dt.datetime,  # naive datetimes are taken as UTC, like the ones from `parse_http_date`
+) -> str:  # datestring as used in HTTP headers, e.g. for `If-Modified-Since`
+    "Format datetime for HTTP headers."
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=dt.timezone.utc)
+    return eut.format_datetime(time.astimezone(dt.timezone.utc), usegmt=True)
+
+
 def get_remote_timestamp(
     url: str,  # URL to check timestamp for
 ) -> dt.datetime:
@@ -199,7 +267,7 @@ def url_retrieve(
         auth = HTTPBasicAuth(user, passwd)
     else:
         auth = None
-    R = requests.get(url, stream=True, allow_redirects=True, auth=auth)
+    R = metrics.track_response(requests.get(url, stream=True, allow_redirects=True, auth=auth))
     if R.status_code != 200:
         raise ConnectionError(f"Could not download {url}\nError code: {R.status_code}")
     with tqdm.wrapattr(
@@ -209,8 +277,11 @@ def url_retrieve(
         total=int(R.headers.get("content-length", 0)),
         desc=str(Path(outfile).name),
     ) as fd:
+        nbytes = 0
         for chunk in R.iter_content(chunk_size=chunk_size):
             fd.write(chunk)
+            nbytes += len(chunk)
+    metrics.track_bytes(url, nbytes)
 
 
 def have_internet():
@@ -227,7 +298,7 @@ def have_internet():
         conn.close()
         return False
 
-# %% ../notebooks/api/01_utils.ipynb 33
+# %% ../notebooks/api/01_utils.ipynb 39
 def height_from_shadow(
     shadow_in_pixels: float,  # Measured length of shadow in pixels
     sun_elev: float,  # Ange of sun over horizon in degrees
@@ -269,10 +340,15 @@ def file_variations(
     """
     return [Path(filename).with_suffix(extension) for extension in extensions]
 
-# %% ../notebooks/api/01_utils.ipynb 39
+# %% ../notebooks/api/01_utils.ipynb 45
 def catch_isis_error(func):
-    """can be used as decorator for any ISIS function"""
+    """can be used as decorator for any ISIS function
+
+    The ISIS error is printed and returned instead of raised, so that callers can still
+    look at its exit status and stderr, e.g. for the CTX calibration telemetry.
+    """
 
+    @wraps(func)
     def inner(*args, **kwargs):
         try:
             return func(*args, **kwargs)
@@ -281,5 +357,6 @@ def catch_isis_error(func):
             print(" ".join(err.cmd))
             print(err.stdout)
             print(err.stderr)
+            return err
 
     return inner
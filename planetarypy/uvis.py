@@ -1,12 +1,20 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/api/05_cassini_uvis.ipynb.
 
 # %% auto 0
-__all__ = ['storage_root', 'DataManager', 'get_data_path', 'get_label_path', 'get_user_guide']
+__all__ = ['storage_root', 'raw_url', 'cache', 'pds3_types', 'index_lookup', 'index_urls', 'DataManager', 'pds3_dtype',
+           'UVISLabel', 'open_raw', 'open_calibration', 'open_calibrated', 'get_data_path', 'get_label_path',
+           'get_user_guide']
 
 # %% ../notebooks/api/05_cassini_uvis.ipynb 3
+import dask.array as da
+import numpy as np
+import pvl
 import tomlkit
+import xarray as xr
+from fastcore.utils import Path, patch
 from yarl import URL
 
+from . import metrics
 from .config import config
 from .pds.opusapi import OPUS
 from .pds.apps import get_index
@@ -14,9 +22,44 @@ from .utils import url_retrieve
 
 # %% ../notebooks/api/05_cassini_uvis.ipynb 4
 storage_root = config.storage_root / "missions/cassini/uvis"
+raw_url = URL("https://opus.pds-rings.seti.org/holdings/volumes/COUVIS_0xxx")
+
+cache = {}
 storage_root
 
-# %% ../notebooks/api/05_cassini_uvis.ipynb 6
+# %% ../notebooks/api/05_cassini_uvis.ipynb 7
+def index_lookup():
+    "Map product file names (without extension) to rows of the UVIS index."
+    metrics.cache_access("uvis.lookup", "lookup" in cache)
+    if "lookup" not in cache:
+        # only download if missing, checking for updates needs web requests
+        cache["index"] = get_index("cassini.uvis", "index", refresh=False)
+        fnames = cache["index"].FILE_SPECIFICATION_NAME.str.strip()
+        stems = fnames.str.extract(r"([^/]+)\.\w+$", expand=False)
+        cache["lookup"] = dict(zip(stems, cache["index"].index))
+    return cache["lookup"]
+
+
+def index_urls(
+    pds_id: str,  # UVIS PDS product id, e.g. EUV2002_198_03_26
+) -> dict:
+    "Data and calibration URLs for `pds_id`, in the layout of an OPUS files response."
+    lookup = index_lookup()
+    try:
+        row = cache["index"].loc[lookup[pds_id]]
+    except KeyError:
+        raise FileNotFoundError(f"{pds_id} not found in the UVIS index.")
+    spec = Path(row.FILE_SPECIFICATION_NAME.strip())
+    volume = raw_url / row.VOLUME_ID.strip()
+    data = volume / spec.with_suffix(".DAT").as_posix()
+    # calibration matrices live in a parallel CALIB/VERSION_3 tree of the volume
+    calib = volume / "CALIB/VERSION_3" / spec.parent.name / f"{spec.stem}_CAL_3.DAT"
+    return {
+        "couvis_raw": [str(data), str(data.with_suffix(".LBL"))],
+        "couvis_calib_corr": [str(calib), str(calib.with_suffix(".LBL"))],
+    }
+
+# %% ../notebooks/api/05_cassini_uvis.ipynb 8
 class DataManager:
 
     def __init__(
@@ -29,6 +72,16 @@ class DataManager:
         if not self.raw_data_path.exists() and not skip_download:
             self.download()
 
+    def resolve(self):
+        "Find the product URLs: from a previous download, the local index or, as last resort, OPUS."
+        if self.results_file.exists():
+            self.dict = tomlkit.loads(self.results_file.read_text())
+            return
+        try:
+            self.dict = index_urls(self.pds_id)
+        except FileNotFoundError:
+            self.query()
+
     def query(self, pds_id=None):
         pds_id = pds_id if pds_id is not None else self.pds_id
         opus = OPUS(silent=True)
@@ -51,13 +104,13 @@ class DataManager:
     @property
     def raw_data_url(self):
         if not self.dict:
-            self.query()
+            self.resolve()
         return URL(self.dict["couvis_raw"][0])
 
     @property
     def raw_label_url(self):
         if not self.dict:
-            self.query()
+            self.resolve()
         return URL(self.dict["couvis_raw"][1])
 
     @property
@@ -88,7 +141,7 @@ class DataManager:
         if self.raw_data_path.exists() and not overwrite:
             print("Local files exists. Use `overwrite=True` to download fresh.")
             return
-        self.query()
+        self.resolve()
         self.original_pid_file.mk_write(self.pid)
         self.results_file.mk_write(tomlkit.dumps(self.dict))
         self.raw_data_path.parent.mkdir(parents=True, exist_ok=True)
@@ -97,12 +150,173 @@ class DataManager:
                 url_retrieve(url, self.folder / URL(url).name)
 
     def __repr__(self):
-        s = f"Product ID:\n{self.id}\n\n"
-        for k, v in self.query_result[1].items():
+        s = f"Product ID:\n{self.pid}\n\n"
+        for k, v in (self.dict or {}).items():
             s += f"Key: {k},\nValue(s):\n{v}\n\n"
         return s
 
-# %% ../notebooks/api/05_cassini_uvis.ipynb 20
+# %% ../notebooks/api/05_cassini_uvis.ipynb 23
+# PDS3 item types -> numpy byte order and kind
+pds3_types = {
+    "MSB_UNSIGNED_INTEGER": ">u",
+    "UNSIGNED_INTEGER": ">u",
+    "SUN_UNSIGNED_INTEGER": ">u",
+    "LSB_UNSIGNED_INTEGER": "<u",
+    "PC_UNSIGNED_INTEGER": "<u",
+    "VAX_UNSIGNED_INTEGER": "<u",
+    "MSB_INTEGER": ">i",
+    "INTEGER": ">i",
+    "SUN_INTEGER": ">i",
+    "LSB_INTEGER": "<i",
+    "PC_INTEGER": "<i",
+    "VAX_INTEGER": "<i",
+    "IEEE_REAL": ">f",
+    "REAL": ">f",
+    "FLOAT": ">f",
+    "SUN_REAL": ">f",
+    "PC_REAL": "<f",
+}
+
+
+def pds3_dtype(
+    item_type: str,  # PDS3 data type, e.g. MSB_UNSIGNED_INTEGER
+    item_bytes: int,  # number of bytes per item
+) -> np.dtype:
+    "Translate a PDS3 data type into a numpy dtype."
+    try:
+        return np.dtype(f"{pds3_types[item_type.upper()]}{item_bytes}")
+    except KeyError:
+        raise NotImplementedError(f"PDS3 data type {item_type} not supported.")
+
+
+def _as_list(value):
+    "PVL gives single values of sequence keywords as scalars."
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+class UVISLabel:
+    "Binary layout of a UVIS data file as described by its PDS3 label."
+
+    def __init__(
+        self,
+        labelpath: Path,  # path to a raw (QUBE) or calibration (ARRAY) label
+    ):
+        self.path = Path(labelpath)
+        self.pvl_lbl = pvl.load(str(self.path))
+        self.pointer, self.object_name = next(
+            (k, k[1:]) for k, _ in self.pvl_lbl.items() if k.startswith("^")
+        )
+
+    @property
+    def obj(self):
+        return self.pvl_lbl[self.object_name]
+
+    @property
+    def data_path(self):
+        "Data file named by the label pointer, expected next to the label."
+        value = self.pvl_lbl[self.pointer]
+        fname = value[0] if isinstance(value, (list, tuple)) else value
+        if not isinstance(fname, str):  # pointer into the label file itself
+            return self.path
+        return self.path.parent / fname
+
+    @property
+    def offset(self):
+        "Byte offset of the object in the data file."
+        value = self.pvl_lbl[self.pointer]
+        if isinstance(value, (list, tuple)) and not hasattr(value, "units"):
+            value = value[1] if len(value) > 1 else 1
+        elif isinstance(value, str):
+            return 0
+        if getattr(value, "units", "").upper() == "BYTES":
+            return int(value.value) - 1
+        return (int(value) - 1) * self.pvl_lbl["RECORD_BYTES"]
+
+    @property
+    def dtype(self):
+        if "CORE_ITEM_TYPE" in self.obj:  # QUBE
+            return pds3_dtype(self.obj["CORE_ITEM_TYPE"], self.obj["CORE_ITEM_BYTES"])
+        element = self.obj["ELEMENT"]  # ARRAY
+        return pds3_dtype(element["DATA_TYPE"], element["BYTES"])
+
+    @property
+    def axis_names(self):
+        "Axis names in label order, i.e. fastest varying first."
+        names = self.obj.get("AXIS_NAME")
+        return [n.lower() for n in _as_list(names)] if names else None
+
+    @property
+    def axis_items(self):
+        return _as_list(self.obj.get("CORE_ITEMS") or self.obj["AXIS_ITEMS"])
+
+    @property
+    def shape(self):
+        "numpy (C-order) shape, the reverse of the PDS3 axis order."
+        return tuple(reversed(self.axis_items))
+
+    @property
+    def dims(self):
+        return tuple(reversed(self.axis_names)) if self.axis_names else None
+
+    def memmap(self):
+        "Memory-map the object without reading it."
+        return np.memmap(
+            self.data_path, dtype=self.dtype, mode="r", offset=self.offset, shape=self.shape
+        )
+
+# %% ../notebooks/api/05_cassini_uvis.ipynb 26
+def open_raw(
+    labelpath: Path,  # path to the raw data label
+) -> xr.DataArray:
+    "Zero-copy view of a UVIS raw data cube."
+    label = UVISLabel(labelpath)
+    attrs = {k: label.pvl_lbl[k] for k in ["PRODUCT_ID", "INTEGRATION_DURATION"] if k in label.pvl_lbl}
+    return xr.DataArray(label.memmap(), dims=label.dims, attrs=attrs, name="counts")
+
+
+def open_calibration(
+    labelpath: Path,  # path to the calibration matrix label
+    dims: tuple = ("line", "band"),  # dimension names, if not given in the label
+) -> xr.DataArray:
+    "Zero-copy view of a UVIS calibration matrix."
+    label = UVISLabel(labelpath)
+    dims = label.dims or dims[-len(label.shape):]
+    return xr.DataArray(label.memmap(), dims=dims, name="calibration")
+
+
+def open_calibrated(
+    labelpath: Path,  # path to the raw data label
+    calib_labelpath: Path,  # path to the calibration matrix label
+    chunks="auto",  # dask chunks for the lazy calibration
+) -> xr.DataArray:
+    "Lazily calibrated UVIS cube in kR/Å, computed only when accessed."
+    raw = open_raw(labelpath)
+    cal = open_calibration(calib_labelpath, dims=raw.dims)
+    if set(cal.dims) - set(raw.dims):
+        raise ValueError(f"Calibration dimensions {cal.dims} don't match data dimensions {raw.dims}.")
+    counts = raw.copy(data=da.from_array(raw.data, chunks=chunks))
+    cal = cal.copy(data=da.from_array(cal.data, chunks=chunks))
+    duration = raw.attrs.get("INTEGRATION_DURATION")
+    if duration is not None:
+        counts = counts / float(getattr(duration, "value", duration))
+    calibrated = counts * cal
+    calibrated.name = "calibrated"
+    calibrated.attrs = dict(raw.attrs, units="kR/Å")
+    return calibrated
+
+# %% ../notebooks/api/05_cassini_uvis.ipynb 29
+@patch(as_prop=True)
+def raw(self: DataManager):
+    "Memory-mapped raw counts."
+    return open_raw(self.raw_label_path)
+
+
+@patch(as_prop=True)
+def calibrated(self: DataManager):
+    "Lazily calibrated data; call `.compute()` or `.values` to evaluate."
+    return open_calibrated(self.raw_label_path, self.calib_label_path)
+
+# %% ../notebooks/api/05_cassini_uvis.ipynb 32
 def get_data_path(pid, skip_download=False):
     dm = DataManager(pid, skip_download=skip_download)
     return dm.raw_data_path if dm.raw_data_path.exists() else None
@@ -112,7 +326,7 @@ def get_label_path(pid):
     dm = DataManager(pid)
     return dm.raw_label_path
 
-# %% ../notebooks/api/05_cassini_uvis.ipynb 23
+# %% ../notebooks/api/05_cassini_uvis.ipynb 35
 def get_user_guide():
     url = URL("https://pds-rings.seti.org/cassini/uvis/1-UVIS_Users_Guide_-2018-Jan%2015-For%20PDS-REV-2018-07-06.pdf")
     local_path = storage_root / "uvis_user_guide.pdf"